@@ -1,14 +1,43 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Optional
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from src.models.game_state import PlayerAction, GameResponse, Language
+from src.models.game_state import PlayerAction, BatchActionRequest, GameResponse, Language
 from src.game_controller import GameController
+from src.utils.metrics import metrics
+from src.utils.profiling import profiler, ProfilingMiddleware, ProfileWindowBusy, PROFILE_MODES
+from src.utils.usage import usage_tracker, UsageMiddleware
 
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="Dungeon Quest API", version="1.0.0")
+# Built in the lifespan so importing this module stays cheap; Chroma and OpenAI
+# clients are opened in the background and reported through /ready
+game_controller: Optional[GameController] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global game_controller
+
+    game_controller = GameController()
+    # Games in flight before a crash or restart come back before any request is served
+    await game_controller.recover_games()
+    game_controller.start_background_tasks()
+    backends_task = asyncio.create_task(game_controller.initialize_backends())
+    try:
+        yield
+    finally:
+        backends_task.cancel()
+        await game_controller.shutdown()
+
+
+app = FastAPI(title="Dungeon Quest API", version="1.0.0", lifespan=lifespan)
 
 # Enable CORS for frontend integration
 app.add_middleware(
@@ -17,18 +46,39 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Profile-Id", "X-Profile-Scope"],
 )
 
-game_controller = GameController()
+# Opt-in per-request profiling (PROFILING_ENABLED=true, then X-Profile: phases|sample; sample is loop-wide)
+app.add_middleware(ProfilingMiddleware, profiler=profiler)
+
+# Attributes prompt, completion and embedding tokens to the endpoint that spent them
+app.add_middleware(UsageMiddleware)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to Dungeon Quest API"}
 
 
+@app.get("/ready")
+async def ready():
+    is_ready = game_controller is not None and game_controller.is_ready()
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={
+            "ready": is_ready,
+            "backends": game_controller.backends if game_controller else {},
+            "warmup": game_controller.warmup_service.report() if game_controller else {},
+            # Open breakers mean degraded play (no RAG or fallback narration), not unreadiness
+            "breakers": game_controller.get_breakers() if game_controller else {}
+        }
+    )
+
+
 @app.post("/game/new")
 async def create_game(player_name: str = "Adventurer", language: Language = Language.ZH_TW):
     game_id = game_controller.create_new_game(player_name, language)
@@ -51,6 +101,24 @@ async def perform_action(action_data: PlayerAction):
     return response
 
 
+@app.post("/game/actions/batch")
+async def perform_actions_batch(batch: BatchActionRequest):
+    async def generate():
+        async for result in game_controller.process_actions_batch(
+            [(action.game_id, action.action) for action in batch.actions],
+            concurrency=batch.concurrency
+        ):
+            response = result["response"]
+            yield json.dumps({
+                "index": result["index"],
+                "game_id": result["game_id"],
+                "response": response.model_dump(mode="json") if response else None,
+                "error": result["error"]
+            }, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @app.get("/game/{game_id}/status")
 async def get_game_status(game_id: str):
     game_state = game_controller.get_game(game_id)
@@ -59,14 +127,74 @@ async def get_game_status(game_id: str):
 
     return {
         "game_id": game_id,
-        "player": game_state.player,
+        "player": game_state.player.to_model(),
         "status": game_state.status,
         "turn_count": game_state.turn_count,
         "current_scene": game_state.current_scene,
-        "language": game_state.language
+        "language": game_state.language,
+        "usage": usage_tracker.get_game_usage(game_id)
     }
 
 
+@app.get("/metrics")
+async def get_metrics():
+    return {**metrics.snapshot(), "usage": usage_tracker.snapshot()}
+
+
+@app.get("/admin/stats")
+async def get_knowledge_stats():
+    return game_controller.game_service.vector_service.get_knowledge_stats()
+
+
+@app.get("/admin/knowledge/export")
+async def export_knowledge(content_type: Optional[str] = None, page_size: int = Query(500, ge=1, le=5000)):
+    pages = game_controller.game_service.vector_service.iter_records(content_type, page_size)
+
+    # The first page is read before streaming so an unavailable store still gets a proper status
+    try:
+        first_page = await asyncio.get_running_loop().run_in_executor(None, next, pages, [])
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Knowledge export failed: {e}")
+
+    def generate():
+        page = first_page
+        try:
+            while page:
+                for record in page:
+                    yield json.dumps(record.to_dict(), ensure_ascii=False) + "\n"
+                page = next(pages, [])
+        except Exception as e:
+            # Headers are already sent; a trailing error line marks the export as incomplete
+            yield json.dumps({"error": f"Knowledge export failed: {e}"}) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@app.get("/admin/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(profile_id: str):
+    collapsed = profiler.get_profile(profile_id)
+    if collapsed is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return collapsed
+
+
+@app.post("/admin/profile", response_class=PlainTextResponse)
+async def profile_window(seconds: float = 5.0, mode: str = "sample"):
+    if not profiler.enabled:
+        raise HTTPException(status_code=403, detail="Profiling is disabled")
+    if mode not in PROFILE_MODES:
+        raise HTTPException(status_code=400, detail=f"Unknown profile mode: {mode}")
+    try:
+        return await profiler.profile_window(min(seconds, 60.0), mode)
+    except ProfileWindowBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@app.post("/admin/retention/run")
+async def run_retention():
+    return await game_controller.run_retention()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .monsters import SAMPLE_MONSTERS
+from .items import SAMPLE_ITEMS
+
+__all__ = [
+    'SAMPLE_MONSTERS',
+    'SAMPLE_ITEMS'
+]
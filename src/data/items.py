@@ -0,0 +1,135 @@
+SAMPLE_ITEMS = {
+    # Consumables
+    "healing_potion": {
+        "name": "Healing Potion",
+        "description": "A glowing red liquid in a crystal vial. When consumed, it instantly restores health through magical regeneration. The potion tastes of mint and honey.",
+        "type": "consumable",
+        "effects": "Restores 50 HP instantly",
+        "value": 25,
+        "rarity": "common"
+    },
+    "mana_potion": {
+        "name": "Mana Potion",
+        "description": "A shimmering blue elixir that sparkles with arcane energy. Drinking it restores magical power and clarity of mind.",
+        "type": "consumable",
+        "effects": "Restores 30 MP instantly",
+        "value": 30,
+        "rarity": "common"
+    },
+    "strength_elixir": {
+        "name": "Elixir of Strength",
+        "description": "A thick, golden potion that enhances physical prowess. The drinker feels their muscles surge with temporary power.",
+        "type": "consumable",
+        "effects": "Increases attack by 15 for 5 turns",
+        "value": 75,
+        "rarity": "uncommon"
+    },
+    "phoenix_feather": {
+        "name": "Phoenix Feather",
+        "description": "A radiant feather from the legendary phoenix. It glows with the power of rebirth and can bring the dead back to life.",
+        "type": "consumable",
+        "effects": "Fully revives and heals to maximum HP",
+        "value": 500,
+        "rarity": "legendary"
+    },
+
+    # Weapons
+    "rusty_sword": {
+        "name": "Rusty Sword",
+        "description": "An old, weathered blade showing signs of age and neglect. Despite its appearance, it still holds an edge.",
+        "type": "weapon",
+        "effects": "Increases attack by 5",
+        "value": 10,
+        "rarity": "common"
+    },
+    "fire_sword": {
+        "name": "Flaming Sword",
+        "description": "An enchanted blade wreathed in eternal flames. The fire never dies and burns hotter in battle. Forged by ancient fire mages in the volcanic depths.",
+        "type": "weapon",
+        "effects": "Increases attack by 30, adds fire damage",
+        "value": 500,
+        "rarity": "rare",
+        "requirements": "Level 10+"
+    },
+    "ice_staff": {
+        "name": "Staff of Eternal Ice",
+        "description": "A crystalline staff that never melts, no matter how hot the environment. It channels the power of endless winter.",
+        "type": "weapon",
+        "effects": "Increases magic attack by 35, adds ice damage",
+        "value": 600,
+        "rarity": "rare",
+        "requirements": "Intelligence 20+"
+    },
+    "dragon_slayer": {
+        "name": "Dragon Slayer",
+        "description": "A legendary sword forged from meteorite metal and dragon bone. Its blade can cut through the thickest dragon scales.",
+        "type": "weapon",
+        "effects": "Increases attack by 50, +100% damage vs dragons",
+        "value": 2000,
+        "rarity": "legendary",
+        "requirements": "Level 25+, Strength 30+"
+    },
+
+    # Armor
+    "leather_armor": {
+        "name": "Leather Armor",
+        "description": "Basic protection made from tanned animal hide. Lightweight and flexible, perfect for beginners.",
+        "type": "armor",
+        "effects": "Increases defense by 8",
+        "value": 50,
+        "rarity": "common"
+    },
+    "shadow_cloak": {
+        "name": "Cloak of Shadows",
+        "description": "A dark cloak that seems to absorb light around it. When worn, the wearer becomes one with the shadows, gaining the ability to move unseen.",
+        "type": "armor",
+        "effects": "Increases stealth by 25, reduces enemy accuracy by 15%",
+        "value": 300,
+        "rarity": "uncommon",
+        "requirements": "Agility 15+"
+    },
+    "plate_mail": {
+        "name": "Steel Plate Mail",
+        "description": "Heavy armor crafted from reinforced steel plates. Provides excellent protection but limits mobility.",
+        "type": "armor",
+        "effects": "Increases defense by 25, reduces speed by 10",
+        "value": 400,
+        "rarity": "uncommon",
+        "requirements": "Strength 18+"
+    },
+    "dragon_scale_armor": {
+        "name": "Dragon Scale Armor",
+        "description": "Armor crafted from the impenetrable scales of an ancient dragon. It provides unmatched protection and resistance to magical attacks.",
+        "type": "armor",
+        "effects": "Increases defense by 40, magic resistance +30%",
+        "value": 1500,
+        "rarity": "legendary",
+        "requirements": "Level 20+, Constitution 25+"
+    },
+
+    # Accessories
+    "ring_of_power": {
+        "name": "Ring of Power",
+        "description": "A simple gold band that radiates with inner energy. It enhances the wearer's natural abilities.",
+        "type": "accessory",
+        "effects": "Increases all stats by 5",
+        "value": 200,
+        "rarity": "uncommon"
+    },
+    "amulet_of_health": {
+        "name": "Amulet of Health",
+        "description": "A jade pendant carved with ancient healing runes. It continuously mends minor wounds and boosts vitality.",
+        "type": "accessory",
+        "effects": "Increases max HP by 50, HP regeneration +2 per turn",
+        "value": 350,
+        "rarity": "rare"
+    },
+    "boots_of_speed": {
+        "name": "Boots of Speed",
+        "description": "Enchanted boots that make the wearer swift as the wind. They leave no tracks and make no sound.",
+        "type": "accessory",
+        "effects": "Increases speed by 20, grants double movement",
+        "value": 280,
+        "rarity": "rare"
+    }
+}
@@ -0,0 +1,97 @@
+SAMPLE_MONSTERS = {
+    # Boss Level
+    "fire_dragon": {
+        "name": "Fire Dragon",
+        "description": "A massive red dragon that breathes scorching flames. Its scales shimmer like molten lava and its eyes burn with ancient fury. Known to hoard treasure in volcanic caves. This legendary beast can incinerate entire armies with a single breath.",
+        "stats": {"hp": 500, "attack": 85, "defense": 60, "speed": 40},
+        "abilities": ["Fire Breath", "Wing Attack", "Tail Swipe", "Intimidate"],
+        "type": "boss",
+        "element": "fire",
+        "loot": ["Dragon Scale", "Fire Gem", "Ancient Coin"]
+    },
+    "ice_queen": {
+        "name": "Ice Queen",
+        "description": "An ancient sorceress trapped in eternal ice. Her beauty is matched only by her cruelty. She commands blizzards and can freeze enemies solid with a glance.",
+        "stats": {"hp": 450, "attack": 70, "defense": 80, "speed": 30},
+        "abilities": ["Blizzard", "Ice Prison", "Frost Nova", "Frozen Heart"],
+        "type": "boss",
+        "element": "ice",
+        "loot": ["Ice Crown", "Frozen Tear", "Eternal Crystal"]
+    },
+
+    # Elite Level
+    "shadow_wolf": {
+        "name": "Shadow Wolf",
+        "description": "A ghostly wolf that emerges from darkness. Its form flickers between solid and ethereal, making it difficult to target. Hunts in packs during moonless nights.",
+        "stats": {"hp": 120, "attack": 45, "defense": 25, "speed": 70},
+        "abilities": ["Shadow Strike", "Phase Step", "Howl"],
+        "type": "elite",
+        "element": "dark",
+        "loot": ["Shadow Essence", "Wolf Fang"]
+    },
+    "stone_golem": {
+        "name": "Stone Golem",
+        "description": "A massive construct of ancient stone and magic. Its rocky hide deflects most attacks, and its fists can crush bones to powder. Created by forgotten wizards to guard sacred places.",
+        "stats": {"hp": 200, "attack": 60, "defense": 80, "speed": 20},
+        "abilities": ["Rock Slam", "Stone Skin", "Earthquake"],
+        "type": "elite",
+        "element": "earth",
+        "loot": ["Stone Core", "Magic Rune", "Heavy Boulder"]
+    },
+    "lightning_eagle": {
+        "name": "Lightning Eagle",
+        "description": "A majestic bird wreathed in crackling electricity. Its piercing cry can summon thunderstorms, and its talons deliver shocking strikes.",
+        "stats": {"hp": 100, "attack": 55, "defense": 30, "speed": 90},
+        "abilities": ["Lightning Strike", "Thunder Call", "Wind Slash"],
+        "type": "elite",
+        "element": "lightning",
+        "loot": ["Storm Feather", "Lightning Gem", "Wind Crystal"]
+    },
+
+    # Common Level
+    "goblin_warrior": {
+        "name": "Goblin Warrior",
+        "description": "A small but fierce green-skinned humanoid wielding crude weapons. Despite their size, goblins are cunning fighters who use numbers and dirty tactics to their advantage.",
+        "stats": {"hp": 60, "attack": 25, "defense": 15, "speed": 55},
+        "abilities": ["Backstab", "Throw Rock", "Battle Cry"],
+        "type": "common",
+        "element": "none",
+        "loot": ["Rusty Dagger", "Goblin Ear", "Small Coin"]
+    },
+    "skeleton_warrior": {
+        "name": "Skeleton Warrior",
+        "description": "The reanimated bones of a fallen soldier. These undead guardians fight with the muscle memory of their past lives, wielding ancient weapons with deadly precision.",
+        "stats": {"hp": 80, "attack": 30, "defense": 20, "speed": 35},
+        "abilities": ["Bone Strike", "Rattle", "Death Grip"],
+        "type": "common",
+        "element": "undead",
+        "loot": ["Bone Fragment", "Rusty Armor", "Ancient Coin"]
+    },
+    "cave_spider": {
+        "name": "Cave Spider",
+        "description": "A venomous arachnid the size of a large dog. Its bite injects paralytic poison, and it can web enemies to immobilize them before striking.",
+        "stats": {"hp": 40, "attack": 35, "defense": 10, "speed": 65},
+        "abilities": ["Poison Bite", "Web Trap", "Leap Attack"],
+        "type": "common",
+        "element": "poison",
+        "loot": ["Spider Silk", "Poison Gland", "Spider Leg"]
+    },
+    "orc_brute": {
+        "name": "Orc Brute",
+        "description": "A hulking green-skinned humanoid with immense physical strength. Orcs are savage warriors who prefer brute force over strategy.",
+        "stats": {"hp": 100, "attack": 40, "defense": 25, "speed": 30},
+        "abilities": ["Brutal Swing", "Rage", "Intimidate"],
+        "type": "common",
+        "element": "none",
+        "loot": ["Orc Tooth", "Iron Club", "Leather Hide"]
+    },
+    "fire_imp": {
+        "name": "Fire Imp",
+        "description": "A mischievous demonic creature wreathed in flames. Small but agile, it delights in burning everything it touches.",
+        "stats": {"hp": 50, "attack": 30, "defense": 15, "speed": 70},
+        "abilities": ["Fireball", "Flame Dash", "Burn"],
+        "type": "common",
+        "element": "fire",
+        "loot": ["Imp Horn", "Fire Essence", "Sulfur"]
+    }
+}
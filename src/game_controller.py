@@ -1,28 +1,53 @@
+import asyncio
+import os
+import time
 import uuid
-from typing import Dict, Optional
-from .models.game_state import GameState, Player, GameStatus, GameResponse, Language
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+from .models.game_session import GameSession, PlayerSession
+from .models.game_state import GameState, GameStatus, GameResponse, Language
 from .services.game_service import GameService
+from .services.retention_service import RetentionService
+from .services.session_recorder import SessionRecorder
+from .services.turn_journal import TurnJournal
+from .services.warmup_service import WarmupService
 from .utils.logger import setup_logger
+from .utils.metrics import metrics
+from .utils.profiling import phase
+from .utils.tracing import tracer
+from .utils.usage import usage_scope, usage_tracker
 
 
 class GameController:
     def __init__(self):
-        self.games: Dict[str, GameState] = {}
+        self.games: Dict[str, GameSession] = {}
         self.game_service = GameService()
+        self.retention_service = RetentionService(self.game_service.vector_service)
+        self.max_turns = int(os.getenv("GAME_MAX_TURNS", "10"))
+        self.batch_concurrency = int(os.getenv("BATCH_MAX_CONCURRENCY", "8"))
+        self.recorder = SessionRecorder()
+        self.journal = TurnJournal()
+        self.warmup_service = WarmupService(self.game_service)
+        self.backends: Dict[str, str] = {"chroma": "pending", "embeddings": "pending", "llm": "pending"}
+        self._store_tasks: Set[asyncio.Task] = set()
         self.logger = setup_logger(__name__)
 
-    def create_new_game(self, player_name: str = "Adventurer", language: Language = Language.EN) -> str:
-        game_id = str(uuid.uuid4())
-        game_state = GameState(
-            game_id=game_id,
-            player=Player(name=player_name),
-            language=language
-        )
+        # Clients are created lazily, so the recorder wraps them as they come up
+        if self.recorder.is_enabled():
+            self.game_service.llm_service.client_wrapper = self.recorder.wrap_client
+            self.game_service.vector_service.embedding_model.client_wrapper = self.recorder.wrap_client
+
+    def create_new_game(self, player_name: str = "Adventurer", language: Language = Language.EN,
+                        game_id: Optional[str] = None) -> str:
+        game_id = game_id or str(uuid.uuid4())
+        game_state = GameSession(game_id, PlayerSession(name=player_name), language=language)
         self.games[game_id] = game_state
+        self.recorder.record_game(game_state)
+        self.journal.record_game(game_state)
         self.logger.info(f"Created new game {game_id} for player {player_name} in {language}")
         return game_id
 
-    def get_game(self, game_id: str) -> Optional[GameState]:
+    def get_game(self, game_id: str) -> Optional[GameSession]:
         return self.games.get(game_id)
 
     async def process_action(self, game_id: str, action: str) -> Optional[GameResponse]:
@@ -30,35 +55,196 @@ class GameController:
         if not game_state or game_state.status != GameStatus.ACTIVE:
             return None
 
-        game_event = await self.game_service.process_player_action(game_state, action)
+        with tracer.span("GameController.process_action", game_id=game_id,
+                         turn=game_state.turn_count + 1, language=game_state.language.value) as span, \
+                phase("process_action"), self.recorder.record_turn(game_id, action) as frame, \
+                usage_scope(game_id=game_id, language=game_state.language.value):
+            game_event = await self.game_service.process_player_action(game_state, action)
+            with phase("apply_effects"):
+                response = self._complete_turn(game_state, action, game_event)
+            self.recorder.finish_turn(frame, game_event, game_state)
+            span.set_attributes(game_status=game_state.status.value, player_hp=game_state.player.hp)
 
+        return response
+
+    def _complete_turn(self, game_state: GameSession, action: str, game_event: Dict) -> GameResponse:
+        game_id = game_state.game_id
         self.apply_game_effects(game_state, game_event)
 
         narrative = game_event.get("narrative", "Something happened...")
 
-        game_state.story_history.append(f"Player: {action}")
-        game_state.story_history.append(f"Game: {narrative}")
+        self.game_service.story_memory.record_turn(game_state, action, narrative)
+        self._journal_turn(game_state, action, game_event)
 
         available_actions = game_event.get("suggested_actions", self.get_suggested_actions(game_state))
 
         return GameResponse(
             game_id=game_id,
             narrative=narrative,
-            player_state=game_state.player,
+            player_state=game_state.player.to_model(),
             available_actions=available_actions,
             game_status=game_state.status
         )
 
-    def apply_game_effects(self, game_state: GameState, game_event: Dict):
+    def _journal_turn(self, game_state: GameSession, action: str, game_event: Dict):
+        if not self.journal.is_enabled():
+            return
+
+        self.journal.record_turn(game_state.game_id, action, game_event)
+        if self.journal.should_snapshot(game_state, game_event.get("turn", 0)):
+            self.journal.record_snapshot(game_state, {
+                "m": self.game_service.story_memory.export(game_state.game_id),
+                "p": game_state.last_event
+            })
+
+    async def recover_games(self):
+        # Reading and replaying the journal is blocking work, kept off the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._recover_games)
+        # In llm summary mode, turns evicted during replay were left pending for the loop
+        self.game_service.story_memory.resume()
+
+    def _recover_games(self):
+        # Games are replayed one after another in a single executor thread. Replay is pure
+        # Python, so under the GIL threads only add overhead: 5,000 games of 9 turns took
+        # 171ms serially and 210-230ms across 4-8 threads.
+        start = time.perf_counter()
+        journaled = self.journal.recover()
+        for game_id, records in journaled.items():
+            try:
+                self.games[game_id] = self._replay_game(game_id, records)
+            except Exception as e:
+                self.logger.error(f"Failed to recover game {game_id} from the turn journal: {e}")
+
+        if journaled:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            metrics.set_gauge("journal.recovered_games", len(self.games))
+            metrics.observe("journal.recovery_ms", elapsed_ms)
+            self.logger.info(f"Recovered {len(self.games)} games from the turn journal in {elapsed_ms:.1f}ms")
+
+    def _replay_game(self, game_id: str, records: List[Dict[str, Any]]) -> GameSession:
+        """Rebuild one game from its latest snapshot (or creation record) and the turns after it"""
+        head = records[0]
+        if head["k"] == "s":
+            game_state = GameSession.from_model(GameState.model_validate(head["st"]))
+            self.game_service.story_memory.restore(game_id, head.get("m", {}))
+            if head.get("p"):
+                game_state.last_event = tuple(head["p"])
+        else:
+            game_state = GameSession(game_id, PlayerSession(name=head["n"]), language=Language(head["l"]))
+
+        for record in records[1:]:
+            finished_at = game_state.finished_at
+            self.apply_game_effects(game_state, {"turn": record["turn"], "effects": record["fx"]})
+            if finished_at is None and game_state.finished_at is not None:
+                # Retention ages finished games from when they ended, not from the restart
+                game_state.finished_at = datetime.utcfromtimestamp(record["ts"])
+
+            self.game_service.story_memory.record_turn(game_state, record["a"], record["n"])
+            if record["turn"]:
+                game_state.last_event = (record["turn"], record["n"])
+
+        return game_state
+
+    async def process_actions_batch(self, actions: List[Tuple[str, str]],
+                                    concurrency: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(concurrency or self.batch_concurrency)
+
+        # Actions for the same game must run in order, so the batch is split into waves
+        # holding at most one action per game; waves run back to back.
+        waves: List[List[Tuple[int, str, str]]] = []
+        game_wave_index: Dict[str, int] = {}
+        for index, (game_id, action) in enumerate(actions):
+            wave_index = game_wave_index.get(game_id, 0)
+            game_wave_index[game_id] = wave_index + 1
+            if wave_index == len(waves):
+                waves.append([])
+            waves[wave_index].append((index, game_id, action))
+
+        for wave in waves:
+            runnable = []
+            for index, game_id, action in wave:
+                game_state = self.get_game(game_id)
+                if not game_state or game_state.status != GameStatus.ACTIVE:
+                    yield {"index": index, "game_id": game_id, "response": None,
+                           "error": "Game not found or inactive"}
+                else:
+                    runnable.append((index, game_state, action))
+
+            if not runnable:
+                continue
+
+            # Batched embedding calls serve several games, so they are attributed by phase only
+            with usage_scope(phase="rag_search"):
+                relevant_events = await self.game_service.search_relevant_events_batch(
+                    [(game_state, action) for _, game_state, action in runnable]
+                )
+
+            # Entries of completed turns; they are stored even if the batch is abandoned midway
+            entries: List[Dict[str, Any]] = []
+
+            async def run_turn(index: int, game_state: GameSession, action: str, events: list):
+                try:
+                    with tracer.span("GameController.process_batch_turn", game_id=game_state.game_id,
+                                     turn=game_state.turn_count + 1, batch_size=len(runnable)), \
+                            self.recorder.record_turn(game_state.game_id, action) as frame, \
+                            usage_scope(game_id=game_state.game_id, language=game_state.language.value):
+                        async with semaphore:
+                            game_event = await self.game_service.process_player_action(
+                                game_state, action, relevant_events=events, store_event=False
+                            )
+                        # Built before effects are applied, matching the single-turn storage path
+                        entry = self.game_service.build_event_entry(game_state, game_event)
+                        response = self._complete_turn(game_state, action, game_event)
+                        entries.append(entry)
+                        self.recorder.finish_turn(frame, game_event, game_state)
+                    return {"index": index, "game_id": game_state.game_id, "response": response, "error": None}
+
+                except Exception as e:
+                    # One failing game must not take down the other games' turns
+                    metrics.increment("batch.turn_errors")
+                    self.logger.error(f"Batch turn {index} for game {game_state.game_id} failed: {e}")
+                    return {"index": index, "game_id": game_state.game_id, "response": None, "error": str(e)}
+
+            tasks = [
+                asyncio.create_task(run_turn(index, game_state, action, events))
+                for (index, game_state, action), events in zip(runnable, relevant_events)
+            ]
+
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await self._store_batch_entries(entries)
+
+    async def _store_batch_entries(self, entries: List[Dict[str, Any]]):
+        if not entries:
+            return
+
+        async def store():
+            with usage_scope(phase="rag_store"):
+                await self.game_service.store_events_batch(entries)
+
+        # Shielded so a client disconnect cancelling the stream does not drop turns that were
+        # already applied and journaled; the reference keeps the task alive until it finishes
+        task = asyncio.create_task(store())
+        self._store_tasks.add(task)
+        task.add_done_callback(self._store_tasks.discard)
+        await asyncio.shield(task)
+
+    def apply_game_effects(self, game_state: GameSession, game_event: Dict):
         effects = game_event.get("effects", {})
         turn = game_event.get("turn", 0)
 
         if turn > 0:
             game_state.turn_count = turn
 
-        # End game at turn 10
-        if game_state.turn_count >= 10:
+        # End game at the final turn
+        if game_state.turn_count >= self.max_turns:
             game_state.status = GameStatus.COMPLETED
+            game_state.finished_at = game_state.finished_at or datetime.utcnow()
 
         hp_change = effects.get("player_hp_change", 0)
         if hp_change != 0:
@@ -68,6 +254,7 @@ class GameController:
             ))
             if game_state.player.hp == 0:
                 game_state.status = GameStatus.GAME_OVER
+                game_state.finished_at = game_state.finished_at or datetime.utcnow()
 
         exp_gain = effects.get("player_exp_gain", 0)
         if exp_gain > 0:
@@ -79,10 +266,71 @@ class GameController:
                 self.logger.info(f"Player leveled up to {game_state.player.level}")
 
         item_gain = effects.get("item_gain")
-        if item_gain and item_gain not in game_state.player.inventory:
-            game_state.player.inventory.append(item_gain)
+        if item_gain:
+            game_state.player.add_item(item_gain)
+
+    async def run_retention(self) -> Dict[str, Any]:
+        expired_games = await self.retention_service.select_expired(self.games)
+        report = await self.retention_service.purge_games(expired_games)
+
+        # Failed purges stay in memory and are retried on the next run
+        for game_id in report["game_ids"]:
+            self.games.pop(game_id, None)
+            self.game_service.story_memory.forget(game_id)
+            self.game_service.intent_router.forget(game_id)
+            self.game_service.event_deduplicator.forget(game_id)
+            self.game_service.vector_service.lexical_index.forget(game_id)
+            usage_tracker.forget(game_id)
+            self.journal.record_end(game_id)
+
+        return report
+
+    def start_background_tasks(self):
+        self.retention_service.start(self.run_retention)
+
+    async def initialize_backends(self):
+        # Opening Chroma and importing the clients is blocking work, kept off the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._initialize_backends)
+        await self.warmup_service.run()
+
+    def _initialize_backends(self):
+        vector_service = self.game_service.vector_service
+
+        try:
+            vector_service.database_model.get_collection()
+            vector_service.rebuild_lexical_index()
+            self.backends["chroma"] = "ready"
+        except Exception as e:
+            self.logger.error(f"ChromaDB backend failed to initialize: {e}")
+            self.backends["chroma"] = "failed"
+
+        # Without an API key there is no embedding client; gameplay still works without RAG
+        self.backends["embeddings"] = "ready" if vector_service.embedding_model.client else "unavailable"
+        self.backends["llm"] = "ready" if self.game_service.llm_service.client else "failed"
+
+        self.logger.info(f"Backends initialized: {self.backends}")
+
+    def get_breakers(self) -> Dict[str, Any]:
+        return {
+            "embeddings": self.game_service.vector_service.embedding_model.breaker.to_dict(),
+            "llm": self.game_service.llm_service.breaker.to_dict()
+        }
+
+    def is_ready(self) -> bool:
+        return (self.backends["chroma"] == "ready"
+                and "pending" not in self.backends.values()
+                and self.warmup_service.is_finished())
+
+    async def shutdown(self):
+        await self.retention_service.stop()
+        if self._store_tasks:
+            await asyncio.gather(*self._store_tasks, return_exceptions=True)
+        self.journal.close()
+        self.recorder.close()
+        tracer.shutdown()
 
-    def get_suggested_actions(self, game_state: GameState) -> list:
+    def get_suggested_actions(self, game_state: GameSession) -> list:
         if game_state.player.hp <= 20:
             return ["rest", "use healing item", "explore carefully"]
         elif game_state.player.level < 3:
@@ -10,7 +10,7 @@ FALLBACK_EVENTS = {
         "suggested_actions": ["attack skeleton", "flee", "prepare for battle"]
     },
     "rest": {
-        "narrative": "You sit down to rest, but suddenly hear growling nearby. An orc has spotted you!",
+        "narrative": "You rest and recover {hp_gain} HP before a growl nearby cuts it short. An orc has spotted you!",
         "effects": {"player_hp_change": 10, "player_exp_gain": 0, "item_gain": None},
         "suggested_actions": ["fight the orc", "try to hide", "negotiate"]
     }
@@ -28,4 +28,52 @@ SUGGESTED_ACTIONS_BY_SITUATION = {
     "low_hp": ["rest", "use healing item", "explore carefully"],
     "low_level": ["explore", "attack monster", "search for items"],
     "high_level": ["explore deeper", "face boss", "use special ability"]
-}
\ No newline at end of file
+}
+
+# Extra words that pick a FALLBACK_EVENTS entry; the entry's own key always matches too
+FALLBACK_KEYWORDS = {
+    "attack": ["fight", "strike", "slash"],
+    "explore": ["search", "investigate", "look"],
+    "rest": ["sleep", "heal", "recover"]
+}
+
+# Cheap intents answered locally by the intent router, without an LLM call
+INTENT_KEYWORDS = {
+    "inventory": ["inventory", "check bag", "check pack", "check items", "my items", "backpack"],
+    "status": ["status", "check hp", "check health", "my health", "my stats", "check stats"],
+    "look": ["look around", "look about", "survey surroundings", "observe surroundings"],
+    "rest": ["rest", "take a break", "sleep", "catch my breath"]
+}
+
+EMPTY_INVENTORY = "nothing but dust and lint"
+
+INTENT_RESPONSES = {
+    "inventory": {
+        "narratives": [
+            "You rummage through your pack: {inventory}.",
+            "You take stock of your belongings: {inventory}."
+        ],
+        "suggested_actions": ["explore", "attack monster", "rest"]
+    },
+    "status": {
+        "narratives": [
+            "{name} checks their wounds: HP {hp}/{max_hp}, level {level}, {experience} EXP.",
+            "You steady your breathing and assess yourself: HP {hp}/{max_hp}, level {level}, {experience} EXP."
+        ],
+        "suggested_actions": ["explore", "rest", "search for items"]
+    },
+    "look": {
+        "narratives": [
+            "Torchlight flickers across damp stone walls. Distant dripping echoes through the corridors ahead.",
+            "You scan the chamber. Old claw marks scar the floor, and a cold draft drifts from a passage to the north."
+        ],
+        "suggested_actions": ["explore the passage", "search for items", "prepare for battle"]
+    },
+    "rest": {
+        "narratives": [
+            "You find a quiet alcove and rest for a while, recovering {hp_gain} HP.",
+            "You sit with your back to the wall and catch your breath, recovering {hp_gain} HP."
+        ],
+        "suggested_actions": ["explore", "search for items", "prepare for battle"]
+    }
+}
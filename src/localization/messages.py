@@ -30,4 +30,20 @@ class Messages:
 
     @classmethod
     def get_default_suggested_actions(cls, language: Language) -> list:
-        return cls._get_module(language).DEFAULT_SUGGESTED_ACTIONS
\ No newline at end of file
+        return cls._get_module(language).DEFAULT_SUGGESTED_ACTIONS
+
+    @classmethod
+    def get_fallback_keywords(cls, language: Language) -> Dict[str, list]:
+        return cls._get_module(language).FALLBACK_KEYWORDS
+
+    @classmethod
+    def get_intent_keywords(cls, language: Language) -> Dict[str, list]:
+        return cls._get_module(language).INTENT_KEYWORDS
+
+    @classmethod
+    def get_intent_responses(cls, language: Language) -> Dict[str, Any]:
+        return cls._get_module(language).INTENT_RESPONSES
+
+    @classmethod
+    def get_empty_inventory(cls, language: Language) -> str:
+        return cls._get_module(language).EMPTY_INVENTORY
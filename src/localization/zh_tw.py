@@ -10,7 +10,7 @@ FALLBACK_EVENTS = {
         "suggested_actions": ["攻擊骷髏", "逃跑", "準備戰鬥"]
     },
     "rest": {
-        "narrative": "你坐下休息，但突然聽到附近的咆哮聲。一個獸人發現了你！",
+        "narrative": "你坐下休息，恢復了 {hp_gain} 點生命值，但突然聽到附近的咆哮聲。一個獸人發現了你！",
         "effects": {"player_hp_change": 10, "player_exp_gain": 0, "item_gain": None},
         "suggested_actions": ["與獸人戰鬥", "嘗試躲藏", "嘗試談判"]
     }
@@ -22,4 +22,53 @@ DEFAULT_SUGGESTED_ACTIONS = ["調查威脅", "準備戰鬥", "搜尋敵人"]
 
 LANGUAGE_INSTRUCTION = "in Traditional Chinese"
 
-CONTEXT_NO_EVENTS = "無相關歷史事件"
\ No newline at end of file
+CONTEXT_NO_EVENTS = "無相關歷史事件"
+
+# Extra words that pick a FALLBACK_EVENTS entry; the entry's own key always matches too.
+# CJK words match anywhere in the action, so single characters (打 in 打開) are not used
+FALLBACK_KEYWORDS = {
+    "attack": ["攻擊", "戰鬥", "打鬥", "攻打", "砍殺"],
+    "explore": ["探索", "搜索", "搜尋", "調查"],
+    "rest": ["休息", "睡覺", "恢復體力"]
+}
+
+# Cheap intents answered locally by the intent router, without an LLM call
+INTENT_KEYWORDS = {
+    "inventory": ["背包", "查看背包", "打開背包", "物品欄", "查看物品", "道具欄"],
+    "status": ["狀態", "查看狀態", "查看生命", "血量", "查看能力"],
+    "look": ["環顧", "四處看看", "觀察四周", "看看周圍"],
+    "rest": ["休息", "睡覺", "喘口氣"]
+}
+
+EMPTY_INVENTORY = "空空如也"
+
+INTENT_RESPONSES = {
+    "inventory": {
+        "narratives": [
+            "你翻了翻背包：{inventory}。",
+            "你清點身上的物品：{inventory}。"
+        ],
+        "suggested_actions": ["探索", "攻擊怪物", "休息"]
+    },
+    "status": {
+        "narratives": [
+            "{name}檢查自己的傷勢：生命 {hp}/{max_hp}，等級 {level}，經驗 {experience}。",
+            "你調整呼吸，評估自身狀況：生命 {hp}/{max_hp}，等級 {level}，經驗 {experience}。"
+        ],
+        "suggested_actions": ["探索", "休息", "搜尋物品"]
+    },
+    "look": {
+        "narratives": [
+            "火光在潮濕的石牆上搖曳，遠處的滴水聲在走廊間迴盪。",
+            "你環顧房間。地上滿是古老的爪痕，一股冷風從北方的通道吹來。"
+        ],
+        "suggested_actions": ["探索通道", "搜尋物品", "準備戰鬥"]
+    },
+    "rest": {
+        "narratives": [
+            "你找到一處安靜的角落休息片刻，恢復了 {hp_gain} 點生命。",
+            "你背靠石牆喘口氣，恢復了 {hp_gain} 點生命。"
+        ],
+        "suggested_actions": ["探索", "搜尋物品", "準備戰鬥"]
+    }
+}
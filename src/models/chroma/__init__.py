@@ -1,13 +1,19 @@
 from .knowledge_base import KnowledgeBase
+from .knowledge_record import KnowledgeRecord
 from .database_model import DatabaseModel
 from .embedding_model import EmbeddingModel
+from .lexical_index import LexicalIndex
 from .search_model import SearchModel
 from .knowledge_model import KnowledgeModel
+from .stats_model import StatsModel
 
 __all__ = [
     'KnowledgeBase',
+    'KnowledgeRecord',
     'DatabaseModel',
     'EmbeddingModel',
+    'LexicalIndex',
     'SearchModel',
-    'KnowledgeModel'
+    'KnowledgeModel',
+    'StatsModel'
 ]
\ No newline at end of file
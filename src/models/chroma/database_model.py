@@ -1,34 +1,60 @@
 import os
-from typing import Optional
-import chromadb
-from chromadb.config import Settings
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 from ...utils.logger import setup_logger
+from ...utils.metrics import metrics
+
+if TYPE_CHECKING:
+    import chromadb
 
 
 class DatabaseModel:
     def __init__(self):
         self.logger = setup_logger(__name__)
-        self.client: Optional[chromadb.Client] = None
-        self.collection_name = "knowledge_base"
-        self._initialize_client()
+        self._client: Optional["chromadb.ClientAPI"] = None
+        self._client_lock = threading.Lock()
+        self.collection_name = os.getenv("CHROMA_COLLECTION_NAME", "knowledge_base")
+        # Embedding profile stamped on new collections so a width change is caught early
+        self.collection_metadata: Dict[str, Any] = {}
+        self.persist_directory = os.getenv("CHROMA_PERSIST_DIRECTORY", "./chroma_db")
+        self.health_check_interval = float(os.getenv("CHROMA_COLLECTION_HEALTH_INTERVAL", "30"))
+        self.vacuum_timeout = float(os.getenv("CHROMA_VACUUM_TIMEOUT_SECONDS", "30"))
+        self._collections: Dict[str, Tuple[Any, float]] = {}
+        self._collections_lock = threading.Lock()
+
+    # chromadb is imported and the persistent client opened on first use, not at import;
+    # a failed open is retried on the next access
+    @property
+    def client(self) -> Optional["chromadb.ClientAPI"]:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._initialize_client()
+        return self._client
+
+    def is_initialized(self) -> bool:
+        return self._client is not None
 
     def _initialize_client(self):
         try:
-            persist_directory = os.getenv("CHROMA_PERSIST_DIRECTORY", "./chroma_db")
+            import chromadb
+            from chromadb.config import Settings
 
-            self.client = chromadb.PersistentClient(
-                path=persist_directory,
+            self._client = chromadb.PersistentClient(
+                path=self.persist_directory,
                 settings=Settings(
                     anonymized_telemetry=False,
                     allow_reset=True
                 )
             )
 
-            self.logger.info(f"ChromaDB client initialized with persist directory: {persist_directory}")
+            self.logger.info(f"ChromaDB client initialized with persist directory: {self.persist_directory}")
 
         except Exception as e:
             self.logger.error(f"Failed to initialize ChromaDB client: {e}")
-            self.client = None
+            self._client = None
 
     def get_or_create_collection(self, collection_name: Optional[str] = None):
         if not self.client:
@@ -39,17 +65,88 @@ class DatabaseModel:
         try:
             collection = self.client.get_or_create_collection(
                 name=name,
-                metadata={"hnsw:space": "cosine"}
+                metadata={"hnsw:space": "cosine", **self.collection_metadata}
             )
-            self.logger.debug(f"Retrieved/created collection: {name}")
+            metrics.increment("chroma.collection_lookups")
+            self._check_profile(collection)
+            self.logger.debug("Retrieved/created collection: %s", name)
             return collection
 
         except Exception as e:
             self.logger.error(f"Failed to get/create collection {name}: {e}")
             raise
 
+    def _check_profile(self, collection):
+        stored = dict(collection.metadata or {})
+        if "embedding_dimensions" not in stored and self.collection_metadata.get("embedding_dimensions"):
+            # Collections created before the profile was stamped: take the width of a stored vector
+            width = self._stored_width(collection)
+            if width is not None:
+                stored["embedding_dimensions"] = width
+
+        mismatched = {
+            key: (stored[key], value) for key, value in self.collection_metadata.items()
+            if key in stored and stored[key] != value
+        }
+        if mismatched:
+            metrics.increment("chroma.embedding_profile_mismatch")
+            self.logger.warning(
+                f"Collection {collection.name} was built with a different embedding profile "
+                f"(stored, configured): {mismatched}; run src/scripts/migrate_embeddings.py"
+            )
+
+    def _stored_width(self, collection) -> Optional[int]:
+        try:
+            page = collection.get(limit=1, include=["embeddings"])
+        except Exception as e:
+            self.logger.warning(f"Could not read a vector from collection {collection.name}: {e}")
+            return None
+
+        embeddings = page.get("embeddings")
+        if embeddings is None or len(embeddings) == 0:
+            return None
+        return len(embeddings[0])
+
+    def get_collection(self, collection_name: Optional[str] = None):
+        name = collection_name or self.collection_name
+
+        with self._collections_lock:
+            cached = self._collections.get(name)
+            if cached:
+                collection, checked_at = cached
+                if time.monotonic() - checked_at < self.health_check_interval:
+                    metrics.increment("chroma.collection_cache_hits")
+                    return collection
+
+                if self._is_healthy(collection):
+                    self._collections[name] = (collection, time.monotonic())
+                    metrics.increment("chroma.collection_cache_hits")
+                    return collection
+
+                self.logger.warning(f"Cached collection {name} is stale, re-acquiring")
+
+            collection = self.get_or_create_collection(name)
+            self._collections[name] = (collection, time.monotonic())
+            return collection
+
+    def invalidate_collection(self, collection_name: Optional[str] = None):
+        with self._collections_lock:
+            if collection_name:
+                self._collections.pop(collection_name, None)
+            else:
+                self._collections.clear()
+
+    def _is_healthy(self, collection) -> bool:
+        metrics.increment("chroma.collection_health_checks")
+        try:
+            current = self.client.get_collection(name=collection.name)
+            return current.id == collection.id
+        except Exception:
+            return False
+
     def reset_database(self) -> bool:
         try:
+            self.invalidate_collection()
             if self.client:
                 self.client.reset()
                 self.logger.info("ChromaDB database reset successfully")
@@ -58,4 +155,46 @@ class DatabaseModel:
 
         except Exception as e:
             self.logger.error(f"Failed to reset database: {e}")
-            return False
\ No newline at end of file
+            return False
+
+        finally:
+            # Again after the reset: a get_collection racing the reset may have cached a dead handle
+            self.invalidate_collection()
+
+    def get_storage_size(self) -> int:
+        total_size = 0
+        for root, _, files in os.walk(self.persist_directory):
+            for file_name in files:
+                try:
+                    total_size += os.path.getsize(os.path.join(root, file_name))
+                except OSError:
+                    continue
+        return total_size
+
+    def compact(self) -> bool:
+        """VACUUM chroma.sqlite3 to return space freed by deletes to the filesystem.
+
+        This opens a second SQLite connection next to the PersistentClient's. VACUUM needs
+        an exclusive lock: it waits up to CHROMA_VACUUM_TIMEOUT_SECONDS for Chroma's writes,
+        fails with "database is locked" after that, and blocks Chroma while it runs, so the
+        retention job runs it once per purge; offline, use init_chroma_db.py --compact.
+        Only the SQLite file shrinks: the HNSW segment files only mark deleted vectors and
+        keep their size, so storage reports undercount what a full rebuild would reclaim.
+        """
+        sqlite_path = os.path.join(self.persist_directory, "chroma.sqlite3")
+        if not os.path.exists(sqlite_path):
+            return False
+
+        try:
+            connection = sqlite3.connect(sqlite_path, timeout=self.vacuum_timeout)
+            try:
+                connection.execute("VACUUM")
+            finally:
+                connection.close()
+
+            self.logger.info(f"Compacted ChromaDB store at {sqlite_path}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to compact ChromaDB store: {e}")
+            return False
@@ -1,40 +1,203 @@
+import math
 import os
-from typing import List, Optional
-from openai import AsyncOpenAI
-from ...utils.logger import setup_logger
+import struct
+import threading
+from array import array
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from ...utils.circuit_breaker import CircuitBreaker
+from ...utils.logger import setup_logger, SAMPLED
+from ...utils.metrics import metrics
+from ...utils.profiling import phase
+from ...utils.tracing import tracer, traced
+from ...utils.usage import usage_tracker
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+NATIVE_DIMENSIONS = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536
+}
+CACHE_PRECISIONS = ("float32", "float16", "int8")
+
+
+def truncate_embedding(embedding: List[float], dimensions: int) -> List[float]:
+    """Matryoshka truncation: keep the leading dimensions and re-normalize to unit length."""
+    if not dimensions or len(embedding) <= dimensions:
+        return list(embedding)
+    head = embedding[:dimensions]
+    norm = math.sqrt(sum(value * value for value in head)) or 1.0
+    return [value / norm for value in head]
+
+
+def quantize(embedding: List[float], precision: str) -> Tuple[Any, ...]:
+    if precision == "float16":
+        return ("e", struct.pack(f"<{len(embedding)}e", *embedding))
+    if precision == "int8":
+        scale = max((abs(value) for value in embedding), default=0.0) / 127 or 1.0
+        return ("b", array("b", (round(value / scale) for value in embedding)).tobytes(), scale)
+    return ("f", array("f", embedding))
+
+
+def dequantize(packed: Tuple[Any, ...]) -> List[float]:
+    kind = packed[0]
+    if kind == "e":
+        return list(struct.unpack(f"<{len(packed[1]) // 2}e", packed[1]))
+    if kind == "b":
+        scale = packed[2]
+        return [value * scale for value in array("b", packed[1])]
+    return packed[1].tolist()
 
 
 class EmbeddingModel:
 
     def __init__(self):
         self.logger = setup_logger(__name__)
-        self.client: Optional[AsyncOpenAI] = None
-        self._initialize_client()
+        # Applied to the client when it is created, e.g. the session recorder's wrapper
+        self.client_wrapper: Optional[Callable] = None
+        self._client: Optional["AsyncOpenAI"] = None
+        self._client_initialized = False
+        self._client_lock = threading.Lock()
+        # Recent texts (opening queries, default actions) repeat across games and skip the API
+        self.cache_size = int(os.getenv("EMBEDDING_CACHE_SIZE", "1024"))
+        self.cache_precision = os.getenv("EMBEDDING_CACHE_PRECISION", "float32")
+        if self.cache_precision not in CACHE_PRECISIONS:
+            self.logger.warning(f"Unknown EMBEDDING_CACHE_PRECISION {self.cache_precision}, using float32")
+            self.cache_precision = "float32"
+        self._cache: "OrderedDict[str, Tuple[Any, ...]]" = OrderedDict()
+
+        # EMBEDDING_DIMENSIONS=0 keeps the model's native width; "provider" asks the API for
+        # shortened vectors, "local" requests full vectors and truncates them here
+        self.model = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+        self.dimensions = int(os.getenv("EMBEDDING_DIMENSIONS", "0"))
+        self.truncation = os.getenv("EMBEDDING_TRUNCATION", "provider")
+        # While the API is failing, lookups return None at once instead of waiting on each timeout
+        self.breaker = CircuitBreaker("embeddings")
+
+    # The openai package and its HTTP client are created on first use, not at import
+    @property
+    def client(self) -> Optional["AsyncOpenAI"]:
+        if not self._client_initialized:
+            with self._client_lock:
+                if not self._client_initialized:
+                    self._initialize_client()
+                    self._client_initialized = True
+        return self._client
+
+    @client.setter
+    def client(self, client):
+        self._client = client
+        self._client_initialized = True
+
+    def is_initialized(self) -> bool:
+        return self._client_initialized
 
     def _initialize_client(self):
         api_key = os.getenv("OPENAI_API_KEY")
         if api_key:
             try:
-                self.client = AsyncOpenAI(api_key=api_key)
+                from openai import AsyncOpenAI
+
+                client = AsyncOpenAI(api_key=api_key)
+                self._client = self.client_wrapper(client) if self.client_wrapper else client
                 self.logger.info("OpenAI client initialized for embeddings")
             except Exception as e:
                 self.logger.error(f"Failed to initialize OpenAI client: {e}")
         else:
             self.logger.warning("No OpenAI API key found - embeddings unavailable")
 
+    def get_profile(self) -> Dict[str, Any]:
+        """Model and vector width this instance produces, recorded on the Chroma collection."""
+        return {
+            "embedding_model": self.model,
+            "embedding_dimensions": self.dimensions or NATIVE_DIMENSIONS.get(self.model, 0)
+        }
+
+    def project(self, embedding: List[float]) -> List[float]:
+        return truncate_embedding(embedding, self.dimensions)
+
+    def _request_kwargs(self) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {"model": self.model}
+        if self.dimensions and self.truncation == "provider":
+            kwargs["dimensions"] = self.dimensions
+        return kwargs
+
+    def _cache_get(self, text: str) -> Optional[List[float]]:
+        packed = self._cache.get(text)
+        if packed is None:
+            return None
+        self._cache.move_to_end(text)
+        metrics.increment("embedding.cache_hits")
+        return dequantize(packed)
+
+    def _cache_put(self, text: str, embedding: List[float]):
+        if self.cache_size <= 0:
+            return
+        self._cache[text] = quantize(embedding, self.cache_precision)
+        self._cache.move_to_end(text)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    @traced("EmbeddingModel.get_embedding")
     async def get_embedding(self, text: str) -> Optional[List[float]]:
-        if not self.client:
+        tracer.current_span().set_attributes(model=self.model, text_length=len(text))
+        text = text.replace("\n", " ")
+        cached = self._cache_get(text)
+        if cached is not None:
+            tracer.current_span().set_attribute("cache_hit", True)
+            return cached
+
+        if not self.client or not self.breaker.allow_request():
             return None
 
         try:
-            response = await self.client.embeddings.create(
-                model="text-embedding-3-small",
-                input=text.replace("\n", " ")
-            )
-            embedding = response.data[0].embedding
-            self.logger.debug(f"Generated embedding for text: {text[:100]}...")
+            with phase("embedding_request"):
+                response = await self.client.embeddings.create(
+                    input=text,
+                    **self._request_kwargs()
+                )
+            self.breaker.record_success()
+            usage_tracker.record_embedding(self.model, getattr(response, "usage", None))
+            embedding = self.project(response.data[0].embedding)
+            self._cache_put(text, embedding)
+            self.logger.debug("Generated embedding for text: %.100s...", text, extra=SAMPLED)
             return embedding
 
         except Exception as e:
+            self.breaker.record_failure()
             self.logger.error(f"Failed to generate embedding: {e}")
+            tracer.current_span().set_attribute("error", str(e))
             return None
+
+    @traced("EmbeddingModel.get_embeddings")
+    async def get_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        tracer.current_span().set_attributes(model=self.model, input_count=len(texts))
+        texts = [text.replace("\n", " ") for text in texts]
+        embeddings: List[Optional[List[float]]] = [self._cache_get(text) for text in texts]
+
+        # Only texts missing from the cache go over the wire
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if not missing or not self.client or not self.breaker.allow_request():
+            return embeddings
+
+        try:
+            with phase("embedding_request"):
+                response = await self.client.embeddings.create(
+                    input=[texts[i] for i in missing],
+                    **self._request_kwargs()
+                )
+            self.breaker.record_success()
+            usage_tracker.record_embedding(self.model, getattr(response, "usage", None))
+            for item in response.data:
+                index = missing[item.index]
+                embeddings[index] = self.project(item.embedding)
+                self._cache_put(texts[index], embeddings[index])
+            self.logger.debug("Generated %d embeddings in one request", len(missing), extra=SAMPLED)
+            return embeddings
+
+        except Exception as e:
+            self.breaker.record_failure()
+            self.logger.error(f"Failed to generate batch embeddings: {e}")
+            return embeddings
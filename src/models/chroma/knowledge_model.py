@@ -2,59 +2,135 @@
 KnowledgeModel for managing knowledge entries in ChromaDB
 """
 
-from typing import Dict, Any, Optional, List
+from collections import defaultdict
+from typing import Dict, Any, Optional, List, Iterator, Set
 from datetime import datetime
 from .database_model import DatabaseModel
 from .embedding_model import EmbeddingModel
 from .knowledge_base import KnowledgeBase
-from ...utils.logger import setup_logger
+from .knowledge_record import KnowledgeRecord
+from .lexical_index import LexicalIndex
+from .stats_model import StatsModel
+from ...utils.logger import setup_logger, SAMPLED
+from ...utils.profiling import phase
+from ...utils.tracing import tracer, traced
+
+DEFAULT_PAGE_SIZE = 500
 
 
 class KnowledgeModel:
 
-    def __init__(self, database_model: DatabaseModel, embedding_model: EmbeddingModel):
+    def __init__(self, database_model: DatabaseModel, embedding_model: EmbeddingModel,
+                 stats_model: StatsModel, lexical_index: LexicalIndex):
         self.logger = setup_logger(__name__)
         self.db = database_model
         self.embedding_model = embedding_model
+        self.stats = stats_model
+        self.lexical_index = lexical_index
 
+    @traced("KnowledgeModel.store_knowledge")
     async def store_knowledge(self, content_type: str, content_id: str,
                             title: str, content: str, metadata: Dict = None) -> bool:
+        span = tracer.current_span()
+        span.set_attributes(content_type=content_type, content_id=content_id,
+                            game_id=(metadata or {}).get("game_id", ""))
         try:
-            # Create knowledge base entry
-            knowledge = KnowledgeBase(
+            now = datetime.now().isoformat()
+            record = KnowledgeRecord(
                 content_type=content_type,
                 content_id=content_id,
                 title=title,
                 content=content,
-                metadata=metadata or {},
-                created_at=datetime.now(),
-                updated_at=datetime.now()
+                metadata=metadata,
+                created_at=now,
+                updated_at=now
             )
 
             # Get embedding
             embedding = await self.embedding_model.get_embedding(content)
 
             # Get collection
-            collection = self.db.get_or_create_collection()
+            collection = self.db.get_collection()
 
             # Convert to ChromaDB format
-            doc_data = knowledge.to_chroma_document()
+            doc_id, document, flat_metadata = record.to_chroma()
+
+            # add() silently skips existing IDs, so only count genuinely new entries
+            is_new = doc_id not in self._existing_ids(collection, [record])
 
             # Store in ChromaDB
-            collection.add(
-                ids=[doc_data["id"]],
-                documents=[doc_data["document"]],
-                metadatas=[doc_data["metadata"]],
-                embeddings=[embedding] if embedding else None
-            )
+            with phase("chroma_add"):
+                collection.add(
+                    ids=[doc_id],
+                    documents=[document],
+                    metadatas=[flat_metadata],
+                    embeddings=[embedding] if embedding else None
+                )
 
-            self.logger.debug(f"Stored knowledge: {content_type}/{content_id}")
+            if is_new:
+                self.stats.record_added(content_type, (metadata or {}).get("game_id"))
+                self.lexical_index.add(doc_id, document, flat_metadata)
+            span.set_attributes(is_new=is_new, embedded=bool(embedding))
+
+            self.logger.debug("Stored knowledge: %s/%s", content_type, content_id, extra=SAMPLED)
             return True
 
         except Exception as e:
+            self.db.invalidate_collection()
             self.logger.error(f"Failed to store knowledge {content_type}/{content_id}: {e}")
             return False
 
+    async def store_knowledge_batch(self, entries: List[Dict[str, Any]]) -> int:
+        if not entries:
+            return 0
+
+        try:
+            now = datetime.now().isoformat()
+            records: Dict[str, KnowledgeRecord] = {}
+            for entry in entries:
+                record = KnowledgeRecord(
+                    content_type=entry["content_type"],
+                    content_id=entry["content_id"],
+                    title=entry["title"],
+                    content=entry["content"],
+                    metadata=entry.get("metadata"),
+                    created_at=now,
+                    updated_at=now
+                )
+                # Chroma rejects duplicate IDs within one add(); keep the first like add() would
+                records.setdefault(record.id, record)
+
+            batch = list(records.values())
+            embeddings = await self.embedding_model.get_embeddings([record.content for record in batch])
+            stored = [(record, embedding) for record, embedding in zip(batch, embeddings) if embedding]
+            if not stored:
+                self.logger.error(f"Failed to embed any of {len(batch)} batched knowledge entries")
+                return 0
+
+            collection = self.db.get_collection()
+            docs = [record.to_chroma() for record, _ in stored]
+            existing = self._existing_ids(collection, [record for record, _ in stored])
+
+            collection.add(
+                ids=[doc[0] for doc in docs],
+                documents=[doc[1] for doc in docs],
+                metadatas=[doc[2] for doc in docs],
+                embeddings=[embedding for _, embedding in stored]
+            )
+
+            for (record, _), (doc_id, document, flat_metadata) in zip(stored, docs):
+                if record.id not in existing:
+                    self.stats.record_added(record.content_type, record.metadata.get("game_id"))
+                    self.lexical_index.add(doc_id, document, flat_metadata)
+
+            self.logger.debug("Stored %d/%d knowledge entries in one batch", len(stored), len(entries), extra=SAMPLED)
+            return len(stored)
+
+        except Exception as e:
+            self.db.invalidate_collection()
+            self.logger.error(f"Failed to store knowledge batch: {e}")
+            return 0
+
     async def ingest_game_data(self, monsters_data: Dict, items_data: Dict) -> bool:
         try:
             success_count = 0
@@ -118,55 +194,231 @@ class KnowledgeModel:
             return False
 
     def get_all_knowledge(self, content_type: Optional[str] = None) -> List[KnowledgeBase]:
+        knowledge_list = []
+        for page in self.iter_knowledge(content_type):
+            knowledge_list.extend(page)
+        return knowledge_list
+
+    def get_knowledge_page(self, content_type: Optional[str] = None,
+                           limit: int = 100, offset: int = 0) -> List[KnowledgeBase]:
+        return [
+            record.to_knowledge_base()
+            for record in self.get_record_page(content_type, limit=limit, offset=offset)
+        ]
+
+    def iter_knowledge(self, content_type: Optional[str] = None,
+                       page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[List[KnowledgeBase]]:
+        for page in self.iter_records(content_type, page_size):
+            yield [record.to_knowledge_base() for record in page]
+
+    def get_record_page(self, content_type: Optional[str] = None,
+                        limit: int = 100, offset: int = 0) -> List[KnowledgeRecord]:
         try:
-            collection = self.db.get_or_create_collection()
+            collection = self.db.get_collection()
 
             where_clause = {"content_type": content_type} if content_type else None
 
             results = collection.get(
                 where=where_clause,
-                include=["documents", "metadatas"]
+                include=["documents", "metadatas"],
+                limit=limit,
+                offset=offset
             )
 
-            knowledge_list = []
-            if results['ids']:
-                for i, doc_id in enumerate(results['ids']):
-                    knowledge = KnowledgeBase.from_chroma_result(
-                        doc_id=doc_id,
-                        document=results['documents'][i],
-                        metadata=results['metadatas'][i]
-                    )
-                    knowledge_list.append(knowledge)
+            if not results['ids']:
+                return []
 
-            return knowledge_list
+            return [
+                KnowledgeRecord.from_chroma(doc_id, document, metadata)
+                for doc_id, document, metadata in zip(
+                    results['ids'], results['documents'], results['metadatas']
+                )
+            ]
 
         except Exception as e:
-            self.logger.error(f"Failed to get all knowledge: {e}")
-            return []
+            self.db.invalidate_collection()
+            self.logger.error(f"Failed to get knowledge page at offset {offset}: {e}")
+            # An empty page means end of data to iter_records, so a failure must not look like one
+            raise
+
+    def iter_records(self, content_type: Optional[str] = None,
+                     page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[List[KnowledgeRecord]]:
+        """Yield pages of records; raises if a page cannot be read rather than stopping early"""
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+
+        offset = 0
+        while True:
+            page = self.get_record_page(content_type, limit=page_size, offset=offset)
+            if not page:
+                return
+
+            yield page
+
+            if len(page) < page_size:
+                return
+            offset += len(page)
+
+    def clear_knowledge(self, content_type: Optional[str] = None,
+                        batch_size: int = DEFAULT_PAGE_SIZE) -> int:
+        where_clause = {"content_type": content_type} if content_type else None
+        count = self._delete_in_batches(where_clause, batch_size)
+
+        self.logger.info(f"Cleared {count} knowledge entries")
+        return count
+
+    def _delete_in_batches(self, where_clause: Optional[Dict], batch_size: int) -> int:
+        count = 0
+        try:
+            collection = self.db.get_collection()
+
+            while True:
+                # Deleted rows drop out of the result set, so the next batch is always at offset 0
+                batch = collection.get(
+                    where=where_clause,
+                    include=["metadatas"],
+                    limit=batch_size
+                )
+                if not batch['ids']:
+                    break
+
+                collection.delete(ids=batch['ids'])
+                self.lexical_index.remove(batch['ids'])
+                count += len(batch['ids'])
+
+                deleted: Dict[tuple, int] = defaultdict(int)
+                for metadata in batch['metadatas']:
+                    metadata = metadata or {}
+                    deleted[(metadata.get("content_type", "unknown"), metadata.get("game_id"))] += 1
+                for (deleted_type, game_id), deleted_count in deleted.items():
+                    self.stats.record_deleted(deleted_type, game_id, count=deleted_count)
 
-    def clear_knowledge(self, content_type: Optional[str] = None) -> int:
+                if len(batch['ids']) < batch_size:
+                    break
+
+        except Exception as e:
+            self.db.invalidate_collection()
+            self.logger.error(f"Failed to delete knowledge after {count} entries: {e}")
+
+        return count
+
+    def _existing_ids(self, collection, records: List[KnowledgeRecord]) -> Set[str]:
+        doc_ids = [record.id for record in records]
+        if all(self.lexical_index.is_loaded(record.metadata.get("game_id")) for record in records):
+            # A loaded scope mirrors the collection, so membership needs no round-trip. No await
+            # separates this check from the following add(), so stores on the event loop cannot
+            # interleave; writers from other processes can, and reconcile_stats corrects that drift.
+            return {doc_id for doc_id in doc_ids if doc_id in self.lexical_index}
+        return set(collection.get(ids=doc_ids, include=[])['ids'])
+
+    def load_lexical_scope(self, game_id: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+        """Load the catalog (game_id None) or one game's events into the lexical index"""
+        if game_id is None:
+            where_clause = {"content_type": {"$ne": "game_event"}}
+        else:
+            where_clause = {"$and": [{"content_type": {"$eq": "game_event"}}, {"game_id": {"$eq": game_id}}]}
+
+        offset = 0
         try:
-            collection = self.db.get_or_create_collection()
+            collection = self.db.get_collection()
+            while True:
+                page = collection.get(where=where_clause, include=["documents", "metadatas"],
+                                      limit=page_size, offset=offset)
+                for doc_id, document, metadata in zip(page['ids'], page['documents'], page['metadatas']):
+                    self.lexical_index.add(doc_id, document or "", metadata or {})
+                offset += len(page['ids'])
+                if len(page['ids']) < page_size:
+                    break
+            self.lexical_index.mark_loaded(game_id)
+
+        except Exception as e:
+            # Left unmarked, so the next search for this scope retries the load
+            self.db.invalidate_collection()
+            self.logger.error(f"Failed to load lexical index for {game_id or 'catalog'} after {offset} entries: {e}")
+
+        return offset
 
-            if content_type:
-                # Get IDs to delete
-                results = collection.get(
-                    where={"content_type": content_type},
-                    include=[]
+    def rebuild_lexical_index(self, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+        """Reload the catalog into the lexical index; a game's events load on its first search"""
+        self.lexical_index.clear()
+        count = self.load_lexical_scope(None, page_size)
+        self.logger.info(f"Lexical index loaded with {count} catalog entries")
+        return count
+
+    def get_game_events(self, game_id: str) -> Dict[str, List]:
+        try:
+            collection = self.db.get_collection()
+
+            results = collection.get(
+                where={
+                    "$and": [
+                        {"content_type": {"$eq": "game_event"}},
+                        {"game_id": {"$eq": game_id}}
+                    ]
+                },
+                include=["documents", "metadatas", "embeddings"]
+            )
+
+            embeddings = results.get('embeddings')
+            return {
+                "ids": list(results['ids'] or []),
+                "documents": list(results['documents'] or []),
+                "metadatas": list(results['metadatas'] or []),
+                "embeddings": [list(map(float, e)) for e in embeddings] if embeddings is not None else []
+            }
+
+        except Exception as e:
+            self.db.invalidate_collection()
+            self.logger.error(f"Failed to get game events for {game_id}: {e}")
+            return {"ids": [], "documents": [], "metadatas": [], "embeddings": []}
+
+    def get_game_last_activity(self, page_size: int = DEFAULT_PAGE_SIZE) -> Dict[str, datetime]:
+        """Latest event created_at per stored game, including games no longer held in memory"""
+        last_activity: Dict[str, datetime] = {}
+        offset = 0
+        try:
+            collection = self.db.get_collection()
+            while True:
+                page = collection.get(
+                    where={"content_type": {"$eq": "game_event"}},
+                    include=["metadatas"],
+                    limit=page_size,
+                    offset=offset
                 )
-                if results['ids']:
-                    collection.delete(ids=results['ids'])
-                    count = len(results['ids'])
-                else:
-                    count = 0
-            else:
-                # Clear all
-                count = collection.count()
-                collection.delete()
-
-            self.logger.info(f"Cleared {count} knowledge entries")
-            return count
+                if not page['ids']:
+                    break
+
+                for metadata in page['metadatas']:
+                    metadata = metadata or {}
+                    game_id, created_at = metadata.get("game_id"), metadata.get("created_at")
+                    if not game_id or not created_at:
+                        continue
+                    created = datetime.fromisoformat(created_at)
+                    if game_id not in last_activity or created > last_activity[game_id]:
+                        last_activity[game_id] = created
+
+                if len(page['ids']) < page_size:
+                    break
+                offset += len(page['ids'])
 
         except Exception as e:
-            self.logger.error(f"Failed to clear knowledge: {e}")
-            return 0
\ No newline at end of file
+            self.db.invalidate_collection()
+            self.logger.error(f"Failed to read game activity after {offset} entries: {e}")
+            raise
+
+        return last_activity
+
+    def delete_game_events(self, game_id: str, batch_size: int = DEFAULT_PAGE_SIZE) -> int:
+        count = self._delete_in_batches(
+            {
+                "$and": [
+                    {"content_type": {"$eq": "game_event"}},
+                    {"game_id": {"$eq": game_id}}
+                ]
+            },
+            batch_size
+        )
+
+        if count:
+            self.logger.info(f"Deleted {count} game events for {game_id}")
+        return count
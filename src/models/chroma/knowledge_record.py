@@ -0,0 +1,131 @@
+import json
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from .knowledge_base import KnowledgeBase
+
+RESERVED_KEYS = frozenset(["content_type", "content_id", "title", "created_at", "updated_at"])
+
+
+SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _dynamic(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _scalar(value: Any) -> Any:
+    # Exact-type check first; custom data can still put a dict or list in a declared field
+    if value.__class__ in SCALAR_TYPES:
+        return value
+    return _dynamic(value)
+
+
+def _to_json(value: Any) -> str:
+    # Already-encoded strings are stored as-is rather than quoted a second time
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+class FlatteningSchema:
+    __slots__ = ("content_type", "encoders")
+
+    def __init__(self, content_type: str, scalar_fields: Iterable[str] = (),
+                 json_fields: Iterable[str] = ()):
+        self.content_type = content_type
+        encoders: Dict[str, Callable[[Any], Any]] = {}
+        for field in scalar_fields:
+            encoders[field] = _scalar
+        for field in json_fields:
+            encoders[field] = _to_json
+        self.encoders = encoders
+
+    def flatten(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        encoders = self.encoders
+        return {key: encoders.get(key, _dynamic)(value) for key, value in metadata.items()}
+
+
+SCHEMAS: Dict[str, FlatteningSchema] = {
+    "game_event": FlatteningSchema(
+        "game_event",
+        scalar_fields=("game_id", "turn", "player_name", "hp_after", "exp_after", "created_at")
+    ),
+    "monster": FlatteningSchema(
+        "monster",
+        scalar_fields=("name", "description", "type", "element"),
+        json_fields=("stats", "abilities", "loot")
+    ),
+    "item": FlatteningSchema(
+        "item",
+        scalar_fields=("name", "description", "type", "effects", "value", "rarity", "requirements")
+    ),
+}
+
+
+def get_schema(content_type: str) -> FlatteningSchema:
+    schema = SCHEMAS.get(content_type)
+    if schema is None:
+        schema = FlatteningSchema(content_type)
+        SCHEMAS[content_type] = schema
+    return schema
+
+
+class KnowledgeRecord:
+    __slots__ = ("id", "content_type", "content_id", "title", "content",
+                 "metadata", "created_at", "updated_at")
+
+    def __init__(self, content_type: str, content_id: str, title: str, content: str,
+                 metadata: Optional[Dict[str, Any]] = None, created_at: Optional[str] = None,
+                 updated_at: Optional[str] = None, id: Optional[str] = None):
+        self.id = id or f"{content_type}_{content_id}"
+        self.content_type = content_type
+        self.content_id = content_id
+        self.title = title
+        self.content = content
+        self.metadata = metadata or {}
+        # Timestamps stay as ISO strings; they are only parsed when materializing a KnowledgeBase
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    def to_chroma(self) -> Tuple[str, str, Dict[str, Any]]:
+        flat_metadata = {
+            "content_type": self.content_type,
+            "content_id": self.content_id,
+            "title": self.title,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+        flat_metadata.update(get_schema(self.content_type).flatten(self.metadata))
+        return self.id, self.content, flat_metadata
+
+    @classmethod
+    def from_chroma(cls, doc_id: str, document: str, metadata: Optional[Dict[str, Any]]) -> "KnowledgeRecord":
+        metadata = metadata or {}
+        return cls(
+            id=doc_id,
+            content_type=metadata.get("content_type", "unknown"),
+            content_id=metadata.get("content_id", doc_id),
+            title=metadata.get("title", "Unknown"),
+            content=document,
+            metadata={k: v for k, v in metadata.items() if k not in RESERVED_KEYS},
+            created_at=metadata.get("created_at"),
+            updated_at=metadata.get("updated_at"),
+        )
+
+    def to_knowledge_base(self) -> KnowledgeBase:
+        return KnowledgeBase.from_chroma_result(
+            doc_id=self.id,
+            document=self.content,
+            metadata={
+                "content_type": self.content_type,
+                "content_id": self.content_id,
+                "title": self.title,
+                "created_at": self.created_at,
+                "updated_at": self.updated_at,
+                **self.metadata
+            }
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
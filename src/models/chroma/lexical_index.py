@@ -0,0 +1,194 @@
+"""
+LexicalIndex: in-memory BM25 inverted index kept alongside the Chroma collection
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+WORD = re.compile(r"[a-z0-9]+|[㐀-鿿豈-﫿]+")
+CJK = re.compile(r"[㐀-鿿豈-﫿]")
+STOPWORDS = frozenset((
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into", "is", "it",
+    "of", "on", "or", "the", "to", "with", "you", "your", "following", "turn", "status", "changes",
+    "hp", "exp"
+))
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """English words are lower-cased and lightly stemmed; Chinese runs become character bigrams."""
+    tokens = []
+    for run in WORD.findall(text.lower()):
+        if CJK.match(run):
+            # Traditional Chinese is not space separated; bigrams match names like 火龍 without a segmenter
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        elif run not in STOPWORDS and not run.isdigit():
+            if len(run) > 3 and run.endswith("s") and not run.endswith("ss"):
+                run = run[:-1]
+            tokens.append(run)
+    return tokens
+
+
+class _Partition:
+    """Postings for one (content_type, game_id) scope; BM25 statistics are summed over the scopes searched."""
+
+    __slots__ = ("postings", "docs", "total_length")
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[str, int]] = {}
+        # doc_id -> (length, document, metadata)
+        self.docs: Dict[str, Tuple[int, str, Dict[str, Any]]] = {}
+        self.total_length = 0
+
+
+class LexicalIndex:
+    """BM25 over document text and titles, partitioned by content type and game like the vector search.
+
+    Only the partitions matching a search's filters are scored. The catalog (documents
+    without a game) is loaded at startup and a game's events on its first search, so
+    memory holds the catalog plus the games in play rather than the whole collection.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # content_type -> game_id (None for the catalog) -> partition
+        self._partitions: Dict[str, Dict[Optional[str], _Partition]] = {}
+        self._scopes: Dict[str, Tuple[str, Optional[str]]] = {}
+        # Games (None for the catalog) whose stored documents have all been loaded
+        self._loaded: Set[Optional[str]] = set()
+
+    def __len__(self) -> int:
+        return len(self._scopes)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._scopes
+
+    def is_loaded(self, game_id: Optional[str] = None) -> bool:
+        return game_id in self._loaded
+
+    def mark_loaded(self, game_id: Optional[str] = None):
+        with self._lock:
+            self._loaded.add(game_id)
+
+    def add(self, doc_id: str, document: str, metadata: Optional[Dict[str, Any]] = None):
+        metadata = metadata or {}
+        counts = Counter(tokenize(f"{metadata.get('title', '')} {document}"))
+        length = sum(counts.values())
+        content_type, game_id = metadata.get("content_type", ""), metadata.get("game_id")
+
+        with self._lock:
+            self._remove_locked(doc_id)
+            partition = self._partitions.setdefault(content_type, {}).get(game_id)
+            if partition is None:
+                partition = self._partitions[content_type][game_id] = _Partition()
+            for term, count in counts.items():
+                partition.postings.setdefault(term, {})[doc_id] = count
+            partition.docs[doc_id] = (length, document, metadata)
+            partition.total_length += length
+            self._scopes[doc_id] = (content_type, game_id)
+
+    def remove(self, doc_ids: List[str]):
+        with self._lock:
+            for doc_id in doc_ids:
+                self._remove_locked(doc_id)
+
+    def _remove_locked(self, doc_id: str):
+        scope = self._scopes.pop(doc_id, None)
+        if scope is None:
+            return
+        content_type, game_id = scope
+        partition = self._partitions[content_type][game_id]
+        length, document, metadata = partition.docs.pop(doc_id)
+        partition.total_length -= length
+        for term in set(tokenize(f"{metadata.get('title', '')} {document}")):
+            postings = partition.postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del partition.postings[term]
+        if not partition.docs:
+            del self._partitions[content_type][game_id]
+
+    def forget(self, game_id: str):
+        """Drop a game's partitions, e.g. once it has expired; a later search loads them again."""
+        with self._lock:
+            self._loaded.discard(game_id)
+            for by_game in self._partitions.values():
+                partition = by_game.pop(game_id, None)
+                if partition is not None:
+                    for doc_id in partition.docs:
+                        del self._scopes[doc_id]
+
+    def clear(self):
+        with self._lock:
+            self._partitions.clear()
+            self._scopes.clear()
+            self._loaded.clear()
+
+    def search(self, query: str, content_type: Union[str, Tuple[str, ...], None] = None,
+               game_id: Optional[str] = None, limit: int = 5) -> List[Dict[str, Any]]:
+        """Return hits shaped like vector search results, with BM25 and a 0-1 confidence score."""
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        content_types = (content_type,) if isinstance(content_type, str) else content_type
+
+        with self._lock:
+            partitions = []
+            for doc_type in content_types or list(self._partitions):
+                by_game = self._partitions.get(doc_type, {})
+                if game_id:
+                    partition = by_game.get(game_id)
+                    partitions.extend([(doc_type, partition)] if partition else [])
+                else:
+                    partitions.extend((doc_type, partition) for partition in by_game.values())
+
+            doc_count = sum(len(partition.docs) for _, partition in partitions)
+            if not doc_count:
+                return []
+            average_length = sum(partition.total_length for _, partition in partitions) / doc_count
+
+            scores: Dict[str, float] = {}
+            matched: Counter = Counter()
+            documents: Dict[str, Tuple[str, str, Dict[str, Any]]] = {}
+            max_score = 0.0
+            for term in terms:
+                term_postings = [(doc_type, partition, partition.postings.get(term) or {})
+                                 for doc_type, partition in partitions]
+                doc_frequency = sum(len(postings) for _, _, postings in term_postings)
+                idf = math.log(1 + (doc_count - doc_frequency + 0.5) / (doc_frequency + 0.5))
+                # A single occurrence in an average-length document scores exactly idf; unseen
+                # terms still count, so a query that is mostly unknown words is never confident
+                max_score += idf
+                for doc_type, partition, postings in term_postings:
+                    for doc_id, count in postings.items():
+                        length, document, metadata = partition.docs[doc_id]
+                        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                        scores[doc_id] = scores.get(doc_id, 0.0) + idf * count * (BM25_K1 + 1) / (count + norm)
+                        matched[doc_id] += 1
+                        documents[doc_id] = (doc_type, document, metadata)
+
+            ranked = sorted(scores.items(), key=lambda pair: (-pair[1], pair[0]))[:limit]
+            hits = []
+            for doc_id, score in ranked:
+                doc_type, document, metadata = documents[doc_id]
+                hits.append({
+                    "id": doc_id,
+                    "content": document,
+                    "metadata": metadata,
+                    # Relative to one occurrence of every query term in an average-length document
+                    "confidence": min(1.0, score / max_score) if max_score else 0.0,
+                    "bm25": score,
+                    "matched_terms": matched[doc_id],
+                    "content_type": doc_type,
+                    "title": metadata.get("title"),
+                })
+            return hits
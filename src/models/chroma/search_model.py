@@ -1,88 +1,326 @@
-from typing import List, Dict, Any, Optional
+import os
+from typing import Callable, List, Dict, Any, Optional, Tuple, Union
 from .database_model import DatabaseModel
 from .embedding_model import EmbeddingModel
-from ...utils.logger import setup_logger
+from .lexical_index import LexicalIndex, tokenize
+from .stats_model import StatsModel
+from ...utils.logger import setup_logger, SAMPLED
+from ...utils.metrics import metrics
+from ...utils.profiling import phase
+from ...utils.text_signature import jaccard
+from ...utils.tracing import tracer, traced
 
 
 class SearchModel:
 
-    def __init__(self, database_model: DatabaseModel, embedding_model: EmbeddingModel):
+    def __init__(self, database_model: DatabaseModel, embedding_model: EmbeddingModel,
+                 stats_model: StatsModel, lexical_index: LexicalIndex,
+                 lexical_loader: Optional[Callable[[Optional[str]], int]] = None):
         self.logger = setup_logger(__name__)
         self.db = database_model
         self.embedding_model = embedding_model
+        self.stats = stats_model
+        self.lexical_index = lexical_index
+        # Loads a game's events into the lexical index the first time that game is searched
+        self.lexical_loader = lexical_loader
+        self.hybrid_enabled = os.getenv("HYBRID_SEARCH_ENABLED", "true").lower() == "true"
+        # Lexical hits below this confidence are noise (a shared verb like "attack")
+        self.lexical_min_confidence = float(os.getenv("HYBRID_LEXICAL_MIN_CONFIDENCE", "0.3"))
+        # At or above this, the lexical top hit is trusted and the embedding call is skipped
+        self.lexical_skip_confidence = float(os.getenv("HYBRID_LEXICAL_SKIP_CONFIDENCE", "0.8"))
+        # ...and only when it matched this many query terms: a lone verb scores full confidence
+        self.lexical_skip_min_terms = int(os.getenv("HYBRID_LEXICAL_SKIP_MIN_TERMS", "2"))
+        self.rrf_k = int(os.getenv("HYBRID_RRF_K", "60"))
+        # MMR picks from limit * RETRIEVAL_MMR_CANDIDATES hits; lambda 1.0 means relevance only
+        self.mmr_candidates = max(1, int(os.getenv("RETRIEVAL_MMR_CANDIDATES", "2")))
+        self.mmr_lambda = float(os.getenv("RETRIEVAL_MMR_LAMBDA", "0.7"))
 
+    @traced("SearchModel.semantic_search")
     async def semantic_search(self, query: str, content_type: Optional[str] = None,
                             limit: int = 5, similarity_threshold: float = 0.7,
                             game_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        span = tracer.current_span()
+        span.set_attributes(content_type=content_type or "", game_id=game_id or "", limit=limit,
+                            similarity_threshold=similarity_threshold)
         try:
             query_embedding = await self.embedding_model.get_embedding(query)
             if not query_embedding:
                 self.logger.error("Failed to get query embedding")
                 return []
 
-            collection = self.db.get_or_create_collection()
+            collection = self.db.get_collection()
 
             # Prepare where clause for filtering
-            where_clause = None
-            if content_type and game_id:
-                where_clause = {
-                    "$and": [
-                        {"content_type": {"$eq": content_type}},
-                        {"game_id": {"$eq": game_id}}
-                    ]
-                }
-            elif content_type:
-                where_clause = {"content_type": {"$eq": content_type}}
-            elif game_id:
-                where_clause = {"game_id": {"$eq": game_id}}
+            where_clause = self._build_where_clause(content_type, game_id)
 
             # Perform vector search
-            results = collection.query(
-                query_embeddings=[query_embedding],
-                n_results=limit,
-                where=where_clause
-            )
+            with phase("chroma_query"):
+                results = collection.query(
+                    query_embeddings=[query_embedding],
+                    n_results=limit,
+                    where=where_clause
+                )
 
             # Convert results to standard format
-            search_results = []
-            if results['ids'] and results['ids'][0]:
-                for i, doc_id in enumerate(results['ids'][0]):
-                    distance = results['distances'][0][i] if results['distances'] else 0
-                    similarity = 1 - distance  # Convert distance to similarity
-
-                    if similarity >= similarity_threshold:
-                        result = {
-                            "id": doc_id,
-                            "content": results['documents'][0][i],
-                            "metadata": results['metadatas'][0][i],
-                            "similarity": similarity,
-                            "content_type": results['metadatas'][0][i].get("content_type"),
-                            "title": results['metadatas'][0][i].get("title"),
-                        }
-                        search_results.append(result)
-
-            self.logger.debug(f"Semantic search returned {len(search_results)} results for query: {query}")
+            search_results = self._convert_results(results, 0, similarity_threshold)
+            span.set_attributes(
+                candidate_count=len(results["ids"][0]) if results.get("ids") else 0,
+                result_count=len(search_results),
+                similarities=[round(result["similarity"], 4) for result in search_results]
+            )
+
+            self.logger.debug("Semantic search returned %d results for query: %s", len(search_results), query, extra=SAMPLED)
             return search_results
 
         except Exception as e:
+            self.db.invalidate_collection()
             self.logger.error(f"Semantic search failed: {e}")
+            span.set_attribute("error", str(e))
+            return []
+
+    @traced("SearchModel.semantic_search_batch")
+    async def semantic_search_batch(self, queries: List[str], game_ids: List[str],
+                                    content_type: Optional[str] = None, limit: int = 5,
+                                    similarity_threshold: float = 0.7) -> List[List[Dict[str, Any]]]:
+        tracer.current_span().set_attributes(query_count=len(queries), game_count=len(set(game_ids)))
+        if not queries:
             return []
 
-    def get_knowledge_count(self, content_type: Optional[str] = None) -> int:
         try:
-            collection = self.db.get_or_create_collection()
+            query_embeddings = await self.embedding_model.get_embeddings(queries)
+            embedded = [i for i, embedding in enumerate(query_embeddings) if embedding]
+            if not embedded:
+                self.logger.error("Failed to get batch query embeddings")
+                return [[] for _ in queries]
+
+            collection = self.db.get_collection()
 
-            if content_type:
-                # Count with filter
-                results = collection.get(
-                    where={"content_type": content_type},
-                    include=[]  # Don't include documents/metadata, just count
+            # One multi-query search over every game in the batch, split per game afterwards.
+            # Other games' events compete for slots, so over-fetch proportionally.
+            distinct_games = sorted(set(game_ids))
+            n_results = min(limit * len(distinct_games), 100)
+            with phase("chroma_query"):
+                results = collection.query(
+                    query_embeddings=[query_embeddings[i] for i in embedded],
+                    n_results=n_results,
+                    where=self._game_filter(distinct_games, content_type)
                 )
-                return len(results['ids']) if results['ids'] else 0
-            else:
-                # Count all
-                return collection.count()
+
+            batch_results: List[List[Dict[str, Any]]] = [[] for _ in queries]
+            for position, query_index in enumerate(embedded):
+                matches = [
+                    result for result in self._convert_results(results, position, similarity_threshold)
+                    if result["metadata"].get("game_id") == game_ids[query_index]
+                ]
+
+                # A full result list means other games may have crowded this one out; top it up
+                # with a query of its own so batched turns see the same context as single turns.
+                # Skipped when every stored event of the game already came back.
+                own_hits = self._own_hits(results, position, game_ids[query_index])
+                stored = self._known_game_count(game_ids[query_index])
+                if (len(matches) < limit and len(results["ids"][position]) >= n_results
+                        and len(distinct_games) > 1
+                        and own_hits < limit and (stored is None or own_hits < stored)):
+                    metrics.increment("search.batch_topups")
+                    with phase("chroma_query"):
+                        own = collection.query(
+                            query_embeddings=[query_embeddings[query_index]],
+                            n_results=limit,
+                            where=self._game_filter([game_ids[query_index]], content_type)
+                        )
+                    matches = self._convert_results(own, 0, similarity_threshold)
+
+                batch_results[query_index] = matches[:limit]
+
+            self.logger.debug("Batch semantic search served %d queries in one request", len(queries), extra=SAMPLED)
+            return batch_results
+
+        except Exception as e:
+            self.db.invalidate_collection()
+            self.logger.error(f"Batch semantic search failed: {e}")
+            return [[] for _ in queries]
+
+    def _known_game_count(self, game_id: str) -> Optional[int]:
+        # Unreconciled counters would trigger a full collection scan on this hot path; without
+        # them the top-up decision rests on the shared query's results alone
+        if not self.stats.is_reconciled():
+            return None
+        return self.stats.get_game_count(game_id)
+
+    @staticmethod
+    def _own_hits(results: Dict[str, Any], position: int, game_id: str) -> int:
+        return sum(1 for metadata in results["metadatas"][position] if (metadata or {}).get("game_id") == game_id)
+
+    @staticmethod
+    def _game_filter(game_ids: List[str], content_type: Optional[str]) -> Dict[str, Any]:
+        game_filter = {"game_id": {"$in": game_ids}} if len(game_ids) > 1 else {"game_id": {"$eq": game_ids[0]}}
+        if content_type:
+            return {"$and": [{"content_type": {"$eq": content_type}}, game_filter]}
+        return game_filter
+
+    async def hybrid_search(self, query: str, content_type: Optional[str] = None,
+                            limit: int = 5, similarity_threshold: float = 0.7,
+                            game_id: Optional[str] = None,
+                            lexical_query: Optional[str] = None,
+                            prior_content: Optional[str] = None) -> List[Dict[str, Any]]:
+        """lexical_query lets callers match exact terms on the bare action while the
+        embedding sees the contextual query; prior_content is text already in the prompt
+        (the previous event) that hits are diversified against"""
+        candidates = limit * self.mmr_candidates
+        if not self.hybrid_enabled:
+            vector = await self.semantic_search(query, content_type, candidates, similarity_threshold, game_id)
+            return self._diversify(vector, limit, prior_content)
+
+        lexical = self.lexical_search(lexical_query or query, content_type, candidates, game_id)
+        if self._is_confident(lexical):
+            metrics.increment("search.lexical_only")
+            return self._diversify(lexical, limit, prior_content)
+
+        vector = await self.semantic_search(query, content_type, candidates, similarity_threshold, game_id)
+        return self._diversify(self._fuse(vector, lexical, candidates), limit, prior_content)
+
+    async def hybrid_search_batch(self, queries: List[str], game_ids: List[str],
+                                  content_type: Optional[str] = None, limit: int = 5,
+                                  similarity_threshold: float = 0.7,
+                                  lexical_queries: Optional[List[str]] = None,
+                                  prior_contents: Optional[List[Optional[str]]] = None) -> List[List[Dict[str, Any]]]:
+        candidates = limit * self.mmr_candidates
+        prior_contents = prior_contents or [None] * len(queries)
+        if not self.hybrid_enabled:
+            vector = await self.semantic_search_batch(queries, game_ids, content_type, candidates, similarity_threshold)
+            return [self._diversify(hits, limit, prior) for hits, prior in zip(vector, prior_contents)]
+
+        lexical = [
+            self.lexical_search(query, content_type, candidates, game_id)
+            for query, game_id in zip(lexical_queries or queries, game_ids)
+        ]
+        results = [
+            self._diversify(hits, limit, prior) if self._is_confident(hits) else None
+            for hits, prior in zip(lexical, prior_contents)
+        ]
+        metrics.increment("search.lexical_only", sum(1 for result in results if result is not None))
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            vector = await self.semantic_search_batch(
+                [queries[i] for i in pending], [game_ids[i] for i in pending],
+                content_type, candidates, similarity_threshold
+            )
+            for i, hits in zip(pending, vector):
+                results[i] = self._diversify(self._fuse(hits, lexical[i], candidates), limit, prior_contents[i])
+        return results
+
+    def lexical_search(self, query: str, content_type: Union[str, Tuple[str, ...], None] = None,
+                       limit: int = 5, game_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        if game_id and self.lexical_loader and not self.lexical_index.is_loaded(game_id):
+            with phase("lexical_load"):
+                self.lexical_loader(game_id)
+        hits = []
+        for hit in self.lexical_index.search(query, content_type, game_id, limit):
+            if hit["confidence"] < self.lexical_min_confidence:
+                break
+            hit["similarity"] = hit["confidence"]
+            hits.append(hit)
+        return hits
+
+    def _is_confident(self, lexical: List[Dict[str, Any]]) -> bool:
+        if not lexical:
+            return False
+        top = lexical[0]
+        return top["confidence"] >= self.lexical_skip_confidence and top["matched_terms"] >= self.lexical_skip_min_terms
+
+    def _fuse(self, vector: List[Dict[str, Any]], lexical: List[Dict[str, Any]],
+              limit: int) -> List[Dict[str, Any]]:
+        """Reciprocal-rank fusion; a hit found by both searches keeps its vector similarity."""
+        if not lexical:
+            return vector
+
+        fused: Dict[str, Dict[str, Any]] = {}
+        for hits in (vector, lexical):
+            for rank, hit in enumerate(hits):
+                entry = fused.setdefault(hit["id"], dict(hit, rrf_score=0.0))
+                entry["rrf_score"] += 1 / (self.rrf_k + rank + 1)
+
+        ranked = sorted(fused.values(), key=lambda hit: -hit["rrf_score"])[:limit]
+        vector_ids = {hit["id"] for hit in vector}
+        metrics.increment("search.lexical_added", sum(1 for hit in ranked if hit["id"] not in vector_ids))
+        return ranked
+
+    def _diversify(self, hits: List[Dict[str, Any]], limit: int,
+                   prior_content: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Maximal marginal relevance over ranked hits, using token overlap as redundancy.
+
+        prior_content counts as already selected, so a stored copy of it is pushed down.
+        """
+        if len(hits) <= limit or self.mmr_lambda >= 1.0:
+            return hits[:limit]
+
+        # Rank-based relevance: RRF scores and similarities are too tightly packed to weigh
+        # against overlap, so only a near-copy is pushed below a less relevant hit
+        relevance = [1 - rank / len(hits) for rank in range(len(hits))]
+        tokens = [set(tokenize(hit.get("content") or "")) for hit in hits]
+
+        selected: List[int] = []
+        chosen_tokens = [set(tokenize(prior_content))] if prior_content else []
+        remaining = list(range(len(hits)))
+        while remaining and len(selected) < limit:
+            best = max(remaining, key=lambda i: (
+                self.mmr_lambda * relevance[i]
+                - (1 - self.mmr_lambda) * max((jaccard(tokens[i], chosen) for chosen in chosen_tokens), default=0.0)
+            ))
+            selected.append(best)
+            chosen_tokens.append(tokens[best])
+            remaining.remove(best)
+
+        if selected != list(range(len(selected))):
+            metrics.increment("search.mmr_reordered")
+        return [hits[i] for i in selected]
+
+    def _build_where_clause(self, content_type: Optional[str], game_id: Optional[str]) -> Optional[Dict]:
+        if content_type and game_id:
+            return {
+                "$and": [
+                    {"content_type": {"$eq": content_type}},
+                    {"game_id": {"$eq": game_id}}
+                ]
+            }
+        elif content_type:
+            return {"content_type": {"$eq": content_type}}
+        elif game_id:
+            return {"game_id": {"$eq": game_id}}
+        return None
+
+    def _convert_results(self, results: Dict, index: int, similarity_threshold: float) -> List[Dict[str, Any]]:
+        search_results = []
+        if results['ids'] and results['ids'][index]:
+            for i, doc_id in enumerate(results['ids'][index]):
+                distance = results['distances'][index][i] if results['distances'] else 0
+                similarity = 1 - distance  # Convert distance to similarity
+
+                if similarity >= similarity_threshold:
+                    metadata = results['metadatas'][index][i] or {}
+                    search_results.append({
+                        "id": doc_id,
+                        "content": results['documents'][index][i],
+                        "metadata": metadata,
+                        "similarity": similarity,
+                        "content_type": metadata.get("content_type"),
+                        "title": metadata.get("title"),
+                    })
+        return search_results
+
+    def get_knowledge_count(self, content_type: Optional[str] = None) -> int:
+        try:
+            return self.stats.get_count(content_type)
 
         except Exception as e:
             self.logger.error(f"Failed to get knowledge count: {e}")
-            return 0
\ No newline at end of file
+            return 0
+
+    def get_game_event_count(self, game_id: str) -> int:
+        try:
+            return self.stats.get_game_count(game_id)
+
+        except Exception as e:
+            self.logger.error(f"Failed to get game event count: {e}")
+            return 0
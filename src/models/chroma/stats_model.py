@@ -0,0 +1,218 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Optional
+from .database_model import DatabaseModel
+from ...utils.logger import setup_logger
+
+
+class StatsModel:
+    TOTAL_SCOPE = "total"
+    CONTENT_TYPE_SCOPE = "content_type"
+    GAME_SCOPE = "game"
+
+    def __init__(self, database_model: DatabaseModel, reconcile_page_size: int = 1000):
+        self.logger = setup_logger(__name__)
+        self.db = database_model
+        self.reconcile_page_size = reconcile_page_size
+        self.stats_path = os.getenv(
+            "KNOWLEDGE_STATS_PATH",
+            os.path.join(self.db.persist_directory, "knowledge_stats.sqlite3")
+        )
+        self.reconcile_retry_seconds = float(os.getenv("KNOWLEDGE_STATS_RECONCILE_RETRY_SECONDS", "60"))
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_lock = threading.Lock()
+        self._reconcile_failed_at: Optional[float] = None
+
+    # Opened on first use like DatabaseModel.client, so constructing the model does no I/O;
+    # a failed open is retried on the next access
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        if self._connection is None:
+            with self._connection_lock:
+                if self._connection is None:
+                    self._initialize_store()
+        return self._connection
+
+    def _initialize_store(self):
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.stats_path)), exist_ok=True)
+            connection = sqlite3.connect(self.stats_path, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS counters ("
+                "scope TEXT NOT NULL, key TEXT NOT NULL, count INTEGER NOT NULL, "
+                "PRIMARY KEY (scope, key))"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            connection.commit()
+            self._connection = connection
+
+        except Exception as e:
+            self.logger.error(f"Failed to initialize knowledge stats store: {e}")
+            self._connection = None
+
+    def is_reconciled(self) -> bool:
+        connection = self.connection
+        if not connection:
+            return False
+
+        with self._lock:
+            row = connection.execute(
+                "SELECT value FROM meta WHERE key = 'reconciled_at'"
+            ).fetchone()
+        return row is not None
+
+    def record_added(self, content_type: str, game_id: Optional[str] = None, count: int = 1):
+        self._apply_delta(content_type, game_id, count)
+
+    def record_deleted(self, content_type: str, game_id: Optional[str] = None, count: int = 1):
+        self._apply_delta(content_type, game_id, -count)
+
+    def _apply_delta(self, content_type: str, game_id: Optional[str], delta: int):
+        connection = self.connection
+        if not connection or delta == 0:
+            return
+
+        keys = [(self.TOTAL_SCOPE, ""), (self.CONTENT_TYPE_SCOPE, content_type)]
+        if game_id:
+            keys.append((self.GAME_SCOPE, game_id))
+
+        try:
+            with self._lock:
+                for scope, key in keys:
+                    connection.execute(
+                        "INSERT INTO counters (scope, key, count) VALUES (?, ?, ?) "
+                        "ON CONFLICT(scope, key) DO UPDATE SET count = MAX(0, count + excluded.count)",
+                        (scope, key, delta)
+                    )
+                connection.execute("DELETE FROM counters WHERE count <= 0")
+                connection.commit()
+
+        except Exception as e:
+            self.logger.error(f"Failed to update knowledge stats: {e}")
+
+    def get_count(self, content_type: Optional[str] = None) -> int:
+        self._ensure_reconciled()
+        if content_type:
+            return self._read_counter(self.CONTENT_TYPE_SCOPE, content_type)
+        return self._read_counter(self.TOTAL_SCOPE, "")
+
+    def get_game_count(self, game_id: str) -> int:
+        self._ensure_reconciled()
+        return self._read_counter(self.GAME_SCOPE, game_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        self._ensure_reconciled()
+        connection = self.connection
+        if not connection:
+            return {"total": 0, "content_types": {}, "games": 0, "reconciled_at": None}
+
+        with self._lock:
+            content_types = dict(connection.execute(
+                "SELECT key, count FROM counters WHERE scope = ?", (self.CONTENT_TYPE_SCOPE,)
+            ).fetchall())
+            games = connection.execute(
+                "SELECT COUNT(*) FROM counters WHERE scope = ?", (self.GAME_SCOPE,)
+            ).fetchone()[0]
+            reconciled_at = connection.execute(
+                "SELECT value FROM meta WHERE key = 'reconciled_at'"
+            ).fetchone()
+
+        return {
+            "total": self._read_counter(self.TOTAL_SCOPE, ""),
+            "content_types": content_types,
+            "games": games,
+            "reconciled_at": reconciled_at[0] if reconciled_at else None
+        }
+
+    def _read_counter(self, scope: str, key: str) -> int:
+        connection = self.connection
+        if not connection:
+            return 0
+
+        with self._lock:
+            row = connection.execute(
+                "SELECT count FROM counters WHERE scope = ? AND key = ?", (scope, key)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def _ensure_reconciled(self):
+        if not self.connection or self.is_reconciled():
+            return
+
+        # A full scan per count call would hammer a store that is already failing
+        if (self._reconcile_failed_at is not None
+                and time.monotonic() - self._reconcile_failed_at < self.reconcile_retry_seconds):
+            return
+
+        self.logger.info("Knowledge stats not initialized, reconciling from store")
+        self.reconcile()
+
+    def reconcile(self) -> Dict[str, Any]:
+        if not self.connection:
+            return {}
+
+        content_types: Dict[str, int] = defaultdict(int)
+        games: Dict[str, int] = defaultdict(int)
+        total = 0
+
+        try:
+            collection = self.db.get_collection()
+            offset = 0
+            while True:
+                page = collection.get(
+                    include=["metadatas"],
+                    limit=self.reconcile_page_size,
+                    offset=offset
+                )
+                if not page['ids']:
+                    break
+
+                for metadata in page['metadatas']:
+                    metadata = metadata or {}
+                    total += 1
+                    content_types[metadata.get("content_type", "unknown")] += 1
+                    if metadata.get("game_id"):
+                        games[metadata["game_id"]] += 1
+
+                offset += len(page['ids'])
+
+        except Exception as e:
+            self.db.invalidate_collection()
+            self._reconcile_failed_at = time.monotonic()
+            self.logger.error(f"Failed to reconcile knowledge stats: {e}")
+            return {}
+
+        self._reconcile_failed_at = None
+        self._replace_counters(total, content_types, games)
+        self.logger.info(f"Reconciled knowledge stats: {total} entries, {len(games)} games")
+        return {"total": total, "content_types": dict(content_types), "games": len(games)}
+
+    def reset(self):
+        self._replace_counters(0, {}, {})
+
+    def _replace_counters(self, total: int, content_types: Dict[str, int], games: Dict[str, int]):
+        rows = [(self.TOTAL_SCOPE, "", total)] if total else []
+        rows += [(self.CONTENT_TYPE_SCOPE, key, count) for key, count in content_types.items()]
+        rows += [(self.GAME_SCOPE, key, count) for key, count in games.items()]
+
+        connection = self.connection
+        if not connection:
+            return
+
+        with self._lock:
+            connection.execute("DELETE FROM counters")
+            connection.executemany(
+                "INSERT INTO counters (scope, key, count) VALUES (?, ?, ?)", rows
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('reconciled_at', ?)",
+                (datetime.utcnow().isoformat(),)
+            )
+            connection.commit()
@@ -0,0 +1,67 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+HP_CHANGE_RANGE = (-50, 50)
+EXP_GAIN_RANGE = (0, 100)
+MAX_SUGGESTED_ACTIONS = 3
+
+
+class GameEffects(BaseModel):
+    player_hp_change: int = 0
+    player_exp_gain: int = 0
+    item_gain: Optional[str] = None
+
+
+class GameEvent(BaseModel):
+    turn: int = 0
+    narrative: str
+    effects: GameEffects = GameEffects()
+    suggested_actions: List[str] = []
+
+
+GAME_EVENT_JSON_SCHEMA = {
+    "name": "game_event",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "additionalProperties": False,
+        "required": ["turn", "narrative", "effects", "suggested_actions"],
+        "properties": {
+            "turn": {"type": "integer"},
+            "narrative": {"type": "string"},
+            "effects": {
+                "type": "object",
+                "additionalProperties": False,
+                "required": ["player_hp_change", "player_exp_gain", "item_gain"],
+                "properties": {
+                    "player_hp_change": {"type": "integer"},
+                    "player_exp_gain": {"type": "integer"},
+                    "item_gain": {"type": ["string", "null"]}
+                }
+            },
+            "suggested_actions": {
+                "type": "array",
+                "items": {"type": "string"}
+            }
+        }
+    }
+}
+
+# Used when the local rules engine has already resolved the effects and the model only narrates
+NARRATION_JSON_SCHEMA = {
+    "name": "game_narration",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "additionalProperties": False,
+        "required": ["narrative", "suggested_actions"],
+        "properties": {
+            "narrative": {"type": "string"},
+            "suggested_actions": {
+                "type": "array",
+                "items": {"type": "string"}
+            }
+        }
+    }
+}
@@ -0,0 +1,101 @@
+import sys
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from .game_state import GameState, GameStatus, Language, Player
+
+
+class PlayerSession:
+    """Slotted, mutable counterpart of Player kept for every live game."""
+
+    __slots__ = ("name", "hp", "max_hp", "experience", "level", "inventory", "location")
+
+    def __init__(self, name: str = "Adventurer", hp: int = 100, max_hp: int = 100, experience: int = 0,
+                 level: int = 1, inventory: Iterable[str] = (), location: str = "entrance"):
+        self.name = sys.intern(name)
+        self.hp = hp
+        self.max_hp = max_hp
+        self.experience = experience
+        self.level = level
+        # Item names repeat across thousands of games; interning keeps one copy of each
+        self.inventory: Tuple[str, ...] = tuple(sys.intern(item) for item in inventory)
+        self.location = sys.intern(location)
+
+    def add_item(self, item: str) -> bool:
+        if item in self.inventory:
+            return False
+        self.inventory += (sys.intern(item),)
+        return True
+
+    def to_model(self) -> Player:
+        return Player(name=self.name, hp=self.hp, max_hp=self.max_hp, experience=self.experience,
+                      level=self.level, inventory=list(self.inventory), location=self.location)
+
+    @classmethod
+    def from_model(cls, player: Player) -> "PlayerSession":
+        return cls(player.name, player.hp, player.max_hp, player.experience,
+                   player.level, player.inventory, player.location)
+
+
+class GameSession:
+    """Slotted in-memory game; pydantic GameState is only built at the API and journal boundary.
+
+    Status and language hold the shared enum members, recent turns are kept as raw
+    (action, narrative) pairs, and the previous event reuses the latest narrative rather
+    than storing a formatted copy of it.
+    """
+
+    __slots__ = ("game_id", "player", "status", "turn_count", "recent_turns", "current_scene",
+                 "language", "finished_at", "last_event")
+
+    def __init__(self, game_id: str, player: Optional[PlayerSession] = None,
+                 status: GameStatus = GameStatus.ACTIVE, turn_count: int = 0,
+                 language: Language = Language.EN, finished_at: Optional[datetime] = None):
+        self.game_id = game_id
+        self.player = player or PlayerSession()
+        self.status = status
+        self.turn_count = turn_count
+        self.recent_turns: Tuple[Tuple[str, str], ...] = ()
+        self.current_scene = ""
+        self.language = language
+        self.finished_at = finished_at
+        # (turn, narrative) of the latest turn that advanced the game
+        self.last_event: Optional[Tuple[int, str]] = None
+
+    @property
+    def story_history(self) -> List[str]:
+        history = []
+        for action, narrative in self.recent_turns:
+            history.append(f"Player: {action}")
+            history.append(f"Game: {narrative}")
+        return history
+
+    @property
+    def previous_event(self) -> str:
+        if self.last_event is None:
+            return ""
+        turn, narrative = self.last_event
+        return f"[Turn {turn}] {narrative}"
+
+    def to_model(self) -> GameState:
+        return GameState(
+            game_id=self.game_id,
+            player=self.player.to_model(),
+            status=self.status,
+            turn_count=self.turn_count,
+            story_history=self.story_history,
+            current_scene=self.current_scene,
+            language=self.language,
+            finished_at=self.finished_at
+        )
+
+    @classmethod
+    def from_model(cls, game_state: GameState) -> "GameSession":
+        session = cls(game_state.game_id, PlayerSession.from_model(game_state.player), game_state.status,
+                      game_state.turn_count, game_state.language, game_state.finished_at)
+        session.current_scene = game_state.current_scene
+        history = game_state.story_history
+        session.recent_turns = tuple(
+            (history[i][len("Player: "):], history[i + 1][len("Game: "):])
+            for i in range(0, len(history) - 1, 2)
+        )
+        return session
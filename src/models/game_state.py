@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Dict, Optional
+from datetime import datetime
 from enum import Enum
 
 
@@ -32,6 +33,7 @@ class GameState(BaseModel):
     story_history: List[str] = []
     current_scene: str = ""
     language: Language = Language.EN
+    finished_at: Optional[datetime] = None
 
 
 class PlayerAction(BaseModel):
@@ -39,6 +41,12 @@ class PlayerAction(BaseModel):
     game_id: str
 
 
+class BatchActionRequest(BaseModel):
+    # Validated up front: the response streams, so later errors could not change its status
+    actions: List[PlayerAction] = Field(min_length=1, max_length=256)
+    concurrency: Optional[int] = Field(default=None, ge=1, le=64)
+
+
 class GameResponse(BaseModel):
     game_id: str
     narrative: str
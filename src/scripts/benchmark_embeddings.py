@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+
+import asyncio
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+from dotenv import load_dotenv
+load_dotenv()
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from src.services.vector_service import VectorService
+
+
+def load_corpus(vector_service: VectorService, max_docs: int):
+    """Read stored ids, content types and vectors from the configured collection"""
+    collection = vector_service.database_model.get_collection()
+    ids, content_types, vectors = [], [], []
+    offset = 0
+    while len(ids) < max_docs:
+        page = collection.get(limit=min(500, max_docs - len(ids)), offset=offset,
+                              include=["embeddings", "metadatas"])
+        if not page["ids"]:
+            break
+        ids.extend(page["ids"])
+        content_types.extend(metadata.get("content_type", "") for metadata in page["metadatas"])
+        vectors.extend(page["embeddings"])
+        offset += len(page["ids"])
+    return ids, content_types, np.asarray(vectors, dtype=np.float32)
+
+
+async def embed_queries(vector_service: VectorService, path: str) -> np.ndarray:
+    """Embed query texts (one per line) at the model's native width"""
+    texts = [line.strip() for line in Path(path).read_text(encoding="utf-8").splitlines() if line.strip()]
+    embedding_model = vector_service.embedding_model
+    embedding_model.dimensions = 0
+    embeddings = await embedding_model.get_embeddings(texts)
+    return np.asarray([e for e in embeddings if e], dtype=np.float32)
+
+
+def normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def project(matrix: np.ndarray, dimensions: int, precision: str) -> np.ndarray:
+    """Matryoshka truncation followed by the cache's quantization round trip"""
+    projected = normalize(matrix[:, :dimensions])
+    if precision == "float16":
+        return projected.astype(np.float16).astype(np.float32)
+    if precision == "int8":
+        scale = np.abs(projected).max(axis=1, keepdims=True) / 127
+        scale = np.where(scale == 0, 1, scale)
+        return np.round(projected / scale).astype(np.int8).astype(np.float32) * scale
+    return projected
+
+
+def top_k(corpus: np.ndarray, queries: np.ndarray, k: int, exclude) -> list:
+    scores = queries @ corpus.T
+    if exclude is not None:
+        scores[np.arange(len(queries)), exclude] = -np.inf
+    return [set(row) for row in np.argsort(-scores, axis=1)[:, :k]]
+
+
+def recall(truth: list, found: list) -> float:
+    return sum(len(t & f) / len(t) for t, f in zip(truth, found)) / len(truth)
+
+
+def bench_hnsw(corpus: np.ndarray, queries: np.ndarray, k: int, exclude):
+    """Build a throwaway in-memory HNSW index and time single-query lookups"""
+    import chromadb
+
+    client = chromadb.EphemeralClient()
+    collection = client.create_collection(f"bench_{uuid.uuid4().hex[:8]}", metadata={"hnsw:space": "cosine"})
+    ids = [str(i) for i in range(len(corpus))]
+    for start in range(0, len(ids), 5000):
+        collection.add(ids=ids[start:start + 5000], embeddings=corpus[start:start + 5000].tolist())
+
+    found = []
+    n_results = min(len(ids), k + (1 if exclude is not None else 0))
+    start = time.perf_counter()
+    for index, query in enumerate(queries):
+        result = collection.query(query_embeddings=[query.tolist()], n_results=n_results, include=[])
+        hits = [int(i) for i in result["ids"][0] if exclude is None or int(i) != exclude[index]]
+        found.append(set(hits[:k]))
+    elapsed = time.perf_counter() - start
+    client.delete_collection(collection.name)
+    return found, elapsed / len(queries) * 1000
+
+
+async def main():
+    """Compare recall and latency of reduced-width and quantized embedding profiles"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark recall vs latency for embedding profiles")
+    parser.add_argument("--dimensions", "-d", default="1536,1024,512,256",
+                       help="Comma separated widths to test")
+    parser.add_argument("--precisions", "-p", default="float32,float16,int8",
+                       help="Comma separated precisions to test")
+    parser.add_argument("--queries", "-q", type=str,
+                       help="File with one query per line (needs OPENAI_API_KEY); "
+                            "defaults to stored game events queried against the rest of the collection")
+    parser.add_argument("--num-queries", "-n", type=int, default=200,
+                       help="Stored events sampled as queries when --queries is not given")
+    parser.add_argument("--max-docs", type=int, default=50000,
+                       help="Upper bound on documents read from the collection")
+    parser.add_argument("--k", type=int, default=5,
+                       help="Neighbours compared for recall@k")
+    parser.add_argument("--no-hnsw", action="store_true",
+                       help="Skip the Chroma HNSW timings")
+    args = parser.parse_args()
+
+    vector_service = VectorService()
+    ids, content_types, corpus = load_corpus(vector_service, args.max_docs)
+    if not len(ids):
+        print("Collection is empty; run src/scripts/init_chroma_db.py and play a few games first")
+        sys.exit(1)
+
+    native_dimensions = corpus.shape[1]
+    corpus = normalize(corpus)
+
+    if args.queries:
+        queries = normalize(await embed_queries(vector_service, args.queries))
+        exclude = None
+    else:
+        # Game events are what the turn pipeline retrieves, so they make the most realistic queries
+        candidates = [i for i, content_type in enumerate(content_types) if content_type == "game_event"] or list(range(len(ids)))
+        rng = random.Random(0)
+        exclude = np.asarray(rng.sample(candidates, min(args.num_queries, len(candidates))))
+        queries = corpus[exclude]
+
+    k = min(args.k, len(ids) - (1 if exclude is not None else 0))
+    truth = top_k(corpus, queries, k, exclude)
+
+    print(f"Collection: {vector_service.database_model.collection_name}  documents: {len(ids)}  "
+          f"native dims: {native_dimensions}  queries: {len(queries)}  k: {k}")
+    print(f"{'dims':>6}{'precision':>10}{'bytes/vec':>11}{'recall':>9}{'flat ms/q':>11}{'hnsw recall':>13}{'hnsw ms/q':>11}")
+
+    for dimensions in [int(d) for d in args.dimensions.split(",")]:
+        if dimensions > native_dimensions:
+            continue
+        for precision in args.precisions.split(","):
+            projected_corpus = project(corpus, dimensions, precision)
+            projected_queries = project(queries, dimensions, "float32")
+
+            start = time.perf_counter()
+            found = top_k(projected_corpus, projected_queries, k, exclude)
+            flat_ms = (time.perf_counter() - start) / len(queries) * 1000
+
+            width = {"float32": 4, "float16": 2, "int8": 1}[precision]
+            bytes_per_vector = dimensions * width + (4 if precision == "int8" else 0)
+
+            hnsw_recall, hnsw_ms = "-", "-"
+            # Chroma stores float32 only, so HNSW is measured once per width
+            if not args.no_hnsw and precision == "float32":
+                hnsw_found, elapsed_ms = bench_hnsw(projected_corpus, projected_queries, k, exclude)
+                hnsw_recall, hnsw_ms = f"{recall(truth, hnsw_found):.3f}", f"{elapsed_ms:.2f}"
+
+            print(f"{dimensions:>6}{precision:>10}{bytes_per_vector:>11}{recall(truth, found):>9.3f}"
+                  f"{flat_ms:>11.3f}{hnsw_recall:>13}{hnsw_ms:>11}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
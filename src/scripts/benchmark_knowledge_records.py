@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.chroma.knowledge_base import KnowledgeBase
+from src.models.chroma.knowledge_record import KnowledgeRecord
+
+
+def build_documents(count: int):
+    """Build a mix of monster and game event payloads shaped like real writes"""
+    documents = []
+    for i in range(count):
+        if i % 2:
+            documents.append((
+                "monster",
+                f"monster_{i}",
+                f"Monster {i}",
+                f"Name: Monster {i}\nDescription: A fearsome creature.\nHP: 100, Attack: 40, Defense: 25\n",
+                {
+                    "name": f"Monster {i}",
+                    "description": "A fearsome creature lurking in the dark.",
+                    "stats": {"hp": 100, "attack": 40, "defense": 25, "speed": 30},
+                    "abilities": ["Brutal Swing", "Rage", "Intimidate"],
+                    "type": "common",
+                    "element": "none",
+                    "loot": ["Orc Tooth", "Iron Club", "Leather Hide"]
+                }
+            ))
+        else:
+            documents.append((
+                "game_event",
+                f"game_{i}_turn_{i % 10}",
+                f"Turn {i % 10} - Hero",
+                f"[Turn {i % 10}] The hero fights a goblin. Status changes: HP-5, EXP+15",
+                {
+                    "game_id": f"game_{i}",
+                    "turn": i % 10,
+                    "player_name": "Hero",
+                    "hp_after": 95,
+                    "exp_after": 15,
+                    "created_at": datetime.utcnow().isoformat()
+                }
+            ))
+    return documents
+
+
+def bench_pydantic(documents):
+    """Original path: KnowledgeBase construction, to_chroma_document and from_chroma_result"""
+    start = time.perf_counter()
+    flattened = []
+    for content_type, content_id, title, content, metadata in documents:
+        knowledge = KnowledgeBase(
+            content_type=content_type,
+            content_id=content_id,
+            title=title,
+            content=content,
+            metadata=metadata,
+            created_at=datetime.now(),
+            updated_at=datetime.now()
+        )
+        flattened.append(knowledge.to_chroma_document())
+    write_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for doc in flattened:
+        KnowledgeBase.from_chroma_result(doc["id"], doc["document"], doc["metadata"])
+    read_time = time.perf_counter() - start
+    return write_time, read_time
+
+
+def bench_records(documents):
+    """Compact path: KnowledgeRecord with precompiled per-content-type flattening"""
+    start = time.perf_counter()
+    flattened = []
+    for content_type, content_id, title, content, metadata in documents:
+        now = datetime.now().isoformat()
+        record = KnowledgeRecord(content_type, content_id, title, content, metadata, now, now)
+        flattened.append(record.to_chroma())
+    write_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for doc_id, document, metadata in flattened:
+        KnowledgeRecord.from_chroma(doc_id, document, metadata)
+    read_time = time.perf_counter() - start
+    return write_time, read_time
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark knowledge document (de)serialization paths")
+    parser.add_argument("--count", "-n", type=int, default=50000,
+                       help="Number of documents to process")
+    args = parser.parse_args()
+
+    documents = build_documents(args.count)
+
+    print(f"Documents: {args.count}")
+    print(f"{'path':<16}{'write us/doc':>14}{'read us/doc':>14}")
+    for name, bench in (("KnowledgeBase", bench_pydantic), ("KnowledgeRecord", bench_records)):
+        write_time, read_time = bench(documents)
+        print(f"{name:<16}{write_time / args.count * 1e6:>14.2f}{read_time / args.count * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.game_session import GameSession, PlayerSession
+from src.models.game_state import GameState, GameStatus, Language, Player
+
+ITEMS = ["Healing Potion", "Rusty Sword", "Iron Shield", "Spider Silk", "Dragon Scale", "Magic Scroll"]
+RECENT_TURNS = 3
+
+
+def build_turns(seed: int, narrative_chars: int):
+    """Per-game turns shaped like parsed LLM events: fresh (non-shared) strings for every game"""
+    rng = random.Random(seed)
+    turns = []
+    for turn in range(1, rng.randint(1, 9) + 1):
+        payload = {
+            "action": rng.choice(["explore the hall", "attack goblin", "search for items", "rest"]),
+            "narrative": f"Turn {turn}: " + "The torchlight flickers as you press on. " * (narrative_chars // 41),
+            "hp": -rng.randint(0, 15),
+            "exp": rng.randint(5, 30),
+            "item": rng.choice(ITEMS) if rng.random() < 0.4 else None
+        }
+        # Round-trip through JSON so strings are allocated per game, as the event parser does
+        turns.append(json.loads(json.dumps(payload)))
+    return turns
+
+
+def apply_turn(state, turn: int, event):
+    player = state.player
+    state.turn_count = turn
+    player.hp = max(0, min(player.hp + event["hp"], player.max_hp))
+    player.experience += event["exp"]
+    if player.experience >= player.level * 100:
+        player.level += 1
+        player.max_hp += 10
+        player.hp = player.max_hp
+
+
+def build_pydantic(game_id: str, turns, previous_events):
+    """Original layout: GameState/Player models plus a formatted previous event per game"""
+    state = GameState(game_id=game_id, player=Player(name="Adventurer"), language=Language.EN)
+    for turn, event in enumerate(turns, 1):
+        apply_turn(state, turn, event)
+        if event["item"] and event["item"] not in state.player.inventory:
+            state.player.inventory.append(event["item"])
+        state.story_history.append(f"Player: {event['action']}")
+        state.story_history.append(f"Game: {event['narrative']}")
+        del state.story_history[:-RECENT_TURNS * 2]
+        previous_events[game_id] = f"[Turn {turn}] {event['narrative']}"
+    return state
+
+
+def build_session(game_id: str, turns, previous_events):
+    """Compact layout: slotted session, interned items, narrative shared with the previous event"""
+    state = GameSession(game_id, PlayerSession(name="Adventurer"), GameStatus.ACTIVE, language=Language.EN)
+    for turn, event in enumerate(turns, 1):
+        apply_turn(state, turn, event)
+        if event["item"]:
+            state.player.add_item(event["item"])
+        state.recent_turns = (state.recent_turns + ((event["action"], event["narrative"]),))[-RECENT_TURNS:]
+        state.last_event = (turn, event["narrative"])
+    return state
+
+
+def measure(build, sessions: int, narrative_chars: int) -> float:
+    """Bytes retained per game, including its entry in the games dict"""
+    game_ids = [f"game-{i:08d}" for i in range(sessions)]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    games = {}
+    previous_events = {}
+    for i, game_id in enumerate(game_ids):
+        # The event payloads are transient; only what the layout retains is counted
+        games[game_id] = build(game_id, build_turns(i, narrative_chars), previous_events)
+
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del games, previous_events
+    return retained / sessions
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark bytes per active game for session layouts")
+    parser.add_argument("--sessions", type=str, default="10000,100000",
+                       help="Comma-separated concurrent session counts")
+    parser.add_argument("--narrative-chars", type=int, default=240,
+                       help="Approximate narrative length per turn")
+    args = parser.parse_args()
+
+    counts = [int(count) for count in args.sessions.split(",")]
+    print(f"{'path':<14}{'sessions':>10}{'bytes/game':>12}{'total MB':>10}")
+    for count in counts:
+        for name, build in (("GameState", build_pydantic), ("GameSession", build_session)):
+            per_game = measure(build, count, args.narrative_chars)
+            print(f"{name:<14}{count:>10}{per_game:>12.0f}{per_game * count / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Runs in a fresh interpreter so every measurement is a cold start
+CHILD_SCRIPT = """
+import asyncio, json, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+from src.game_controller import GameController
+controller = GameController()
+constructed = time.perf_counter()
+asyncio.run(controller.initialize_backends())
+ready = time.perf_counter()
+print(json.dumps({
+    "import_main": imported - start,
+    "construct_controller": constructed - imported,
+    "initialize_backends": ready - constructed,
+    "total_to_ready": ready - start,
+    "backends": controller.backends
+}))
+"""
+
+STAGES = ("import_main", "construct_controller", "initialize_backends", "total_to_ready")
+
+
+def run_once(persist_directory: str) -> dict:
+    """Start one interpreter and time import, controller construction and backend warm-up"""
+    env = dict(os.environ, CHROMA_PERSIST_DIRECTORY=persist_directory, LOG_LEVEL="ERROR")
+    env.pop("SESSION_RECORDING_PATH", None)
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        cwd=str(project_root), env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark cold worker startup and time to ready")
+    parser.add_argument("--runs", "-n", type=int, default=5,
+                       help="Number of cold starts to measure")
+    parser.add_argument("--persist-directory", "-d",
+                       help="ChromaDB directory to open (defaults to a fresh temporary one)")
+    args = parser.parse_args()
+
+    persist_directory = args.persist_directory or tempfile.mkdtemp(prefix="startup_bench_")
+    runs = [run_once(persist_directory) for _ in range(args.runs)]
+
+    print(f"Runs: {args.runs}  ChromaDB: {persist_directory}")
+    print(f"Backends: {runs[-1]['backends']}")
+    print(f"{'stage':<24}{'median ms':>12}{'max ms':>12}")
+    for stage in STAGES:
+        samples = [run[stage] * 1000 for run in runs]
+        print(f"{stage:<24}{statistics.median(samples):>12.1f}{max(samples):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,243 +10,10 @@ load_dotenv()
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.data import SAMPLE_MONSTERS, SAMPLE_ITEMS
 from src.services.vector_service import VectorService
 from src.utils.logger import setup_logger
 
-SAMPLE_MONSTERS = {
-    # Boss Level
-    "fire_dragon": {
-        "name": "Fire Dragon",
-        "description": "A massive red dragon that breathes scorching flames. Its scales shimmer like molten lava and its eyes burn with ancient fury. Known to hoard treasure in volcanic caves. This legendary beast can incinerate entire armies with a single breath.",
-        "stats": {"hp": 500, "attack": 85, "defense": 60, "speed": 40},
-        "abilities": ["Fire Breath", "Wing Attack", "Tail Swipe", "Intimidate"],
-        "type": "boss",
-        "element": "fire",
-        "loot": ["Dragon Scale", "Fire Gem", "Ancient Coin"]
-    },
-    "ice_queen": {
-        "name": "Ice Queen",
-        "description": "An ancient sorceress trapped in eternal ice. Her beauty is matched only by her cruelty. She commands blizzards and can freeze enemies solid with a glance.",
-        "stats": {"hp": 450, "attack": 70, "defense": 80, "speed": 30},
-        "abilities": ["Blizzard", "Ice Prison", "Frost Nova", "Frozen Heart"],
-        "type": "boss",
-        "element": "ice",
-        "loot": ["Ice Crown", "Frozen Tear", "Eternal Crystal"]
-    },
-
-    # Elite Level
-    "shadow_wolf": {
-        "name": "Shadow Wolf",
-        "description": "A ghostly wolf that emerges from darkness. Its form flickers between solid and ethereal, making it difficult to target. Hunts in packs during moonless nights.",
-        "stats": {"hp": 120, "attack": 45, "defense": 25, "speed": 70},
-        "abilities": ["Shadow Strike", "Phase Step", "Howl"],
-        "type": "elite",
-        "element": "dark",
-        "loot": ["Shadow Essence", "Wolf Fang"]
-    },
-    "stone_golem": {
-        "name": "Stone Golem",
-        "description": "A massive construct of ancient stone and magic. Its rocky hide deflects most attacks, and its fists can crush bones to powder. Created by forgotten wizards to guard sacred places.",
-        "stats": {"hp": 200, "attack": 60, "defense": 80, "speed": 20},
-        "abilities": ["Rock Slam", "Stone Skin", "Earthquake"],
-        "type": "elite",
-        "element": "earth",
-        "loot": ["Stone Core", "Magic Rune", "Heavy Boulder"]
-    },
-    "lightning_eagle": {
-        "name": "Lightning Eagle",
-        "description": "A majestic bird wreathed in crackling electricity. Its piercing cry can summon thunderstorms, and its talons deliver shocking strikes.",
-        "stats": {"hp": 100, "attack": 55, "defense": 30, "speed": 90},
-        "abilities": ["Lightning Strike", "Thunder Call", "Wind Slash"],
-        "type": "elite",
-        "element": "lightning",
-        "loot": ["Storm Feather", "Lightning Gem", "Wind Crystal"]
-    },
-
-    # Common Level
-    "goblin_warrior": {
-        "name": "Goblin Warrior",
-        "description": "A small but fierce green-skinned humanoid wielding crude weapons. Despite their size, goblins are cunning fighters who use numbers and dirty tactics to their advantage.",
-        "stats": {"hp": 60, "attack": 25, "defense": 15, "speed": 55},
-        "abilities": ["Backstab", "Throw Rock", "Battle Cry"],
-        "type": "common",
-        "element": "none",
-        "loot": ["Rusty Dagger", "Goblin Ear", "Small Coin"]
-    },
-    "skeleton_warrior": {
-        "name": "Skeleton Warrior",
-        "description": "The reanimated bones of a fallen soldier. These undead guardians fight with the muscle memory of their past lives, wielding ancient weapons with deadly precision.",
-        "stats": {"hp": 80, "attack": 30, "defense": 20, "speed": 35},
-        "abilities": ["Bone Strike", "Rattle", "Death Grip"],
-        "type": "common",
-        "element": "undead",
-        "loot": ["Bone Fragment", "Rusty Armor", "Ancient Coin"]
-    },
-    "cave_spider": {
-        "name": "Cave Spider",
-        "description": "A venomous arachnid the size of a large dog. Its bite injects paralytic poison, and it can web enemies to immobilize them before striking.",
-        "stats": {"hp": 40, "attack": 35, "defense": 10, "speed": 65},
-        "abilities": ["Poison Bite", "Web Trap", "Leap Attack"],
-        "type": "common",
-        "element": "poison",
-        "loot": ["Spider Silk", "Poison Gland", "Spider Leg"]
-    },
-    "orc_brute": {
-        "name": "Orc Brute",
-        "description": "A hulking green-skinned humanoid with immense physical strength. Orcs are savage warriors who prefer brute force over strategy.",
-        "stats": {"hp": 100, "attack": 40, "defense": 25, "speed": 30},
-        "abilities": ["Brutal Swing", "Rage", "Intimidate"],
-        "type": "common",
-        "element": "none",
-        "loot": ["Orc Tooth", "Iron Club", "Leather Hide"]
-    },
-    "fire_imp": {
-        "name": "Fire Imp",
-        "description": "A mischievous demonic creature wreathed in flames. Small but agile, it delights in burning everything it touches.",
-        "stats": {"hp": 50, "attack": 30, "defense": 15, "speed": 70},
-        "abilities": ["Fireball", "Flame Dash", "Burn"],
-        "type": "common",
-        "element": "fire",
-        "loot": ["Imp Horn", "Fire Essence", "Sulfur"]
-    }
-}
-
-SAMPLE_ITEMS = {
-    # Consumables
-    "healing_potion": {
-        "name": "Healing Potion",
-        "description": "A glowing red liquid in a crystal vial. When consumed, it instantly restores health through magical regeneration. The potion tastes of mint and honey.",
-        "type": "consumable",
-        "effects": "Restores 50 HP instantly",
-        "value": 25,
-        "rarity": "common"
-    },
-    "mana_potion": {
-        "name": "Mana Potion",
-        "description": "A shimmering blue elixir that sparkles with arcane energy. Drinking it restores magical power and clarity of mind.",
-        "type": "consumable",
-        "effects": "Restores 30 MP instantly",
-        "value": 30,
-        "rarity": "common"
-    },
-    "strength_elixir": {
-        "name": "Elixir of Strength",
-        "description": "A thick, golden potion that enhances physical prowess. The drinker feels their muscles surge with temporary power.",
-        "type": "consumable",
-        "effects": "Increases attack by 15 for 5 turns",
-        "value": 75,
-        "rarity": "uncommon"
-    },
-    "phoenix_feather": {
-        "name": "Phoenix Feather",
-        "description": "A radiant feather from the legendary phoenix. It glows with the power of rebirth and can bring the dead back to life.",
-        "type": "consumable",
-        "effects": "Fully revives and heals to maximum HP",
-        "value": 500,
-        "rarity": "legendary"
-    },
-
-    # Weapons
-    "rusty_sword": {
-        "name": "Rusty Sword",
-        "description": "An old, weathered blade showing signs of age and neglect. Despite its appearance, it still holds an edge.",
-        "type": "weapon",
-        "effects": "Increases attack by 5",
-        "value": 10,
-        "rarity": "common"
-    },
-    "fire_sword": {
-        "name": "Flaming Sword",
-        "description": "An enchanted blade wreathed in eternal flames. The fire never dies and burns hotter in battle. Forged by ancient fire mages in the volcanic depths.",
-        "type": "weapon",
-        "effects": "Increases attack by 30, adds fire damage",
-        "value": 500,
-        "rarity": "rare",
-        "requirements": "Level 10+"
-    },
-    "ice_staff": {
-        "name": "Staff of Eternal Ice",
-        "description": "A crystalline staff that never melts, no matter how hot the environment. It channels the power of endless winter.",
-        "type": "weapon",
-        "effects": "Increases magic attack by 35, adds ice damage",
-        "value": 600,
-        "rarity": "rare",
-        "requirements": "Intelligence 20+"
-    },
-    "dragon_slayer": {
-        "name": "Dragon Slayer",
-        "description": "A legendary sword forged from meteorite metal and dragon bone. Its blade can cut through the thickest dragon scales.",
-        "type": "weapon",
-        "effects": "Increases attack by 50, +100% damage vs dragons",
-        "value": 2000,
-        "rarity": "legendary",
-        "requirements": "Level 25+, Strength 30+"
-    },
-
-    # Armor
-    "leather_armor": {
-        "name": "Leather Armor",
-        "description": "Basic protection made from tanned animal hide. Lightweight and flexible, perfect for beginners.",
-        "type": "armor",
-        "effects": "Increases defense by 8",
-        "value": 50,
-        "rarity": "common"
-    },
-    "shadow_cloak": {
-        "name": "Cloak of Shadows",
-        "description": "A dark cloak that seems to absorb light around it. When worn, the wearer becomes one with the shadows, gaining the ability to move unseen.",
-        "type": "armor",
-        "effects": "Increases stealth by 25, reduces enemy accuracy by 15%",
-        "value": 300,
-        "rarity": "uncommon",
-        "requirements": "Agility 15+"
-    },
-    "plate_mail": {
-        "name": "Steel Plate Mail",
-        "description": "Heavy armor crafted from reinforced steel plates. Provides excellent protection but limits mobility.",
-        "type": "armor",
-        "effects": "Increases defense by 25, reduces speed by 10",
-        "value": 400,
-        "rarity": "uncommon",
-        "requirements": "Strength 18+"
-    },
-    "dragon_scale_armor": {
-        "name": "Dragon Scale Armor",
-        "description": "Armor crafted from the impenetrable scales of an ancient dragon. It provides unmatched protection and resistance to magical attacks.",
-        "type": "armor",
-        "effects": "Increases defense by 40, magic resistance +30%",
-        "value": 1500,
-        "rarity": "legendary",
-        "requirements": "Level 20+, Constitution 25+"
-    },
-
-    # Accessories
-    "ring_of_power": {
-        "name": "Ring of Power",
-        "description": "A simple gold band that radiates with inner energy. It enhances the wearer's natural abilities.",
-        "type": "accessory",
-        "effects": "Increases all stats by 5",
-        "value": 200,
-        "rarity": "uncommon"
-    },
-    "amulet_of_health": {
-        "name": "Amulet of Health",
-        "description": "A jade pendant carved with ancient healing runes. It continuously mends minor wounds and boosts vitality.",
-        "type": "accessory",
-        "effects": "Increases max HP by 50, HP regeneration +2 per turn",
-        "value": 350,
-        "rarity": "rare"
-    },
-    "boots_of_speed": {
-        "name": "Boots of Speed",
-        "description": "Enchanted boots that make the wearer swift as the wind. They leave no tracks and make no sound.",
-        "type": "accessory",
-        "effects": "Increases speed by 20, grants double movement",
-        "value": 280,
-        "rarity": "rare"
-    }
-}
-
 
 class ChromaDBInitializer:
     def __init__(self):
@@ -324,6 +91,7 @@ class ChromaDBInitializer:
 
             # Use database model's reset function
             success = self.vector_service.database_model.reset_database()
+            self.vector_service.stats_model.reset()
             if success:
                 self.logger.info("✅ Database reset successful")
             else:
@@ -402,6 +170,45 @@ class ChromaDBInitializer:
         except Exception as e:
             self.logger.warning(f"⚠️ Failed to display summary: {e}")
 
+    async def reconcile_stats(self):
+        """Rebuild the maintained knowledge counters from the store"""
+        try:
+            self.logger.info("🧮 Reconciling knowledge stats...")
+
+            if not self.vector_service:
+                self.vector_service = VectorService()
+
+            result = self.vector_service.reconcile_knowledge_stats()
+            if not result:
+                self.logger.error("❌ Failed to reconcile knowledge stats")
+                return False
+
+            self.logger.info(f"✅ Reconciled {result['total']} entries across {result['games']} games")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"❌ Failed to reconcile knowledge stats: {e}")
+            return False
+
+    async def compact_storage(self):
+        """VACUUM the SQLite store; run while the game server is stopped"""
+        try:
+            if not self.vector_service:
+                self.vector_service = VectorService()
+
+            before = self.vector_service.get_storage_size()
+            if not self.vector_service.compact_storage():
+                self.logger.error("❌ Failed to compact ChromaDB store")
+                return False
+
+            after = self.vector_service.get_storage_size()
+            self.logger.info(f"✅ Compacted ChromaDB store, reclaimed {max(0, before - after)} bytes")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"❌ Failed to compact ChromaDB store: {e}")
+            return False
+
     async def verify_data(self):
         """Verify that data was ingested correctly"""
         try:
@@ -484,6 +291,10 @@ async def main():
                        help="Path to custom JSON data file")
     parser.add_argument("--skip-api-check", action="store_true",
                        help="Skip OpenAI API key check (for testing)")
+    parser.add_argument("--reconcile-stats", action="store_true",
+                       help="Rebuild knowledge counters from the store and exit")
+    parser.add_argument("--compact", action="store_true",
+                       help="VACUUM the SQLite store (stop the server first) and exit")
 
     args = parser.parse_args()
 
@@ -493,6 +304,16 @@ async def main():
     initializer = ChromaDBInitializer()
 
     try:
+        if args.reconcile_stats:
+            success = await initializer.reconcile_stats()
+            if success:
+                await initializer.display_summary()
+            sys.exit(0 if success else 1)
+
+        if args.compact:
+            success = await initializer.compact_storage()
+            sys.exit(0 if success else 1)
+
         # Initialize with sample data
         success = await initializer.initialize(force_reset=args.force, skip_api_check=args.skip_api_check)
 
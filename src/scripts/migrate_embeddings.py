@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+load_dotenv()
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.chroma.embedding_model import truncate_embedding
+from src.services.vector_service import VectorService
+from src.utils.logger import setup_logger
+
+
+class EmbeddingMigrator:
+    def __init__(self, dimensions: int):
+        self.logger = setup_logger(__name__)
+        self.vector_service = VectorService()
+        self.database_model = self.vector_service.database_model
+        self.embedding_model = self.vector_service.embedding_model
+        self.embedding_model.dimensions = dimensions
+        # The target collection is stamped with the profile it is being migrated to
+        self.database_model.collection_metadata = self.embedding_model.get_profile()
+
+    def iter_pages(self, collection, batch_size: int, include):
+        """Yield pages of the source collection, ordered by Chroma's insertion order"""
+        offset = 0
+        while True:
+            page = collection.get(limit=batch_size, offset=offset, include=include)
+            if not page["ids"]:
+                return
+            yield page
+            offset += len(page["ids"])
+
+    async def migrate(self, source: str, target: str, mode: str, batch_size: int,
+                      drop_target: bool = False) -> bool:
+        """Copy source into target, re-projecting stored vectors or re-embedding the documents"""
+        client = self.database_model.client
+        if not client:
+            self.logger.error("❌ ChromaDB client not available")
+            return False
+
+        source_collection = client.get_collection(source)
+        source_profile = source_collection.metadata or {}
+        target_profile = self.embedding_model.get_profile()
+        target_dimensions = target_profile["embedding_dimensions"]
+
+        if mode == "reproject":
+            source_model = source_profile.get("embedding_model", self.embedding_model.model)
+            if source_model != self.embedding_model.model:
+                self.logger.error(f"❌ Cannot re-project {source_model} vectors into {self.embedding_model.model}; use --mode reembed")
+                return False
+        elif not self.embedding_model.client:
+            self.logger.error("❌ Re-embedding needs OPENAI_API_KEY")
+            return False
+
+        if drop_target:
+            try:
+                client.delete_collection(target)
+                self.logger.info(f"🗑️ Dropped existing collection {target}")
+            except Exception:
+                pass
+        self.database_model.invalidate_collection(target)
+        target_collection = self.database_model.get_or_create_collection(target)
+
+        include = ["documents", "metadatas"] + (["embeddings"] if mode == "reproject" else [])
+        migrated = 0
+        start = time.perf_counter()
+
+        for page in self.iter_pages(source_collection, batch_size, include):
+            if mode == "reproject":
+                embeddings = []
+                for embedding in page["embeddings"]:
+                    if target_dimensions and len(embedding) < target_dimensions:
+                        self.logger.error(f"❌ Source vectors have {len(embedding)} dimensions, fewer than {target_dimensions}; use --mode reembed")
+                        return False
+                    embeddings.append(truncate_embedding(list(map(float, embedding)), target_dimensions))
+            else:
+                embeddings = await self.embedding_model.get_embeddings(list(page["documents"]))
+                if any(embedding is None for embedding in embeddings):
+                    self.logger.error(f"❌ Embedding request failed after {migrated} documents")
+                    return False
+
+            target_collection.upsert(
+                ids=list(page["ids"]),
+                embeddings=embeddings,
+                documents=list(page["documents"]),
+                metadatas=list(page["metadatas"])
+            )
+            migrated += len(page["ids"])
+            self.logger.info(f"   migrated {migrated} documents")
+
+        elapsed = time.perf_counter() - start
+        self.logger.info(f"✅ Migrated {migrated} documents from {source} to {target} ({mode}, {target_dimensions} dims) in {elapsed:.1f}s")
+        self.logger.info(f"   Next: set CHROMA_COLLECTION_NAME={target} and EMBEDDING_DIMENSIONS={self.embedding_model.dimensions},")
+        self.logger.info("   then run src/scripts/init_chroma_db.py --reconcile-stats")
+        return True
+
+
+async def main():
+    """Migrate a knowledge collection to a new embedding profile"""
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description="Re-project or re-embed a ChromaDB collection for a new embedding profile")
+    parser.add_argument("--source", "-s", default=os.getenv("CHROMA_COLLECTION_NAME", "knowledge_base"),
+                       help="Collection to read from")
+    parser.add_argument("--target", "-t", required=True,
+                       help="Collection to write to")
+    parser.add_argument("--dimensions", "-d", type=int, default=int(os.getenv("EMBEDDING_DIMENSIONS", "0")),
+                       help="Target vector width (0 keeps the model's native width)")
+    parser.add_argument("--mode", "-m", choices=("reproject", "reembed"), default="reproject",
+                       help="reproject truncates stored vectors locally; reembed calls the embedding API")
+    parser.add_argument("--batch-size", "-b", type=int, default=500,
+                       help="Documents per page")
+    parser.add_argument("--drop-target", action="store_true",
+                       help="Delete the target collection first if it exists")
+    args = parser.parse_args()
+
+    if args.source == args.target:
+        parser.error("--source and --target must differ")
+
+    migrator = EmbeddingMigrator(args.dimensions)
+    success = await migrator.migrate(args.source, args.target, args.mode, args.batch_size, args.drop_target)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
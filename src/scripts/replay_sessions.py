@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+from dotenv import load_dotenv
+load_dotenv()
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.logger import setup_logger
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class SessionReplayer:
+    """Re-drives recorded games against recorded model responses.
+
+    By default each turn is served the events it retrieved when it was recorded, because
+    the scratch store cannot reproduce the live one (catalog, other games' events).
+    With store_snapshot, a copy of the live store taken before recording, retrieval runs
+    for real against it and the retrieved IDs are compared as well.
+    """
+
+    def __init__(self, recording_path: str, persist_directory: str, store_snapshot: Optional[str] = None):
+        self.logger = setup_logger(__name__)
+        self.recording_path = recording_path
+        self.live_retrieval = store_snapshot is not None
+        if store_snapshot:
+            shutil.copytree(store_snapshot, persist_directory, dirs_exist_ok=True)
+
+        # Replays must never touch the live store or append to a recording
+        os.environ["CHROMA_PERSIST_DIRECTORY"] = persist_directory
+        os.environ.pop("SESSION_RECORDING_PATH", None)
+        os.environ.pop("KNOWLEDGE_STATS_PATH", None)
+        os.environ["STORY_SUMMARY_MODE"] = "extractive"
+        os.environ.setdefault("OPENAI_API_KEY", "replay")
+
+        from src.game_controller import GameController
+        from src.services.session_recorder import SessionRecording, ReplayClient
+
+        self.recording = SessionRecording(recording_path)
+        self.controller = GameController()
+        self.replay_client = ReplayClient(self.recording)
+        self.controller.game_service.llm_service.client = self.replay_client
+        self.controller.game_service.vector_service.embedding_model.client = self.replay_client
+        self.retrieval_unavailable = 0
+        if not self.live_retrieval:
+            self._serve_recorded_retrieval()
+
+    def _serve_recorded_retrieval(self):
+        from src.services.session_recorder import recorded_retrieval
+
+        game_service = self.controller.game_service
+        live_search = game_service._search_relevant_events
+
+        async def search(game_state, action):
+            recorded = recorded_retrieval()
+            if recorded is None:
+                # Recorded before retrieved content was kept: searching the scratch store is the
+                # best available context, but its IDs are not compared
+                self.retrieval_unavailable += 1
+                return await live_search(game_state, action)
+            return [dict(event) for event in recorded]
+
+        game_service._search_relevant_events = search
+
+    async def replay_game(self, game_record, semaphore, report):
+        """Re-drive one recorded game turn by turn and diff it against the recording"""
+        from src.models.game_state import Language
+        from src.services.session_recorder import replay_turn, snapshot_state
+
+        async with semaphore:
+            game_id = self.controller.create_new_game(
+                game_record["n"], Language(game_record["l"]), game_id=game_record["g"]
+            )
+
+            for turn in self.recording.turns.get(game_id, []):
+                with replay_turn(turn) as frame:
+                    start = time.perf_counter()
+                    response = await self.controller.process_action(game_id, turn["a"])
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+
+                report["turns"] += 1
+                report["recorded_ms"].append(turn.get("ms", 0))
+                report["replayed_ms"].append(elapsed_ms)
+
+                if response is None:
+                    report["mismatches"].append({"game_id": game_id, "action": turn["a"], "field": "response"})
+                    continue
+
+                state = snapshot_state(self.controller.get_game(game_id))
+                if "s" in turn and state != turn["s"]:
+                    report["mismatches"].append({
+                        "game_id": game_id, "action": turn["a"], "field": "state",
+                        "recorded": turn["s"], "replayed": state
+                    })
+
+                if not self.live_retrieval:
+                    continue
+
+                recorded_ids = [event[0] for event in turn.get("r", [])]
+                replayed_ids = [event[0] for event in frame.get("r", [])]
+                if recorded_ids != replayed_ids:
+                    report["mismatches"].append({
+                        "game_id": game_id, "action": turn["a"], "field": "retrieval",
+                        "recorded": recorded_ids, "replayed": replayed_ids
+                    })
+
+    async def run(self, concurrency: int):
+        """Replay every recorded game and summarize behaviour and latency differences"""
+        report = {"games": len(self.recording.games), "turns": 0, "mismatches": [],
+                  "recorded_ms": [], "replayed_ms": []}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            self.replay_game(game_record, semaphore, report) for game_record in self.recording.games
+        ])
+        wall_time = time.perf_counter() - start
+
+        recorded, replayed = report.pop("recorded_ms"), report.pop("replayed_ms")
+        report["wall_time_s"] = round(wall_time, 3)
+        report["latency_ms"] = {
+            "recorded": {"mean": round(statistics.fmean(recorded), 2) if recorded else 0,
+                         "p50": percentile(recorded, 0.5), "p95": percentile(recorded, 0.95)},
+            "replayed": {"mean": round(statistics.fmean(replayed), 2) if replayed else 0,
+                         "p50": round(percentile(replayed, 0.5), 2), "p95": round(percentile(replayed, 0.95), 2)}
+        }
+        report["retrieval"] = "live" if self.live_retrieval else "recorded"
+        report["retrieval_unavailable"] = self.retrieval_unavailable
+        report["embedding_misses"] = self.replay_client.embeddings.misses
+        report["completion_misses"] = self.replay_client.chat.completions.misses
+        return report
+
+
+async def main():
+    """Main entry point for session replay"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay recorded Dungeon Quest sessions offline")
+    parser.add_argument("recording", type=str,
+                       help="Path to a recording written via SESSION_RECORDING_PATH")
+    parser.add_argument("--persist-dir", type=str,
+                       help="Scratch ChromaDB directory (defaults to a temporary directory)")
+    parser.add_argument("--store-snapshot", type=str,
+                       help="Copy of the live ChromaDB directory taken before recording; retrieval then "
+                            "runs against it and retrieved IDs are compared")
+    parser.add_argument("--concurrency", type=int, default=1,
+                       help="Number of games replayed concurrently")
+    parser.add_argument("--output", "-o", type=str,
+                       help="Write the JSON report to this file")
+
+    args = parser.parse_args()
+    logger = setup_logger("replay_sessions")
+
+    with tempfile.TemporaryDirectory(prefix="dq_replay_") as scratch:
+        replayer = SessionReplayer(args.recording, args.persist_dir or scratch, args.store_snapshot)
+        report = await replayer.run(args.concurrency)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    print(output)
+
+    if report["mismatches"]:
+        logger.warning(f"⚠️ {len(report['mismatches'])} behavioural mismatches found")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,9 +1,31 @@
 from .game_service import GameService
 from .llm_service import LLMService
 from .vector_service import VectorService
+from .retention_service import RetentionService
+from .prompt_builder import PromptBuilder
+from .story_memory import StoryMemory
+from .event_parser import EventParser
+from .session_recorder import SessionRecorder
+from .warmup_service import WarmupService
+from .rules_engine import RulesEngine
+from .intent_router import IntentRouter
+from .model_router import ModelRouter
+from .event_deduplicator import EventDeduplicator
+from .turn_journal import TurnJournal
 
 __all__ = [
     'GameService',
     'LLMService',
-    'VectorService'
+    'VectorService',
+    'RetentionService',
+    'PromptBuilder',
+    'StoryMemory',
+    'EventParser',
+    'SessionRecorder',
+    'WarmupService',
+    'RulesEngine',
+    'IntentRouter',
+    'ModelRouter',
+    'EventDeduplicator',
+    'TurnJournal'
 ]
\ No newline at end of file
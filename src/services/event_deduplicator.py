@@ -0,0 +1,66 @@
+import os
+import re
+from collections import deque
+from typing import Deque, Dict, FrozenSet, Iterable, Optional, Tuple
+from ..models.chroma.lexical_index import tokenize
+from ..utils.logger import setup_logger, SAMPLED
+from ..utils.metrics import metrics
+from ..utils.text_signature import simhash, hamming_distance, jaccard
+
+TURN_PREFIX = re.compile(r"^\[Turn \d+\]\s*")
+
+# (simhash, tokens, content_id) of one event
+Signature = Tuple[int, FrozenSet[str], str]
+
+
+class EventDeduplicator:
+    """Skips storing game events that nearly repeat one of the game's recent events."""
+
+    def __init__(self):
+        self.logger = setup_logger(__name__)
+        self.enabled = os.getenv("EVENT_DEDUP_ENABLED", "true").lower() == "true"
+        self.window = int(os.getenv("EVENT_DEDUP_WINDOW", "20"))
+        # SimHash bits out of 64 used as a cheap prefilter: unrelated narratives sit near 32,
+        # while a one-word edit of a short narrative can already move about 10 bits
+        self.max_distance = int(os.getenv("EVENT_DEDUP_MAX_DISTANCE", "12"))
+        # Token overlap that confirms a prefilter match as a near-duplicate
+        self.min_similarity = float(os.getenv("EVENT_DEDUP_MIN_SIMILARITY", "0.75"))
+        self.min_tokens = int(os.getenv("EVENT_DEDUP_MIN_TOKENS", "4"))
+        self.recent: Dict[str, Deque[Signature]] = {}
+
+    def signature(self, content: str) -> Tuple[int, FrozenSet[str]]:
+        # Turn numbers and HP/EXP figures are dropped by the tokenizer, leaving the narrative
+        tokens = tokenize(TURN_PREFIX.sub("", content))
+        return simhash(tokens), frozenset(tokens)
+
+    def check(self, game_id: str, content_id: str, content: str,
+              pending: Iterable[Signature] = ()) -> Optional[Signature]:
+        """Return the event's signature if it should be stored, None for a near-duplicate.
+
+        Nothing is remembered here: pass the signature to remember() once the store succeeded,
+        so a failed store does not suppress the retry. pending holds signatures accepted
+        earlier in the same batch.
+        """
+        if not self.enabled:
+            return 0, frozenset(), content_id
+
+        signature, tokens = self.signature(content)
+
+        # Very short narratives carry too few features to compare meaningfully
+        if len(tokens) >= self.min_tokens:
+            for previous, previous_tokens, previous_id in (*self.recent.get(game_id, ()), *pending):
+                if (hamming_distance(signature, previous) <= self.max_distance
+                        and jaccard(tokens, previous_tokens) >= self.min_similarity):
+                    metrics.increment("rag.dedup_skipped")
+                    self.logger.info("♻️ Skipping near-duplicate event %s (matches %s)", content_id, previous_id, extra=SAMPLED)
+                    return None
+
+        return signature, tokens, content_id
+
+    def remember(self, game_id: str, signatures: Iterable[Signature]):
+        if not self.enabled:
+            return
+        self.recent.setdefault(game_id, deque(maxlen=self.window)).extend(signatures)
+
+    def forget(self, game_id: str):
+        self.recent.pop(game_id, None)
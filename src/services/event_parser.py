@@ -0,0 +1,69 @@
+import json
+import re
+from typing import Any, Dict, Optional
+from pydantic import ValidationError
+from ..models.game_event import (
+    GameEvent,
+    HP_CHANGE_RANGE,
+    EXP_GAIN_RANGE,
+    MAX_SUGGESTED_ACTIONS
+)
+from ..utils.logger import setup_logger
+from ..utils.metrics import metrics
+
+CODE_FENCE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
+TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+
+class EventParser:
+    def __init__(self):
+        self.logger = setup_logger(__name__)
+
+    def parse(self, raw: Optional[str]) -> Optional[Dict[str, Any]]:
+        if not raw:
+            metrics.increment("llm.parse_failures")
+            return None
+
+        event = self._validate(raw)
+        if event is None:
+            repaired = self.repair(raw)
+            event = self._validate(repaired) if repaired != raw else None
+            if event is None:
+                metrics.increment("llm.parse_failures")
+                self.logger.warning(f"Unparseable LLM event output: {raw[:200]}")
+                return None
+            metrics.increment("llm.repairs")
+
+        return self._clamp(event).model_dump()
+
+    def repair(self, raw: str) -> str:
+        text = CODE_FENCE.sub("", raw.strip())
+
+        start = text.find("{")
+        end = text.rfind("}")
+        if start != -1 and end > start:
+            text = text[start:end + 1]
+
+        return TRAILING_COMMA.sub(r"\1", text)
+
+    def _validate(self, text: str) -> Optional[GameEvent]:
+        try:
+            return GameEvent.model_validate(json.loads(text))
+        except (json.JSONDecodeError, ValidationError, TypeError):
+            return None
+
+    def _clamp(self, event: GameEvent) -> GameEvent:
+        effects = event.effects
+        hp_change = min(max(effects.player_hp_change, HP_CHANGE_RANGE[0]), HP_CHANGE_RANGE[1])
+        exp_gain = min(max(effects.player_exp_gain, EXP_GAIN_RANGE[0]), EXP_GAIN_RANGE[1])
+
+        if hp_change != effects.player_hp_change or exp_gain != effects.player_exp_gain:
+            metrics.increment("llm.effects_clamped")
+            effects.player_hp_change = hp_change
+            effects.player_exp_gain = exp_gain
+
+        if effects.item_gain is not None and not effects.item_gain.strip():
+            effects.item_gain = None
+
+        event.suggested_actions = [action for action in event.suggested_actions if action][:MAX_SUGGESTED_ACTIONS]
+        return event
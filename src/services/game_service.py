@@ -1,240 +1,462 @@
-import json
+import os
 import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Set, Tuple
 from .llm_service import LLMService
 from .vector_service import VectorService
-from ..models.game_state import GameState, Language
-from ..utils.logger import setup_logger
+from .prompt_builder import PromptBuilder
+from .story_memory import StoryMemory
+from .event_parser import EventParser
+from .rules_engine import RulesEngine
+from .intent_router import IntentRouter
+from .model_router import ModelRouter, ModelTier
+from .event_deduplicator import EventDeduplicator
+from .session_recorder import annotate_turn
+from ..models.game_session import GameSession
+from ..models.game_state import Language
+from ..models.game_event import GAME_EVENT_JSON_SCHEMA, NARRATION_JSON_SCHEMA
+from ..utils.logger import setup_logger, SAMPLED, turn_extra
+from ..utils.metrics import metrics
+from ..utils.profiling import phase
+from ..utils.tracing import tracer, traced
+from ..utils.usage import usage_scope, usage_tracker
 from ..localization import Messages
+from ..utils.keyword_automaton import KeywordAutomaton
 
 class GameService:
     def __init__(self):
         self.logger = setup_logger(__name__)
         self.llm_service = LLMService()
         self.vector_service = VectorService()
-        self.previous_events = {}
-
-    async def process_player_action(self, game_state: GameState, action: str) -> Dict[str, Any]:
+        self.prompt_builder = PromptBuilder()
+        self.story_memory = StoryMemory(self.llm_service)
+        self.event_parser = EventParser()
+        self.rules_engine = RulesEngine()
+        self.intent_router = IntentRouter(self.vector_service.embedding_model, self.rules_engine)
+        self.model_router = ModelRouter()
+        self.event_deduplicator = EventDeduplicator()
+        self.structured_output = os.getenv("LLM_STRUCTURED_OUTPUT", "true").lower() == "true"
+        # Models that rejected response_format; other models keep schema-constrained output
+        self.unstructured_models: Set[str] = set()
+        self.parse_retries = int(os.getenv("LLM_PARSE_RETRIES", "1"))
+        self.catalog_context_limit = int(os.getenv("HYBRID_CATALOG_LIMIT", "1"))
+
+        # Whole-word matching, so "use healing item" does not pick the "heal" (rest) fallback
+        self.fallback_matchers: Dict[Language, KeywordAutomaton] = {}
+        for language in Language:
+            matcher = KeywordAutomaton()
+            fallback_keywords = Messages.get_fallback_keywords(language)
+            for keyword in Messages.get_fallback_events(language):
+                for word in [keyword, *fallback_keywords.get(keyword, [])]:
+                    matcher.add(word, keyword)
+            matcher.build()
+            self.fallback_matchers[language] = matcher
+
+    async def process_player_action(self, game_state: GameSession, action: str,
+                                    relevant_events: Optional[list] = None,
+                                    store_event: bool = True) -> Dict[str, Any]:
         start_time = time.time()
-        self.logger.info(f"🚀 [TIMING] Start processing action: {action} for game {game_state.game_id}")
+        turn = game_state.turn_count + 1
+        self.logger.info("🚀 [TIMING] Start processing action: %s for game %s", action, game_state.game_id,
+                         extra=turn_extra(game_state.game_id, turn))
 
         try:
-            # Step 1: Search relevant events
-            search_start = time.time()
-            relevant_events = await self._search_relevant_events(game_state, action)
-            search_time = time.time() - search_start
-            self.logger.info(f"⏱️ [TIMING] RAG search took: {search_time:.3f}s")
+            # Step 0: Trivial actions are answered locally, skipping RAG and the LLM
+            routed_event = await self.intent_router.route(game_state, action)
+            if routed_event:
+                if routed_event["turn"]:
+                    game_state.last_event = (routed_event["turn"], routed_event["narrative"])
+                return routed_event
+
+            # Step 1: Search relevant events (batched callers pass them in pre-fetched)
+            if relevant_events is None:
+                search_start = time.time()
+                with phase("rag_search"), usage_scope(phase="rag_search"):
+                    relevant_events = await self._search_relevant_events(game_state, action)
+                search_time = time.time() - search_start
+                self.logger.info("⏱️ [TIMING] RAG search took: %.3fs", search_time,
+                                 extra=turn_extra(game_state.game_id, turn, "rag_search", search_time))
+            # Content is recorded too, so a replay can serve the same context without the live store
+            annotate_turn("r", [
+                [event.get("id"), round(float(event.get("similarity", 0) or 0), 4), str(event.get("content", ""))]
+                for event in relevant_events if isinstance(event, dict)
+            ])
 
             # Step 2: Generate game event
             llm_start = time.time()
-            game_event = await self._generate_game_event(game_state, action, relevant_events)
+            with phase("llm_generation"), usage_scope(phase="llm_generation"):
+                game_event = await self._generate_game_event(game_state, action, relevant_events)
             llm_time = time.time() - llm_start
-            self.logger.info(f"⏱️ [TIMING] LLM generation took: {llm_time:.3f}s")
+            self.logger.info("⏱️ [TIMING] LLM generation took: %.3fs", llm_time,
+                             extra=turn_extra(game_state.game_id, turn, "llm_generation", llm_time))
 
             # Step 3: Update previous event memory
             narrative = game_event.get("narrative", "")
             turn = game_event.get("turn", game_state.turn_count + 1)
-            self.previous_events[game_state.game_id] = f"[Turn {turn}] {narrative}"
+            game_state.last_event = (turn, narrative)
 
             # Step 4: Store in RAG
-            store_start = time.time()
-            await self._store_event_in_rag(game_state, game_event)
-            store_time = time.time() - store_start
-            self.logger.info(f"⏱️ [TIMING] RAG storage took: {store_time:.3f}s")
+            if store_event:
+                store_start = time.time()
+                with phase("rag_store"), usage_scope(phase="rag_store"):
+                    await self._store_event_in_rag(game_state, game_event)
+                store_time = time.time() - store_start
+                self.logger.info("⏱️ [TIMING] RAG storage took: %.3fs", store_time,
+                                 extra=turn_extra(game_state.game_id, turn, "rag_store", store_time))
 
             total_time = time.time() - start_time
-            self.logger.info(f"✅ [TIMING] Total processing took: {total_time:.3f}s")
+            self.logger.info("✅ [TIMING] Total processing took: %.3fs", total_time,
+                             extra=turn_extra(game_state.game_id, turn, "process_action", total_time))
 
             return game_event
         except Exception as e:
             self.logger.error(f"Failed to process action: {e}")
             return self._get_fallback_event(game_state, action)
 
-    async def _search_relevant_events(self, game_state: GameState, action: str) -> list:
+    @traced("GameService.search_relevant_events")
+    async def _search_relevant_events(self, game_state: GameSession, action: str) -> list:
+        span = tracer.current_span()
+        span.set_attributes(game_id=game_state.game_id, turn=game_state.turn_count + 1)
         try:
             search_start = time.time()
             relevant_events = []
 
             # Get previous event and build query
-            previous_event = self.previous_events.get(game_state.game_id, "")
+            previous_event, query = self._build_search_query(game_state, action)
             if previous_event:
                 relevant_events.append({"content": previous_event, "similarity": 1.0})
-                
-            query = f"{action} following {previous_event}" if previous_event else f"{action} combat battle adventure"
 
             vector_start = time.time()
-            self.logger.info(f"🔍 [DEBUG] Searching with contextual query: '{query}'")
+            self.logger.info("🔍 [DEBUG] Searching with contextual query: '%s'", query, extra=SAMPLED)
 
-            results = await self.vector_service.semantic_search(
+            results = await self.vector_service.hybrid_search(
                 query=query,
                 content_type="game_event",
                 limit=2,
                 similarity_threshold=0.3,
-                game_id=game_state.game_id
+                game_id=game_state.game_id,
+                lexical_query=action,
+                prior_content=previous_event
             )
-            self.logger.info(f"🔍 [DEBUG] Vector search found {len(results)} results with threshold 0.3")
+            self.logger.info("🔍 [DEBUG] Hybrid search found %d results with threshold 0.3", len(results), extra=SAMPLED)
 
             if not results:
-                self.logger.info(f"🔍 [DEBUG] Trying search with action only: '{action}'")
-                results = await self.vector_service.semantic_search(
+                self.logger.info("🔍 [DEBUG] Trying search with action only: '%s'", action, extra=SAMPLED)
+                results = await self.vector_service.hybrid_search(
                     query=action,
                     content_type="game_event",
                     limit=2,
                     similarity_threshold=0.3,
-                    game_id=game_state.game_id
+                    game_id=game_state.game_id,
+                    prior_content=previous_event
                 )
-                self.logger.info(f"🔍 [DEBUG] Action-only search found {len(results)} results")
+                self.logger.info("🔍 [DEBUG] Action-only search found %d results", len(results), extra=SAMPLED)
+                span.set_attribute("retried_action_only", True)
 
             relevant_events.extend(results)
+            relevant_events.extend(self._lookup_catalog(action))
+            span.set_attributes(
+                result_count=len(relevant_events),
+                top_similarity=max((result.get("similarity", 0.0) for result in results), default=0.0)
+            )
             vector_time = time.time() - vector_start
-            self.logger.info(f"🔍 [TIMING] Vector search took: {vector_time:.3f}s")
+            self.logger.info("🔍 [TIMING] Vector search took: %.3fs", vector_time, extra=SAMPLED)
 
             total_search_time = time.time() - search_start
-            self.logger.info(f"📊 [TIMING] Total search took: {total_search_time:.3f}s, found {len(relevant_events)} events")
+            self.logger.info("📊 [TIMING] Total search took: %.3fs, found %d events",
+                             total_search_time, len(relevant_events), extra=SAMPLED)
 
             return relevant_events
         except Exception as e:
             self.logger.error(f"RAG search failed: {e}")
             return []
 
-    def _get_prompt_by_language(self, game_state: GameState, action: str, context: str) -> str:
-        language_instruction = Messages.get_language_instruction(game_state.language)
-
-        inventory_str = ", ".join(game_state.player.inventory) if game_state.player.inventory else "empty"
-
-        return f"""Based on the game state and historical events below, generate a game event responding to the player's action.
-
-Game State:
-- Player: {game_state.player.name}
-- HP: {game_state.player.hp}/{game_state.player.max_hp}
-- Level: {game_state.player.level}
-- Experience: {game_state.player.experience}
-- Turn: {game_state.turn_count + 1}
-- Inventory: {inventory_str}
-
-Player Action: {action}
-
-Relevant Historical Events:
-{context}
-
-Generate JSON response:
-{{
-  "turn": {game_state.turn_count + 1},
-  "narrative": "narrative text",
-  "effects": {{
-    "player_hp_change": 0,
-    "player_exp_gain": 0,
-    "item_gain": null
-  }},
-  "suggested_actions": ["action1", "action2", "action3"]
-}}
-
-Requirements:
-- Narrative should be vivid, suspenseful, and immersive, fitting the game context.
-- Every **third turn (3, 6, 9)** MUST feature a monster encounter, regardless of player action.
-- Effects should be reasonable, considering player level and action.
-- For combat, always include some randomness (success, failure, critical hit, enemy counterattack).
-- Suggested_actions must provide 3 contextual and meaningful choices.
-- Exploration should frequently lead to new dangers, often triggering combat.
-- 70% of encounters should involve monsters (goblins, skeletons, orcs, treasure guardians, dragons).
-- Turn escalation:
-  - Turns 1–3: light encounters, basic monsters.
-  - Turns 4–6: stronger monsters, minor traps, rare loot.
-  - Turns 7–9: elite monsters, ambushes, treasure guardians.
-  - Turn 8–9 must foreshadow or introduce the **final boss**.
-  - Turn 10: epic conclusion (victory, defeat, or narrow escape).
-- Make battles cinematic: emphasize sound, movement, and environment.
-- Keep pacing fast and exciting — avoid long pauses without conflict.
-- IMPORTANT: Respond {language_instruction}
-"""
-
-    async def _generate_game_event(self, game_state: GameState, action: str, relevant_events: list) -> Dict[str, Any]:
-        try:
-            context = self._build_context(game_state, relevant_events)
-            prompt = self._get_prompt_by_language(game_state, action, context)
+    def _build_search_query(self, game_state: GameSession, action: str) -> Tuple[str, str]:
+        previous_event = game_state.previous_event
+        query = f"{action} following {previous_event}" if previous_event else self.build_opening_query(action)
+        return previous_event, query
+
+    def _lookup_catalog(self, action: str) -> list:
+        # Names like "Fire Dragon" or "healing potion" are matched exactly, without an embedding call
+        if self.catalog_context_limit <= 0:
+            return []
+        return self.vector_service.lexical_search(action, ("monster", "item"), limit=self.catalog_context_limit)
+
+    def build_opening_query(self, action: str) -> str:
+        # Query used when a game has no previous event yet, e.g. the opening "start" turn
+        return f"{action} combat battle adventure"
 
-            client = self.llm_service.get_client()
-            response = await client.chat.completions.create(
-                model="gpt-5-nano",
-                messages=[{"role": "user", "content": prompt}]
+    async def search_relevant_events_batch(self, requests: List[Tuple[GameSession, str]]) -> List[list]:
+        try:
+            search_start = time.time()
+            game_ids = [game_state.game_id for game_state, _ in requests]
+            relevant_events = []
+            queries = []
+            previous_events = []
+            for game_state, action in requests:
+                previous_event, query = self._build_search_query(game_state, action)
+                relevant_events.append([{"content": previous_event, "similarity": 1.0}] if previous_event else [])
+                queries.append(query)
+                previous_events.append(previous_event)
+
+            results = await self.vector_service.hybrid_search_batch(
+                queries=queries,
+                game_ids=game_ids,
+                content_type="game_event",
+                limit=2,
+                similarity_threshold=0.3,
+                lexical_queries=[action for _, action in requests],
+                prior_contents=previous_events
             )
 
-            return json.loads(response.choices[0].message.content)
+            # Mirror the single-turn path: retry misses with the bare action
+            misses = [i for i, result in enumerate(results) if not result]
+            if misses:
+                retry_results = await self.vector_service.hybrid_search_batch(
+                    queries=[requests[i][1] for i in misses],
+                    game_ids=[game_ids[i] for i in misses],
+                    content_type="game_event",
+                    limit=2,
+                    similarity_threshold=0.3,
+                    prior_contents=[previous_events[i] for i in misses]
+                )
+                for i, result in zip(misses, retry_results):
+                    results[i] = result
+
+            for events, result, (_, action) in zip(relevant_events, results, requests):
+                events.extend(result)
+                events.extend(self._lookup_catalog(action))
+
+            self.logger.info("📊 [TIMING] Batch search for %d actions took: %.3fs",
+                             len(requests), time.time() - search_start, extra=SAMPLED)
+            return relevant_events
 
         except Exception as e:
-            self.logger.error(f"LLM generation failed: {e}")
-            return self._get_fallback_event(game_state, action)
+            self.logger.error(f"Batch RAG search failed: {e}")
+            return [[] for _ in requests]
+
+    @traced("GameService.generate_game_event")
+    async def _generate_game_event(self, game_state: GameSession, action: str, relevant_events: list) -> Dict[str, Any]:
+        span = tracer.current_span()
+        span.set_attributes(game_id=game_state.game_id, turn=game_state.turn_count + 1,
+                            context_events=len(relevant_events))
+        outcome = None
+        try:
+            # With the rules engine on, mechanics are settled here and the model only narrates
+            if self.rules_engine.enabled:
+                with phase("rules_engine"):
+                    outcome = self.rules_engine.resolve_turn(game_state, action)
+                span.set_attribute("outcome", outcome["result"])
+                annotate_turn("o", outcome["result"])
+
+            # With the LLM breaker open, go straight to the localized fallback instead of waiting to fail
+            if not self.llm_service.breaker.allow_request():
+                metrics.increment("llm.breaker_fallbacks")
+                span.set_attributes(fallback=True, breaker_open=True)
+                return self._get_fallback_event(game_state, action, outcome)
+
+            # A game past its token or cost budget gets a shorter context and the cheap model
+            degraded = usage_tracker.is_over_budget(game_state.game_id)
+            if degraded:
+                metrics.increment("usage.degraded_turns")
+
+            with phase("prompt_build"):
+                messages = self.prompt_builder.build_messages(
+                    game_state, action, relevant_events,
+                    story_summary=self.story_memory.get_summary(game_state.game_id),
+                    outcome=self.rules_engine.describe_outcome(outcome) if outcome else None,
+                    degraded=degraded
+                )
+            schema = NARRATION_JSON_SCHEMA if outcome else GAME_EVENT_JSON_SCHEMA
+            tiers = self.model_router.select(game_state, outcome, degraded=degraded)
+            span.set_attributes(model_tier=tiers[0].name, degraded=degraded)
+
+            for attempt in range(self.parse_retries + 1):
+                if attempt:
+                    metrics.increment("llm.retries")
+
+                with phase("llm_request"):
+                    response = await self._request_with_failover(messages, schema, tiers)
+                with phase("parse"):
+                    game_event = self.event_parser.parse(response.choices[0].message.content)
+                if game_event:
+                    span.set_attributes(attempts=attempt + 1, structured_output=self.uses_structured_output(tiers[0].model))
+                    return self._apply_outcome(game_event, outcome) if outcome else game_event
+
+            span.set_attributes(attempts=self.parse_retries + 1, fallback=True)
+            self.logger.error("LLM output could not be parsed, using fallback event")
+            return self._get_fallback_event(game_state, action, outcome)
 
-    def _build_context(self, game_state: GameState, relevant_events: list) -> str:
-        if not relevant_events:
-            return Messages.get_context_no_events(game_state.language)
+        except Exception as e:
+            self.logger.error(f"LLM generation failed: {e}")
+            span.set_attributes(fallback=True, error=str(e))
+            return self._get_fallback_event(game_state, action, outcome)
+
+    def _apply_outcome(self, game_event: Dict[str, Any], outcome: Dict[str, Any]) -> Dict[str, Any]:
+        game_event["turn"] = outcome["turn"]
+        game_event["effects"] = dict(outcome["effects"])
+        return game_event
+
+    async def _request_with_failover(self, messages: list, schema: Dict[str, Any], tiers: List[ModelTier]):
+        for index, tier in enumerate(tiers):
+            start = time.monotonic()
+            try:
+                response = await self._request_completion(messages, schema, tier)
+                self.model_router.record_success(tier, time.monotonic() - start, getattr(response, "usage", None))
+                usage_tracker.record_completion(tier.model, getattr(response, "usage", None))
+                self.llm_service.breaker.record_success()
+                return response
+            except Exception as e:
+                self.model_router.record_failure(tier, time.monotonic() - start)
+                if index == len(tiers) - 1:
+                    # Only a turn that exhausted every tier counts against the breaker
+                    self.llm_service.breaker.record_failure()
+                    raise
+                self.logger.warning(f"Model tier {tier.name} ({tier.model}) failed, failing over: {e}")
+                metrics.increment(f"llm.tier.{tier.name}.failovers")
+
+    async def _request_completion(self, messages: list, schema: Dict[str, Any], tier: ModelTier):
+        from openai import BadRequestError
+
+        client = self.llm_service.get_client()
+
+        if self.uses_structured_output(tier.model):
+            try:
+                return await client.chat.completions.create(
+                    model=tier.model,
+                    messages=messages,
+                    max_completion_tokens=tier.max_tokens,
+                    response_format={"type": "json_schema", "json_schema": schema}
+                )
+            except BadRequestError as e:
+                # Context length, content policy and other bad requests are this turn's problem
+                if not self._is_response_format_error(e):
+                    raise
+                self.logger.warning(f"Structured output unsupported by {tier.model}, falling back to plain JSON: {e}")
+                self.unstructured_models.add(tier.model)
+                metrics.increment("llm.structured_output_rejected")
+
+        return await client.chat.completions.create(
+            model=tier.model,
+            messages=messages,
+            max_completion_tokens=tier.max_tokens
+        )
+
+    def uses_structured_output(self, model: str) -> bool:
+        return self.structured_output and model not in self.unstructured_models
+
+    @staticmethod
+    def _is_response_format_error(error: Exception) -> bool:
+        param = getattr(error, "param", None) or ""
+        message = str(error).lower()
+        return (param.startswith("response_format")
+                or "response_format" in message or "json_schema" in message)
+
+    async def _store_event_in_rag(self, game_state: GameSession, game_event: Dict[str, Any]):
+        try:
+            entry = self.build_event_entry(game_state, game_event)
 
-        context_parts = []
-        for event in relevant_events:
-            if isinstance(event, dict):
-                content = str(event.get('content', ''))
-                similarity = event.get('similarity', 0)
-                context_parts.append(f"- {content} (similarity: {similarity:.2f})")
-            else:
-                # Handle case where event is not a dict
-                context_parts.append(f"- {str(event)}")
+            # Storing without an embedding is pointless, so skip while the embedding breaker is open
+            if self.vector_service.embedding_model.breaker.is_open():
+                metrics.increment("rag.store_skipped_breaker_open")
+                return
 
-        return "\n".join(context_parts)
+            # Near-repeats (e.g. the same fallback narrative) would cost an embedding and add nothing
+            signature = self.event_deduplicator.check(game_state.game_id, entry['content_id'], entry['content'])
+            if signature is None:
+                return
 
-    async def _store_event_in_rag(self, game_state: GameState, game_event: Dict[str, Any]):
-        try:
-            turn = game_event.get('turn', game_state.turn_count + 1)
-            narrative = game_event.get('narrative', '')
-            effects = game_event.get('effects', {})
-
-            doc_id = f"{game_state.game_id}_turn_{turn}"
-            content = f"[Turn {turn}] {narrative}"
-
-            if effects:
-                hp_change = effects.get('player_hp_change', 0)
-                exp_gain = effects.get('player_exp_gain', 0)
-                content += f" Status changes: HP{hp_change:+d}, EXP{exp_gain:+d}"
-
-            metadata = {
-                "game_id": game_state.game_id,
-                "turn": turn,
-                "player_name": game_state.player.name,
-                "hp_after": max(0, game_state.player.hp + effects.get('player_hp_change', 0)),
-                "exp_after": game_state.player.experience + effects.get('player_exp_gain', 0),
-                "created_at": datetime.utcnow().isoformat()
-            }
-
-            await self.vector_service.store_knowledge(
-                content_type="game_event",
-                content_id=doc_id,
-                title=f"Turn {turn} - {game_state.player.name}",
-                content=content,
-                metadata=metadata
-            )
+            if not await self.vector_service.store_knowledge(**entry):
+                return
+            self.event_deduplicator.remember(game_state.game_id, [signature])
 
-            self.logger.info(f"Stored game event in RAG: {doc_id}")
+            self.logger.info("Stored game event in RAG: %s", entry['content_id'], extra=SAMPLED)
 
         except Exception as e:
             self.logger.error(f"Failed to store event in RAG: {e}")
 
-    def _get_fallback_event(self, game_state: GameState, action: str) -> Dict[str, Any]:
+    async def store_events_batch(self, entries: List[Dict[str, Any]]):
+        try:
+            accepted = []
+            signatures: Dict[str, List] = {}
+            for entry in entries:
+                game_id = entry['metadata']['game_id']
+                signature = self.event_deduplicator.check(game_id, entry['content_id'], entry['content'],
+                                                          signatures.get(game_id, ()))
+                if signature is not None:
+                    accepted.append(entry)
+                    signatures.setdefault(game_id, []).append(signature)
+
+            stored = await self.vector_service.store_knowledge_batch(accepted)
+            # The batch reports a count, not which entries failed to embed; on a partial store
+            # nothing is remembered, which at worst stores a later near-duplicate
+            if accepted and stored == len(accepted):
+                for game_id, game_signatures in signatures.items():
+                    self.event_deduplicator.remember(game_id, game_signatures)
+            self.logger.info(f"Stored {stored}/{len(accepted)} game events in RAG")
+
+        except Exception as e:
+            self.logger.error(f"Failed to store event batch in RAG: {e}")
+
+    def build_event_entry(self, game_state: GameSession, game_event: Dict[str, Any]) -> Dict[str, Any]:
+        turn = game_event.get('turn', game_state.turn_count + 1)
+        narrative = game_event.get('narrative', '')
+        effects = game_event.get('effects', {})
+
+        doc_id = f"{game_state.game_id}_turn_{turn}"
+        content = f"[Turn {turn}] {narrative}"
+
+        if effects:
+            hp_change = effects.get('player_hp_change', 0)
+            exp_gain = effects.get('player_exp_gain', 0)
+            content += f" Status changes: HP{hp_change:+d}, EXP{exp_gain:+d}"
+
+        metadata = {
+            "game_id": game_state.game_id,
+            "turn": turn,
+            "player_name": game_state.player.name,
+            "hp_after": max(0, game_state.player.hp + effects.get('player_hp_change', 0)),
+            "exp_after": game_state.player.experience + effects.get('player_exp_gain', 0),
+            "created_at": datetime.utcnow().isoformat()
+        }
+
+        return {
+            "content_type": "game_event",
+            "content_id": doc_id,
+            "title": f"Turn {turn} - {game_state.player.name}",
+            "content": content,
+            "metadata": metadata
+        }
+
+    def _get_fallback_event(self, game_state: GameSession, action: str,
+                            outcome: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         fallback_events = Messages.get_fallback_events(game_state.language)
         default_narrative = Messages.get_default_narrative(game_state.language)
         default_suggested_actions = Messages.get_default_suggested_actions(game_state.language)
 
+        fallback_event = {
+            "turn": 0,
+            "narrative": default_narrative,
+            "effects": {"player_hp_change": 0, "player_exp_gain": 5, "item_gain": None},
+            "suggested_actions": default_suggested_actions
+        }
+
+        matched = {keyword for _, _, keyword in self.fallback_matchers[game_state.language].find(action)}
         for keyword, event in fallback_events.items():
-            if keyword in action.lower():
-                return {
+            if keyword in matched:
+                fallback_event = {
                     "turn": 0,
                     "narrative": event["narrative"],
                     "effects": event["effects"],
                     "suggested_actions": event["suggested_actions"]
                 }
-
-        return {
-            "turn": 0,
-            "narrative": default_narrative,
-            "effects": {"player_hp_change": 0, "player_exp_gain": 5, "item_gain": None},
-            "suggested_actions": default_suggested_actions
-        }
+                break
+
+        # A resolved outcome is still authoritative when only the narration failed
+        if outcome:
+            fallback_event = self._apply_outcome(fallback_event, outcome)
+        # Narratives quote the effect they come with, so the text never promises more than it applies
+        fallback_event["narrative"] = fallback_event["narrative"].format(
+            hp_gain=max(0, fallback_event["effects"].get("player_hp_change", 0))
+        )
+        return fallback_event
@@ -0,0 +1,173 @@
+import math
+import os
+from typing import Any, Dict, List, Optional
+from .rules_engine import RulesEngine, INTENT_KEYWORDS as RULES_INTENT_KEYWORDS
+from ..models.chroma.embedding_model import EmbeddingModel
+from ..models.game_session import GameSession
+from ..models.game_state import Language
+from ..utils.keyword_automaton import KeywordAutomaton
+from ..utils.logger import setup_logger, SAMPLED
+from ..utils.metrics import metrics
+from ..localization import Messages
+
+# Intents that do not spend a turn; everything else advances the turn counter
+FREE_INTENTS = ("inventory", "status", "look")
+# Actions mentioning any of these need the full pipeline, e.g. "rest, then attack the orc"
+BLOCKING_INTENTS = ("attack", "flee", "explore")
+BLOCKING = "__blocking__"
+
+
+class IntentRouter:
+    """Answers trivial actions from localized templates so they skip RAG and the LLM."""
+
+    def __init__(self, embedding_model: EmbeddingModel, rules_engine: RulesEngine):
+        self.logger = setup_logger(__name__)
+        self.embedding_model = embedding_model
+        self.rules_engine = rules_engine
+        self.enabled = os.getenv("INTENT_ROUTER_ENABLED", "true").lower() == "true"
+        self.max_share = float(os.getenv("INTENT_ROUTER_MAX_SHARE", "0.3"))
+        self.max_action_chars = int(os.getenv("INTENT_ROUTER_MAX_ACTION_CHARS", "40"))
+        self.centroids_enabled = os.getenv("INTENT_ROUTER_CENTROIDS", "false").lower() == "true"
+        self.centroid_threshold = float(os.getenv("INTENT_ROUTER_CENTROID_THRESHOLD", "0.6"))
+
+        self.automaton = KeywordAutomaton()
+        self.examples: Dict[str, List[str]] = {}
+        for language in Language:
+            for intent, keywords in Messages.get_intent_keywords(language).items():
+                for keyword in keywords:
+                    self.automaton.add(keyword, intent)
+                self.examples.setdefault(intent, []).extend(keywords)
+        for intent in BLOCKING_INTENTS:
+            for keyword in RULES_INTENT_KEYWORDS[intent]:
+                self.automaton.add(keyword, BLOCKING)
+        self.automaton.build()
+
+        self.centroids: Optional[Dict[str, List[float]]] = None
+        # Per game: [turn-spending actions seen, of those routed], used to enforce INTENT_ROUTER_MAX_SHARE
+        self.turn_counts: Dict[str, List[int]] = {}
+
+    def classify(self, action: str) -> Optional[str]:
+        if len(action) > self.max_action_chars:
+            return None
+
+        matches = self.automaton.find(action)
+        intent_spans = [(start, end) for start, end, value in matches if value != BLOCKING]
+
+        # A blocking word inside a cheap phrase ("look" in "look around") does not count
+        for start, end, value in matches:
+            if value == BLOCKING and not any(s <= start and end <= e for s, e in intent_spans):
+                return None
+
+        intents = {value for _, _, value in matches if value != BLOCKING}
+        return intents.pop() if len(intents) == 1 else None
+
+    async def classify_by_centroid(self, action: str) -> Optional[str]:
+        if not self.centroids_enabled or len(action) > self.max_action_chars:
+            return None
+
+        if self.centroids is None:
+            self.centroids = await self._build_centroids()
+        if not self.centroids:
+            return None
+
+        embedding = await self.embedding_model.get_embedding(action)
+        if not embedding:
+            return None
+
+        best_intent, best_score = None, -1.0
+        for intent, centroid in self.centroids.items():
+            score = self._cosine(embedding, centroid)
+            if score > best_score:
+                best_intent, best_score = intent, score
+
+        return best_intent if best_score >= self.centroid_threshold else None
+
+    async def _build_centroids(self) -> Dict[str, List[float]]:
+        centroids = {}
+        for intent, examples in self.examples.items():
+            embeddings = [e for e in await self.embedding_model.get_embeddings(examples) if e]
+            if not embeddings:
+                continue
+            centroid = [sum(values) / len(embeddings) for values in zip(*embeddings)]
+            norm = math.sqrt(sum(value * value for value in centroid)) or 1.0
+            centroids[intent] = [value / norm for value in centroid]
+        return centroids
+
+    def _cosine(self, a: List[float], b: List[float]) -> float:
+        norm = math.sqrt(sum(value * value for value in a)) or 1.0
+        return sum(x * y for x, y in zip(a, b)) / norm
+
+    async def route(self, game_state: GameSession, action: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+
+        intent = self.classify(action) or await self.classify_by_centroid(action)
+        if intent in FREE_INTENTS:
+            # Free intents leave the game untouched, so they are neither capped nor counted
+            return self._route(game_state, action, intent)
+
+        counts = self.turn_counts.setdefault(game_state.game_id, [0, 0])
+        counts[0] += 1
+        if not intent:
+            metrics.increment("intent_router.misses")
+            return None
+
+        if counts[1] + 1 > self.max_share * counts[0]:
+            metrics.increment("intent_router.share_capped")
+            return None
+
+        event = self._route(game_state, action, intent)
+        if event is not None:
+            counts[1] += 1
+        return event
+
+    def _route(self, game_state: GameSession, action: str, intent: str) -> Optional[Dict[str, Any]]:
+        event = self._build_event(game_state, action, intent)
+        if event is None:
+            metrics.increment(f"intent_router.deferred.{intent}")
+            return None
+
+        metrics.increment(f"intent_router.hits.{intent}")
+        self.logger.info("⚡ Routed action '%s' as %s for game %s", action, intent, game_state.game_id, extra=SAMPLED)
+        return event
+
+    def _build_event(self, game_state: GameSession, action: str, intent: str) -> Optional[Dict[str, Any]]:
+        language = game_state.language
+        response = Messages.get_intent_responses(language)[intent]
+        player = game_state.player
+        turn = game_state.turn_count + 1
+        rng = self.rules_engine.get_rng(game_state.game_id, turn)
+        effects = {"player_hp_change": 0, "player_exp_gain": 0, "item_gain": None}
+
+        if intent in FREE_INTENTS:
+            # turn 0 leaves the turn counter untouched
+            turn = 0
+        elif self.rules_engine.enabled:
+            # Resolve with the router's intent: its keywords ("take a break") are not the rules engine's
+            outcome = self.rules_engine.resolve_turn(game_state, action, intent)
+            if outcome["encounter"]:
+                # An ambush needs real narration
+                return None
+            effects = dict(outcome["effects"])
+        else:
+            effects["player_hp_change"] = rng.randint(10, 25)
+
+        narrative = rng.choice(response["narratives"]).format(
+            name=player.name,
+            hp=player.hp,
+            max_hp=player.max_hp,
+            level=player.level,
+            experience=player.experience,
+            inventory=", ".join(player.inventory) or Messages.get_empty_inventory(language),
+            hp_gain=effects["player_hp_change"]
+        )
+
+        return {
+            "turn": turn,
+            "narrative": narrative,
+            "effects": effects,
+            "suggested_actions": list(response["suggested_actions"])
+        }
+
+    def forget(self, game_id: str):
+        self.turn_counts.pop(game_id, None)
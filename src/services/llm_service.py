@@ -1,25 +1,54 @@
 import os
-from openai import AsyncOpenAI
+import threading
+from typing import TYPE_CHECKING, Callable, Optional
+from ..utils.circuit_breaker import CircuitBreaker
 from ..utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 
 class LLMService:
     def __init__(self):
         self.logger = setup_logger(__name__)
-        self.client = None
-        self._initialize_client()
+        # Applied to the client when it is created, e.g. the session recorder's wrapper
+        self.client_wrapper: Optional[Callable] = None
+        self._client = None
+        self._client_lock = threading.Lock()
+        # Shared by every caller of the client, so one outage trips it for turns and summaries alike
+        self.breaker = CircuitBreaker("llm")
+
+    # The openai package and its HTTP client are created on first use, not at import
+    @property
+    def client(self) -> "AsyncOpenAI":
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._initialize_client()
+        return self._client
+
+    @client.setter
+    def client(self, client):
+        self._client = client
+
+    def is_initialized(self) -> bool:
+        return self._client is not None
 
     def _initialize_client(self):
+        from openai import AsyncOpenAI
+
         api_key = os.getenv("OPENAI_API_KEY")
         if api_key:
-            self.client = AsyncOpenAI(api_key=api_key)
+            client = AsyncOpenAI(api_key=api_key)
             self.logger.info("LLM service initialized with OpenAI client")
         else:
-            self.client = AsyncOpenAI(api_key="dummy")
+            client = AsyncOpenAI(api_key="dummy")
             self.logger.warning("No OpenAI API key found - using dummy client")
 
+        self._client = self.client_wrapper(client) if self.client_wrapper else client
+
     def is_available(self) -> bool:
-        return True
+        return not self.breaker.is_open()
 
-    def get_client(self) -> AsyncOpenAI:
-        return self.client
\ No newline at end of file
+    def get_client(self) -> "AsyncOpenAI":
+        return self.client
@@ -0,0 +1,142 @@
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from .rules_engine import get_turn_phases
+from ..models.game_session import GameSession
+from ..utils.logger import setup_logger
+from ..utils.metrics import metrics
+
+EWMA_ALPHA = 0.2
+
+
+class ModelTier:
+    def __init__(self, name: str, model: str, max_tokens: int):
+        self.name = name
+        self.model = model
+        self.max_tokens = max_tokens
+        self.latency_ewma: Optional[float] = None
+        self.error_ewma = 0.0
+        # Last time a request left the tier over its error or latency limit
+        self.degraded_at = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, success: bool):
+        with self._lock:
+            self.latency_ewma = latency if self.latency_ewma is None else (
+                EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * self.latency_ewma
+            )
+            self.error_ewma = EWMA_ALPHA * (0.0 if success else 1.0) + (1 - EWMA_ALPHA) * self.error_ewma
+
+    def reset(self):
+        with self._lock:
+            self.latency_ewma = None
+            self.error_ewma = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "latency_ewma_ms": round(self.latency_ewma * 1000, 1) if self.latency_ewma is not None else None,
+            "error_rate": round(self.error_ewma, 3)
+        }
+
+
+class ModelRouter:
+    """Picks the model tier for a turn: fast by default, strong for climactic turns, failing over on trouble."""
+
+    FAST = "fast"
+    STRONG = "strong"
+
+    def __init__(self):
+        self.logger = setup_logger(__name__)
+        # gpt-5 models spend their reasoning tokens out of max_completion_tokens, so a tight
+        # limit can leave no room for the JSON answer; 4000 leaves headroom on both tiers
+        self.tiers: Dict[str, ModelTier] = {
+            self.FAST: ModelTier(
+                self.FAST,
+                os.getenv("LLM_FAST_MODEL", "gpt-5-nano"),
+                int(os.getenv("LLM_FAST_MAX_TOKENS", "4000"))
+            ),
+            self.STRONG: ModelTier(
+                self.STRONG,
+                os.getenv("LLM_STRONG_MODEL", "gpt-5-mini"),
+                int(os.getenv("LLM_STRONG_MAX_TOKENS", "4000"))
+            )
+        }
+        self.latency_budget = float(os.getenv("LLM_TIER_LATENCY_BUDGET_SECONDS", "30"))
+        self.max_error_rate = float(os.getenv("LLM_TIER_MAX_ERROR_RATE", "0.5"))
+        self.recovery_seconds = float(os.getenv("LLM_TIER_RECOVERY_SECONDS", "60"))
+        self.max_turns = int(os.getenv("GAME_MAX_TURNS", "10"))
+        self.boss_start = get_turn_phases(self.max_turns)["boss_start"]
+
+    def is_climactic(self, game_state: GameSession, outcome: Optional[Dict[str, Any]] = None) -> bool:
+        turn = game_state.turn_count + 1
+        if turn >= self.max_turns:
+            return True
+
+        if outcome is not None:
+            # Boss fights, and elite fights once the finale is being foreshadowed
+            tier = (outcome.get("encounter") or {}).get("tier")
+            return tier == "boss" or (tier == "elite" and turn >= self.boss_start)
+
+        # Without a rules engine outcome, fall back to the prompt's escalation bands
+        return turn >= self.boss_start
+
+    def _over_limits(self, tier: ModelTier) -> bool:
+        if tier.error_ewma > self.max_error_rate:
+            return True
+        return tier.latency_ewma is not None and tier.latency_ewma > self.latency_budget
+
+    def is_healthy(self, tier: ModelTier) -> bool:
+        if self._over_limits(tier) and time.monotonic() - tier.degraded_at > self.recovery_seconds:
+            # A demoted tier gets no traffic to refresh its averages, so after a quiet spell
+            # it is probed again with a fresh start; a slow or failing probe demotes it anew
+            tier.reset()
+        return not self._over_limits(tier)
+
+    def select(self, game_state: GameSession, outcome: Optional[Dict[str, Any]] = None,
+               degraded: bool = False) -> List[ModelTier]:
+        fast, strong = self.tiers[self.FAST], self.tiers[self.STRONG]
+        # Games over their usage budget stay on the fast tier even for climactic turns
+        climactic = not degraded and self.is_climactic(game_state, outcome)
+        ordered = [strong, fast] if climactic else [fast, strong]
+
+        if not self.is_healthy(ordered[0]) and self.is_healthy(ordered[1]):
+            metrics.increment(f"llm.tier.{ordered[0].name}.skipped_unhealthy")
+            ordered.reverse()
+
+        # Identical models on both tiers make failover pointless
+        if fast.model == strong.model:
+            ordered = ordered[:1]
+        return ordered
+
+    def record_success(self, tier: ModelTier, latency: float, usage: Any = None):
+        tier.record(latency, True)
+        self._mark_degraded(tier)
+        metrics.increment(f"llm.tier.{tier.name}.requests")
+        metrics.observe(f"llm.tier.{tier.name}.latency_ms", latency * 1000)
+        if usage is not None:
+            metrics.increment(f"llm.tier.{tier.name}.prompt_tokens", getattr(usage, "prompt_tokens", 0) or 0)
+            metrics.increment(f"llm.tier.{tier.name}.completion_tokens", getattr(usage, "completion_tokens", 0) or 0)
+        self._publish(tier)
+
+    def record_failure(self, tier: ModelTier, latency: float):
+        tier.record(latency, False)
+        self._mark_degraded(tier)
+        metrics.increment(f"llm.tier.{tier.name}.requests")
+        metrics.increment(f"llm.tier.{tier.name}.errors")
+        self._publish(tier)
+
+    def _mark_degraded(self, tier: ModelTier):
+        # Successes count too: a slow success keeps a latency-demoted tier demoted
+        if self._over_limits(tier):
+            tier.degraded_at = time.monotonic()
+
+    def _publish(self, tier: ModelTier):
+        metrics.set_gauge(f"llm.tier.{tier.name}.error_rate", round(tier.error_ewma, 3))
+        if tier.latency_ewma is not None:
+            metrics.set_gauge(f"llm.tier.{tier.name}.latency_ewma_ms", round(tier.latency_ewma * 1000, 1))
+
+    def get_status(self) -> Dict[str, Any]:
+        return {name: tier.to_dict() for name, tier in self.tiers.items()}
@@ -0,0 +1,231 @@
+import os
+from typing import Any, Dict, List, Optional, Tuple
+from .rules_engine import get_turn_phases
+from ..models.game_session import GameSession
+from ..models.game_state import Language
+from ..utils.logger import setup_logger
+from ..utils.metrics import metrics
+from ..localization import Messages
+
+
+STATIC_PROMPT_TEMPLATE = """You are the game master of a dungeon crawler. Based on the game state and historical events in the user message, generate a game event responding to the player's action.
+
+Generate JSON response:
+{{
+  "turn": <current turn number>,
+  "narrative": "narrative text",
+  "effects": {{
+    "player_hp_change": 0,
+    "player_exp_gain": 0,
+    "item_gain": null
+  }},
+  "suggested_actions": ["action1", "action2", "action3"]
+}}
+
+Requirements:
+- Narrative should be vivid, suspenseful, and immersive, fitting the game context.
+- Every **third turn ({encounter_turns})** MUST feature a monster encounter, regardless of player action.
+- Effects should be reasonable, considering player level and action.
+- For combat, always include some randomness (success, failure, critical hit, enemy counterattack).
+- Suggested_actions must provide 3 contextual and meaningful choices.
+- Exploration should frequently lead to new dangers, often triggering combat.
+- 70% of encounters should involve monsters (goblins, skeletons, orcs, treasure guardians, dragons).
+- Turn escalation:
+  - Turns 1–{early_end}: light encounters, basic monsters.
+  - Turns {mid_start}–{mid_end}: stronger monsters, minor traps, rare loot.
+  - Turns {late_start}–{late_end}: elite monsters, ambushes, treasure guardians.
+  - Turn {boss_start}–{late_end} must foreshadow or introduce the **final boss**.
+  - Turn {max_turns}: epic conclusion (victory, defeat, or narrow escape).
+- Make battles cinematic: emphasize sound, movement, and environment.
+- Keep pacing fast and exciting — avoid long pauses without conflict.
+- IMPORTANT: Respond {language_instruction}
+"""
+
+NARRATION_PROMPT_TEMPLATE = """You are the narrator of a dungeon crawler. The turn's outcome has already been resolved by the game engine; describe it for the player.
+
+Generate JSON response:
+{{
+  "narrative": "narrative text",
+  "suggested_actions": ["action1", "action2", "action3"]
+}}
+
+Requirements:
+- Narrate exactly the resolved outcome in the user message; never change who wins, damage, EXP or items.
+- Vivid, cinematic and fast-paced: sound, movement, environment; mention monster abilities used.
+- Turn {max_turns} is the finale: conclude the adventure.
+- Suggested_actions: 3 short contextual choices.
+- IMPORTANT: Respond {language_instruction}
+"""
+
+DYNAMIC_PROMPT_TEMPLATE = """Game State:
+- Player: {player_name}
+- HP: {hp}/{max_hp}
+- Level: {level}
+- Experience: {experience}
+- Turn: {turn}
+- Inventory: {inventory}
+
+{story_summary}Player Action: {action}
+
+Relevant Historical Events:
+{context}
+{outcome}"""
+
+
+class PromptBuilder:
+    def __init__(self):
+        self.logger = setup_logger(__name__)
+        self.context_token_budget = int(os.getenv("PROMPT_CONTEXT_TOKEN_BUDGET", "400"))
+        self.degraded_context_token_budget = int(os.getenv("PROMPT_DEGRADED_CONTEXT_TOKEN_BUDGET", "120"))
+        self.max_turns = int(os.getenv("GAME_MAX_TURNS", "10"))
+        self._encoding = None
+        self._encoding_loaded = False
+
+        # Static prefixes never change per language, so they are built once and sent first
+        # to keep the provider-side prompt cache hot across every turn of every game
+        self.static_prefixes: Dict[Language, str] = {
+            language: STATIC_PROMPT_TEMPLATE.format(
+                language_instruction=Messages.get_language_instruction(language),
+                **get_turn_phases(self.max_turns)
+            )
+            for language in Language
+        }
+        self.narration_prefixes: Dict[Language, str] = {
+            language: NARRATION_PROMPT_TEMPLATE.format(
+                language_instruction=Messages.get_language_instruction(language),
+                max_turns=self.max_turns
+            )
+            for language in Language
+        }
+        # Token counts of the constant prefixes, filled once per (language, narration) on first use
+        # so the tokenizer still loads lazily rather than at boot
+        self._prefix_tokens: Dict[Tuple[Language, bool], int] = {}
+
+    # tiktoken is imported and its encoding loaded on first use to keep worker boot fast
+    @property
+    def encoding(self):
+        if not self._encoding_loaded:
+            self._encoding = self._load_encoding()
+            self._encoding_loaded = True
+        return self._encoding
+
+    def _load_encoding(self):
+        try:
+            import tiktoken
+        except ImportError:
+            self.logger.warning("tiktoken not installed - using approximate token counts")
+            return None
+
+        try:
+            return tiktoken.get_encoding(os.getenv("PROMPT_TOKENIZER_ENCODING", "o200k_base"))
+        except Exception as e:
+            self.logger.warning(f"Failed to load tokenizer, using approximate token counts: {e}")
+            return None
+
+    def count_tokens(self, text: str) -> int:
+        if self.encoding is not None:
+            return len(self.encoding.encode(text))
+        return max(1, len(text.encode("utf-8")) // 4)
+
+    def truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+        if max_tokens <= 0:
+            return ""
+
+        if self.encoding is not None:
+            tokens = self.encoding.encode(text)
+            if len(tokens) <= max_tokens:
+                return text
+            return self.encoding.decode(tokens[:max_tokens]) + "…"
+
+        encoded = text.encode("utf-8")
+        if len(encoded) <= max_tokens * 4:
+            return text
+        return encoded[:max_tokens * 4].decode("utf-8", errors="ignore") + "…"
+
+    def get_static_prefix(self, language: Language, narration: bool = False) -> str:
+        prefixes = self.narration_prefixes if narration else self.static_prefixes
+        return prefixes.get(language, prefixes[Language.EN])
+
+    def build_messages(self, game_state: GameSession, action: str, relevant_events: List[Any],
+                       story_summary: str = "", outcome: Optional[str] = None,
+                       degraded: bool = False) -> List[Dict[str, str]]:
+        token_budget = self.degraded_context_token_budget if degraded else self.context_token_budget
+        context = self.build_context(game_state, relevant_events, token_budget)
+        inventory_str = ", ".join(game_state.player.inventory) if game_state.player.inventory else "empty"
+
+        dynamic_suffix = DYNAMIC_PROMPT_TEMPLATE.format(
+            player_name=game_state.player.name,
+            hp=game_state.player.hp,
+            max_hp=game_state.player.max_hp,
+            level=game_state.player.level,
+            experience=game_state.player.experience,
+            turn=game_state.turn_count + 1,
+            inventory=inventory_str,
+            action=action,
+            context=context,
+            story_summary=f"Story So Far:\n{story_summary}\n\n" if story_summary else "",
+            outcome=f"\nResolved Outcome:\n{outcome}\n" if outcome else ""
+        )
+
+        narration = outcome is not None
+        static_prefix = self.get_static_prefix(game_state.language, narration=narration)
+        metrics.observe("prompt.input_tokens",
+                        self._count_prefix_tokens(game_state.language, narration) + self.count_tokens(dynamic_suffix))
+
+        return [
+            {"role": "system", "content": static_prefix},
+            {"role": "user", "content": dynamic_suffix}
+        ]
+
+    def _count_prefix_tokens(self, language: Language, narration: bool) -> int:
+        key = (language, narration)
+        count = self._prefix_tokens.get(key)
+        if count is None:
+            count = self._prefix_tokens[key] = self.count_tokens(self.get_static_prefix(language, narration))
+        return count
+
+    def build_context(self, game_state: GameSession, relevant_events: List[Any],
+                      token_budget: Optional[int] = None) -> str:
+        if not relevant_events:
+            return Messages.get_context_no_events(game_state.language)
+
+        # The previous turn (similarity 1.0) always leads, then the best retrieved matches
+        ranked_events = sorted(
+            enumerate(relevant_events),
+            key=lambda pair: (-self._get_similarity(pair[1]), pair[0])
+        )
+
+        context_parts = []
+        remaining_tokens = self.context_token_budget if token_budget is None else token_budget
+        for _, event in ranked_events:
+            line = self._format_event(event)
+            line_tokens = self.count_tokens(line)
+
+            if line_tokens <= remaining_tokens:
+                context_parts.append(line)
+                remaining_tokens -= line_tokens
+            elif not context_parts:
+                context_parts.append(self.truncate_to_tokens(line, remaining_tokens))
+                remaining_tokens = 0
+
+            if remaining_tokens <= 0:
+                break
+
+        # Events that did not fit, including those never reached once the budget ran out
+        dropped = len(ranked_events) - len(context_parts)
+        if dropped:
+            metrics.increment("prompt.context_events_dropped", dropped)
+
+        return "\n".join(context_parts)
+
+    def _get_similarity(self, event: Any) -> float:
+        if isinstance(event, dict):
+            return float(event.get('similarity', 0) or 0)
+        return 0.0
+
+    def _format_event(self, event: Any) -> str:
+        if isinstance(event, dict):
+            content = str(event.get('content', ''))
+            similarity = event.get('similarity', 0)
+            return f"- {content} (similarity: {similarity:.2f})"
+        return f"- {str(event)}"
@@ -0,0 +1,159 @@
+import asyncio
+import gzip
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from .vector_service import VectorService
+from ..models.game_session import GameSession
+from ..models.game_state import GameStatus
+from ..utils.logger import setup_logger
+
+
+class RetentionService:
+    MODES = ("off", "delete", "archive")
+
+    def __init__(self, vector_service: VectorService):
+        self.logger = setup_logger(__name__)
+        self.vector_service = vector_service
+        self.mode = os.getenv("RAG_RETENTION_MODE", "delete").lower()
+        self.retention_hours = float(os.getenv("RAG_RETENTION_HOURS", "24"))
+        self.interval_seconds = float(os.getenv("RAG_RETENTION_INTERVAL_SECONDS", "3600"))
+        self.archive_directory = os.getenv("RAG_ARCHIVE_DIRECTORY", "./chroma_archive")
+        # VACUUM runs on a second SQLite connection beside the live PersistentClient and waits
+        # for Chroma's write lock; see DatabaseModel.compact
+        self.vacuum = os.getenv("RAG_RETENTION_VACUUM", "true").lower() == "true"
+        self._task: Optional[asyncio.Task] = None
+
+        if self.mode not in self.MODES:
+            self.logger.warning(f"Unknown retention mode '{self.mode}', retention disabled")
+            self.mode = "off"
+
+    def is_enabled(self) -> bool:
+        return self.mode != "off"
+
+    async def select_expired(self, games: Dict[str, GameSession]) -> List[str]:
+        """Finished games past the window, plus stored games that are no longer live.
+
+        Games from earlier process lifetimes (or dropped from memory) only exist in Chroma;
+        one with no event inside the window cannot be resumed, so its events expire too.
+        """
+        if not self.is_enabled():
+            return []
+
+        cutoff = datetime.utcnow() - timedelta(hours=self.retention_hours)
+        expired = [
+            game_id for game_id, game_state in games.items()
+            if game_state.status in (GameStatus.COMPLETED, GameStatus.GAME_OVER)
+            and game_state.finished_at is not None
+            and game_state.finished_at <= cutoff
+        ]
+
+        loop = asyncio.get_running_loop()
+        try:
+            last_activity = await loop.run_in_executor(None, self.vector_service.get_game_last_activity)
+        except Exception as e:
+            self.logger.error(f"Failed to scan stored games for retention: {e}")
+            return expired
+
+        expired.extend(
+            game_id for game_id, last_event_at in last_activity.items()
+            if game_id not in games and last_event_at <= cutoff
+        )
+        return expired
+
+    async def purge_games(self, game_ids: List[str]) -> Dict[str, Any]:
+        report = {
+            "mode": self.mode,
+            "games": 0,
+            "game_ids": [],
+            "events_deleted": 0,
+            "archived_files": [],
+            "bytes_before": 0,
+            "bytes_after": 0,
+            "bytes_reclaimed": 0
+        }
+        if not self.is_enabled() or not game_ids:
+            return report
+
+        loop = asyncio.get_running_loop()
+        report["bytes_before"] = await loop.run_in_executor(None, self.vector_service.get_storage_size)
+
+        for game_id in game_ids:
+            try:
+                if self.mode == "archive":
+                    archive_path = await loop.run_in_executor(None, self._archive_game, game_id)
+                    if archive_path:
+                        report["archived_files"].append(archive_path)
+
+                deleted = await loop.run_in_executor(None, self.vector_service.delete_game_events, game_id)
+                report["events_deleted"] += deleted
+                report["games"] += 1
+                report["game_ids"].append(game_id)
+
+            except Exception as e:
+                self.logger.error(f"Failed to purge game events for {game_id}: {e}")
+
+        if report["events_deleted"] > 0 and self.vacuum:
+            await loop.run_in_executor(None, self.vector_service.compact_storage)
+
+        report["bytes_after"] = await loop.run_in_executor(None, self.vector_service.get_storage_size)
+        report["bytes_reclaimed"] = max(0, report["bytes_before"] - report["bytes_after"])
+
+        self.logger.info(
+            f"Retention purged {report['events_deleted']} events from {report['games']} games, "
+            f"reclaimed {report['bytes_reclaimed']} bytes"
+        )
+        return report
+
+    def _archive_game(self, game_id: str) -> Optional[str]:
+        events = self.vector_service.get_game_events(game_id)
+        if not events["ids"]:
+            return None
+
+        os.makedirs(self.archive_directory, exist_ok=True)
+        archive_path = os.path.join(self.archive_directory, f"{game_id}.json.gz")
+
+        # Columnar layout: one array per field keeps repeated metadata keys out of every row
+        columns = {
+            "game_id": game_id,
+            "archived_at": datetime.utcnow().isoformat(),
+            "ids": events["ids"],
+            "documents": events["documents"],
+            "metadatas": events["metadatas"],
+            "embeddings": events["embeddings"]
+        }
+        with gzip.open(archive_path, "wt", encoding="utf-8") as f:
+            json.dump(columns, f, ensure_ascii=False, separators=(",", ":"))
+
+        self.logger.info(f"Archived {len(events['ids'])} game events to {archive_path}")
+        return archive_path
+
+    def start(self, job: Callable[[], Awaitable[Dict[str, Any]]]):
+        if not self.is_enabled() or self._task:
+            return
+
+        self._task = asyncio.create_task(self._run_forever(job))
+        self.logger.info(
+            f"Retention job started: mode={self.mode}, after {self.retention_hours}h, "
+            f"every {self.interval_seconds}s"
+        )
+
+    async def stop(self):
+        if not self._task:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run_forever(self, job: Callable[[], Awaitable[Dict[str, Any]]]):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await job()
+            except Exception as e:
+                self.logger.error(f"Retention job failed: {e}")
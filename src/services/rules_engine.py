@@ -0,0 +1,243 @@
+import os
+import random
+import re
+from typing import Any, Dict, List, Optional
+from ..data import SAMPLE_MONSTERS, SAMPLE_ITEMS
+from ..models.game_event import HP_CHANGE_RANGE, EXP_GAIN_RANGE
+from ..models.game_session import GameSession
+from ..utils.keyword_automaton import KeywordAutomaton
+from ..utils.logger import setup_logger
+
+ATTACK_BONUS = re.compile(r"attack by (\d+)", re.IGNORECASE)
+DEFENSE_BONUS = re.compile(r"defense by (\d+)", re.IGNORECASE)
+
+# Latin keywords match whole words only ("rest" is not in "forest"); CJK keywords match
+# anywhere, so none is a single character ("打" would fire on 打開寶箱). The first intent
+# with a match wins, so fleeing a battle is not read as attacking
+INTENT_KEYWORDS = {
+    "flee": ("flee", "run away", "escape", "retreat", "逃跑", "逃走", "逃離", "撤退"),
+    "attack": ("attack", "fight", "strike", "slash", "battle", "攻擊", "戰鬥", "打鬥", "攻打", "砍殺"),
+    "rest": ("rest", "sleep", "heal", "recover", "休息", "睡覺", "治療", "恢復"),
+    "explore": ("explore", "search", "look", "investigate", "探索", "搜索", "搜尋", "調查", "查看"),
+}
+INTENT_PRIORITY = {intent: rank for rank, intent in enumerate(INTENT_KEYWORDS)}
+
+TIER_EXP = {"common": 20, "elite": 45, "boss": 100}
+# Catalogue HP is tuned for long fights; a turn resolves one short exchange
+TIER_HP_SCALE = {"common": 1.0, "elite": 0.8, "boss": 0.25}
+MAX_ROUNDS = 4
+LOOT_CHANCE = {"common": 0.35, "elite": 0.6, "boss": 1.0}
+EXPLORE_ENCOUNTER_CHANCE = 0.5
+EXPLORE_ITEM_CHANCE = 0.25
+
+
+def get_turn_phases(max_turns: int) -> Dict[str, Any]:
+    # Escalation bands scale with the campaign length; 10 turns gives 1–3, 4–6, 7–9, 10
+    early_end = max(1, round(max_turns * 0.3))
+    mid_end = max(early_end + 1, round(max_turns * 0.6))
+    late_end = max(mid_end + 1, max_turns - 1)
+    return {
+        "encounter_turns": ", ".join(str(turn) for turn in range(3, max_turns, 3)),
+        "early_end": early_end,
+        "mid_start": early_end + 1,
+        "mid_end": mid_end,
+        "late_start": mid_end + 1,
+        "late_end": late_end,
+        "boss_start": max(mid_end + 1, late_end - 1),
+        "max_turns": max_turns
+    }
+
+
+class RulesEngine:
+    """Resolves each turn's mechanics locally so the LLM only has to narrate the outcome."""
+
+    def __init__(self):
+        self.logger = setup_logger(__name__)
+        self.enabled = os.getenv("RULES_ENGINE_ENABLED", "true").lower() == "true"
+        self.seed = os.getenv("RULES_ENGINE_SEED", "")
+        self.max_turns = int(os.getenv("GAME_MAX_TURNS", "10"))
+        self.phases = get_turn_phases(self.max_turns)
+
+        self.monsters_by_tier: Dict[str, List[Dict[str, Any]]] = {}
+        for monster in SAMPLE_MONSTERS.values():
+            self.monsters_by_tier.setdefault(monster["type"], []).append(monster)
+
+        self.item_bonuses: Dict[str, Dict[str, int]] = {}
+        for item in SAMPLE_ITEMS.values():
+            attack = ATTACK_BONUS.search(item.get("effects", ""))
+            defense = DEFENSE_BONUS.search(item.get("effects", ""))
+            self.item_bonuses[item["name"]] = {
+                "attack": int(attack.group(1)) if attack else 0,
+                "defense": int(defense.group(1)) if defense else 0
+            }
+
+        self.intent_matcher = KeywordAutomaton()
+        for intent, keywords in INTENT_KEYWORDS.items():
+            for keyword in keywords:
+                self.intent_matcher.add(keyword, intent)
+        self.intent_matcher.build()
+
+        self.findable_items = [
+            item["name"] for item in SAMPLE_ITEMS.values()
+            if item.get("rarity") in ("common", "uncommon")
+        ]
+
+    def get_rng(self, game_id: str, turn: int) -> random.Random:
+        # Same game, turn and seed always resolve identically, which makes turns replayable
+        return random.Random(f"{self.seed}:{game_id}:{turn}")
+
+    def classify_intent(self, action: str) -> str:
+        intents = {intent for _, _, intent in self.intent_matcher.find(action)}
+        if not intents:
+            return "other"
+        return min(intents, key=INTENT_PRIORITY.__getitem__)
+
+    def resolve_turn(self, game_state: GameSession, action: str, intent: Optional[str] = None) -> Dict[str, Any]:
+        """Resolve the turn for action; callers that already classified it pass intent."""
+        turn = game_state.turn_count + 1
+        rng = self.get_rng(game_state.game_id, turn)
+        intent = intent or self.classify_intent(action)
+
+        outcome: Dict[str, Any] = {
+            "turn": turn,
+            "intent": intent,
+            "result": intent,
+            "encounter": None,
+            "effects": {"player_hp_change": 0, "player_exp_gain": 0, "item_gain": None}
+        }
+
+        if self._has_encounter(turn, intent, rng):
+            monster = self._pick_monster(turn, rng)
+            self._resolve_combat(game_state, intent, monster, rng, outcome)
+        elif intent == "rest":
+            outcome["effects"]["player_hp_change"] = rng.randint(10, 25)
+        elif intent == "explore":
+            outcome["effects"]["player_exp_gain"] = rng.randint(5, 10)
+            if rng.random() < EXPLORE_ITEM_CHANCE:
+                outcome["effects"]["item_gain"] = rng.choice(self.findable_items)
+                outcome["result"] = "found_item"
+        else:
+            outcome["effects"]["player_exp_gain"] = rng.randint(3, 8)
+            outcome["result"] = "uneventful" if intent != "flee" else "escaped"
+
+        outcome["effects"]["player_hp_change"] = min(
+            max(outcome["effects"]["player_hp_change"], HP_CHANGE_RANGE[0]), HP_CHANGE_RANGE[1]
+        )
+        outcome["effects"]["player_exp_gain"] = min(
+            max(outcome["effects"]["player_exp_gain"], EXP_GAIN_RANGE[0]), EXP_GAIN_RANGE[1]
+        )
+        return outcome
+
+    def _has_encounter(self, turn: int, intent: str, rng: random.Random) -> bool:
+        if turn % 3 == 0 or turn >= self.phases["boss_start"]:
+            return True
+        if intent == "attack":
+            return True
+        if intent == "explore":
+            return rng.random() < EXPLORE_ENCOUNTER_CHANCE
+        return False
+
+    def _pick_monster(self, turn: int, rng: random.Random) -> Dict[str, Any]:
+        if turn >= self.max_turns:
+            tier = "boss"
+        elif turn > self.phases["mid_end"]:
+            tier = "elite"
+        elif turn > self.phases["early_end"]:
+            tier = "elite" if rng.random() < 0.35 else "common"
+        else:
+            tier = "common"
+
+        candidates = self.monsters_by_tier.get(tier) or self.monsters_by_tier["common"]
+        return rng.choice(candidates)
+
+    def _player_stats(self, game_state: GameSession) -> Dict[str, int]:
+        player = game_state.player
+        attack = 25 + 5 * (player.level - 1)
+        defense = 10 + 3 * (player.level - 1)
+        for item in player.inventory:
+            bonus = self.item_bonuses.get(item)
+            if bonus:
+                attack += bonus["attack"]
+                defense += bonus["defense"]
+        return {"attack": attack, "defense": defense, "speed": 50}
+
+    def _resolve_combat(self, game_state: GameSession, intent: str, monster: Dict[str, Any],
+                        rng: random.Random, outcome: Dict[str, Any]):
+        stats = monster["stats"]
+        player = self._player_stats(game_state)
+        hit_chance = min(0.95, max(0.4, 0.75 + (player["speed"] - stats["speed"]) / 200))
+
+        # Fleeing trades the player's strikes for a chance to break off after one exchange
+        rounds = 1 if intent == "flee" else MAX_ROUNDS
+        tier = monster["type"]
+        max_hp = max(1, int(stats["hp"] * TIER_HP_SCALE.get(tier, 1.0)))
+        monster_hp = max_hp
+        damage_taken = 0
+        critical = False
+        abilities_used: List[str] = []
+        rounds_fought = 0
+
+        for _ in range(rounds):
+            rounds_fought += 1
+            if intent != "flee" and rng.random() < hit_chance:
+                is_critical = rng.random() < 0.1
+                critical = critical or is_critical
+                damage = player["attack"] * 100 / (100 + stats["defense"]) * rng.uniform(0.85, 1.15)
+                monster_hp -= int(damage * (2 if is_critical else 1))
+                if monster_hp <= 0:
+                    break
+
+            ability: Optional[str] = rng.choice(monster["abilities"]) if rng.random() < 0.4 else None
+            if ability and ability not in abilities_used:
+                abilities_used.append(ability)
+            damage_taken += int(self._monster_damage(stats, player) * rng.uniform(0.5, 1.0) * (1.3 if ability else 1))
+
+        effects = outcome["effects"]
+        effects["player_hp_change"] = -damage_taken
+
+        if monster_hp <= 0:
+            outcome["result"] = "victory"
+            effects["player_exp_gain"] = TIER_EXP.get(tier, 20)
+            if rng.random() < LOOT_CHANCE.get(tier, 0.35):
+                effects["item_gain"] = rng.choice(monster["loot"])
+        elif intent == "flee":
+            escaped = rng.random() < (0.8 if tier == "common" else 0.5)
+            outcome["result"] = "escaped" if escaped else "caught"
+            if not escaped:
+                effects["player_hp_change"] -= self._monster_damage(stats, player)
+        else:
+            # Partial credit for the damage dealt to a monster that survived the exchange
+            dealt = 1 - max(0, monster_hp) / max_hp
+            outcome["result"] = "retreat"
+            effects["player_exp_gain"] = int(TIER_EXP.get(tier, 20) * dealt * 0.5)
+
+        outcome["encounter"] = {
+            "monster": monster["name"],
+            "tier": tier,
+            "element": monster.get("element", "none"),
+            "abilities_used": abilities_used,
+            "rounds": rounds_fought,
+            "critical_hit": critical,
+            "monster_hp_left": max(0, monster_hp)
+        }
+
+    def _monster_damage(self, stats: Dict[str, int], player: Dict[str, int]) -> int:
+        return max(2, (stats["attack"] - player["defense"]) // 6)
+
+    def describe_outcome(self, outcome: Dict[str, Any]) -> str:
+        effects = outcome["effects"]
+        lines = [f"- Result: {outcome['result']}"]
+
+        encounter = outcome.get("encounter")
+        if encounter:
+            lines.append(f"- Encounter: {encounter['monster']} ({encounter['tier']}, {encounter['element']})")
+            lines.append(f"- Rounds: {encounter['rounds']}, critical hit: {'yes' if encounter['critical_hit'] else 'no'}")
+            if encounter["abilities_used"]:
+                lines.append(f"- Monster used: {', '.join(encounter['abilities_used'])}")
+            lines.append(f"- Monster HP left: {encounter['monster_hp_left']}")
+
+        lines.append(f"- Player HP change: {effects['player_hp_change']:+d}")
+        lines.append(f"- Player EXP gain: {effects['player_exp_gain']:+d}")
+        if effects["item_gain"]:
+            lines.append(f"- Item gained: {effects['item_gain']}")
+        return "\n".join(lines)
@@ -0,0 +1,276 @@
+import base64
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional
+from ..models.game_session import GameSession
+from ..utils.logger import setup_logger
+
+_STOP = object()
+
+_current_frame: ContextVar[Optional[Dict[str, Any]]] = ContextVar("session_recorder_frame", default=None)
+
+
+def annotate_turn(key: str, value: Any):
+    frame = _current_frame.get()
+    if frame is not None:
+        frame[key] = value
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def encode_vector(vector: List[float]) -> str:
+    return base64.b64encode(array("f", vector).tobytes()).decode("ascii")
+
+
+def decode_vector(encoded: str) -> List[float]:
+    vector = array("f")
+    vector.frombytes(base64.b64decode(encoded))
+    return vector.tolist()
+
+
+class SessionRecorder:
+    def __init__(self, path: Optional[str] = None):
+        self.logger = setup_logger(__name__)
+        self.path = path or os.getenv("SESSION_RECORDING_PATH")
+        self._file = None
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._recorded_embeddings = set()
+
+        if self.path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+                self._thread = threading.Thread(target=self._run, name="session-recorder", daemon=True)
+                self._thread.start()
+                self.logger.info(f"Recording game sessions to {self.path}")
+            except Exception as e:
+                self.logger.error(f"Failed to open session recording {self.path}: {e}")
+                self._file = None
+
+    def is_enabled(self) -> bool:
+        return self._thread is not None
+
+    def wrap_client(self, client):
+        return RecordingClient(client, self) if self.is_enabled() and client else client
+
+    def record_game(self, game_state: GameSession):
+        if not self.is_enabled():
+            return
+
+        self._write({
+            "k": "g",
+            "g": game_state.game_id,
+            "n": game_state.player.name,
+            "l": game_state.language.value,
+            "ts": time.time()
+        })
+
+    @contextmanager
+    def record_turn(self, game_id: str, action: str) -> Iterator[Optional[Dict[str, Any]]]:
+        if not self.is_enabled():
+            yield None
+            return
+
+        frame = {"k": "t", "g": game_id, "a": action, "raw": []}
+        token = _current_frame.set(frame)
+        start = time.perf_counter()
+        try:
+            yield frame
+        finally:
+            _current_frame.reset(token)
+            frame["ms"] = round((time.perf_counter() - start) * 1000, 2)
+            self._write(frame)
+
+    def finish_turn(self, frame: Optional[Dict[str, Any]], game_event: Dict, game_state: GameSession):
+        if frame is None:
+            return
+
+        frame["turn"] = game_event.get("turn", 0)
+        frame["fx"] = game_event.get("effects", {})
+        frame["s"] = snapshot_state(game_state)
+
+    def record_embedding(self, text: str, vector: List[float]):
+        key = text_hash(text)
+        if key in self._recorded_embeddings:
+            return
+
+        self._recorded_embeddings.add(key)
+        self._write({"k": "e", "h": key, "v": encode_vector(vector)})
+
+    def record_completion(self, content: Optional[str]):
+        frame = _current_frame.get()
+        if frame is not None and "raw" in frame:
+            frame["raw"].append(content)
+
+    def _write(self, record: Dict[str, Any]):
+        # Serialized here, while the frame is still consistent; file I/O happens on the writer thread
+        if self._thread is not None:
+            self._queue.put(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            lines = [self._queue.get()]
+            try:
+                while True:
+                    lines.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            if _STOP in lines:
+                stopping = True
+                lines = [line for line in lines if line is not _STOP]
+
+            try:
+                if lines:
+                    self._file.write("\n".join(lines) + "\n")
+                    self._file.flush()
+            except Exception as e:
+                self.logger.error(f"Failed to write session recording: {e}")
+
+        self._file.close()
+        self._file = None
+
+    def close(self):
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+
+def snapshot_state(game_state: GameSession) -> List[Any]:
+    player = game_state.player
+    return [player.hp, player.max_hp, player.experience, player.level,
+            list(player.inventory), game_state.status.value, game_state.turn_count]
+
+
+class _RecordingEmbeddings:
+    def __init__(self, embeddings, recorder: SessionRecorder):
+        self._embeddings = embeddings
+        self._recorder = recorder
+
+    async def create(self, **kwargs):
+        response = await self._embeddings.create(**kwargs)
+        texts = kwargs.get("input")
+        texts = [texts] if isinstance(texts, str) else list(texts or [])
+        for item in response.data:
+            if item.index < len(texts):
+                self._recorder.record_embedding(texts[item.index], item.embedding)
+        return response
+
+
+class _RecordingCompletions:
+    def __init__(self, completions, recorder: SessionRecorder):
+        self._completions = completions
+        self._recorder = recorder
+
+    async def create(self, **kwargs):
+        response = await self._completions.create(**kwargs)
+        self._recorder.record_completion(response.choices[0].message.content)
+        return response
+
+
+class RecordingClient:
+    def __init__(self, client, recorder: SessionRecorder):
+        self._client = client
+        self.embeddings = _RecordingEmbeddings(client.embeddings, recorder)
+        self.chat = SimpleNamespace(completions=_RecordingCompletions(client.chat.completions, recorder))
+
+    def __getattr__(self, name: str):
+        return getattr(self._client, name)
+
+
+class SessionRecording:
+    def __init__(self, path: str):
+        self.games: List[Dict[str, Any]] = []
+        self.turns: Dict[str, List[Dict[str, Any]]] = {}
+        self.embeddings: Dict[str, List[float]] = {}
+
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                kind = record.get("k")
+                if kind == "g":
+                    self.games.append(record)
+                    self.turns.setdefault(record["g"], [])
+                elif kind == "t":
+                    self.turns.setdefault(record["g"], []).append(record)
+                elif kind == "e":
+                    self.embeddings[record["h"]] = decode_vector(record["v"])
+
+
+def recorded_retrieval() -> Optional[List[Dict[str, Any]]]:
+    """Events the current replayed turn retrieved when it was recorded, if the recording kept them"""
+    frame = _current_frame.get()
+    return frame.get("retrieval") if frame else None
+
+
+@contextmanager
+def replay_turn(turn: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    frame: Dict[str, Any] = {"replay": deque(turn.get("raw", []))}
+    recorded = turn.get("r")
+    # Recordings made before content was kept only have [id, similarity]
+    if recorded is not None and all(len(event) >= 3 for event in recorded):
+        frame["retrieval"] = [
+            {"id": event_id, "similarity": similarity, "content": content}
+            for event_id, similarity, content, *_ in recorded
+        ]
+    token = _current_frame.set(frame)
+    try:
+        yield frame
+    finally:
+        _current_frame.reset(token)
+
+
+class _ReplayEmbeddings:
+    def __init__(self, recording: SessionRecording):
+        self._recording = recording
+        self.misses = 0
+
+    async def create(self, **kwargs):
+        texts = kwargs.get("input")
+        texts = [texts] if isinstance(texts, str) else list(texts or [])
+        data = []
+        for index, text in enumerate(texts):
+            vector = self._recording.embeddings.get(text_hash(text))
+            if vector is None:
+                self.misses += 1
+                raise LookupError(f"No recorded embedding for: {text[:80]}")
+            data.append(SimpleNamespace(embedding=vector, index=index))
+        return SimpleNamespace(data=data, usage=None)
+
+
+class _ReplayCompletions:
+    def __init__(self):
+        self.misses = 0
+
+    async def create(self, **kwargs):
+        frame = _current_frame.get()
+        if not frame or not frame.get("replay"):
+            self.misses += 1
+            raise LookupError("No recorded completion for this turn")
+
+        content = frame["replay"].popleft()
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+class ReplayClient:
+    def __init__(self, recording: SessionRecording):
+        self.embeddings = _ReplayEmbeddings(recording)
+        self.chat = SimpleNamespace(completions=_ReplayCompletions())
@@ -0,0 +1,149 @@
+import asyncio
+import os
+import re
+from typing import Any, Dict, List, Optional
+from .llm_service import LLMService
+from ..models.game_session import GameSession
+from ..utils.logger import setup_logger
+from ..utils.metrics import metrics
+from ..utils.usage import usage_scope, usage_tracker
+
+SENTENCE_END = re.compile(r"(?<=[.!?。！？])\s*")
+
+
+class StoryMemory:
+    def __init__(self, llm_service: LLMService):
+        self.logger = setup_logger(__name__)
+        self.llm_service = llm_service
+        self.recent_turns = int(os.getenv("STORY_RECENT_TURNS", "3"))
+        self.summary_max_chars = int(os.getenv("STORY_SUMMARY_MAX_CHARS", "600"))
+        self.summary_mode = os.getenv("STORY_SUMMARY_MODE", "extractive").lower()
+        self.summary_model = os.getenv("STORY_SUMMARY_MODEL", "gpt-5-nano")
+        self.summaries: Dict[str, str] = {}
+        self._pending: Dict[str, List[str]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def record_turn(self, game_state: GameSession, action: str, narrative: str):
+        recent = game_state.recent_turns + ((action, narrative),)
+        overflow = len(recent) - self.recent_turns
+        game_state.recent_turns = recent[max(0, overflow):]
+        if overflow <= 0:
+            return
+
+        pending = self._pending.setdefault(game_state.game_id, [])
+        for evicted_action, evicted_narrative in recent[:overflow]:
+            pending.append(f"Player: {evicted_action}")
+            pending.append(f"Game: {evicted_narrative}")
+        self._schedule(game_state.game_id)
+
+    def get_summary(self, game_id: str) -> str:
+        return self.summaries.get(game_id, "")
+
+    def export(self, game_id: str) -> Dict[str, Any]:
+        return {"summary": self.get_summary(game_id), "pending": list(self._pending.get(game_id, []))}
+
+    def restore(self, game_id: str, state: Dict[str, Any]):
+        if state.get("summary"):
+            self.summaries[game_id] = state["summary"]
+        if state.get("pending"):
+            self._pending.setdefault(game_id, []).extend(state["pending"])
+            self._schedule(game_id)
+
+    def resume(self):
+        """Summarize turns evicted while no event loop was running, e.g. during journal recovery"""
+        for game_id in list(self._pending):
+            self._schedule(game_id)
+
+    def forget(self, game_id: str):
+        self.summaries.pop(game_id, None)
+        self._pending.pop(game_id, None)
+        task = self._tasks.pop(game_id, None)
+        if task:
+            task.cancel()
+
+    def _schedule(self, game_id: str):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if self.summary_mode == "llm":
+                # Kept pending so resume() summarizes them with the LLM, as the live turns were
+                return
+            # No loop (e.g. offline rebuilds): summarize inline with the local summarizer
+            self._apply_extractive(game_id, self._pending.pop(game_id, []))
+            return
+
+        if game_id not in self._tasks:
+            self._tasks[game_id] = loop.create_task(self._summarize(game_id))
+
+    async def _summarize(self, game_id: str):
+        try:
+            while self._pending.get(game_id):
+                evicted = self._pending.pop(game_id)
+                if self.summary_mode == "llm":
+                    summary = await self._summarize_with_llm(self.get_summary(game_id), evicted)
+                    if summary:
+                        self.summaries[game_id] = summary[:self.summary_max_chars]
+                        metrics.increment("story.summaries_llm")
+                        continue
+
+                self._apply_extractive(game_id, evicted)
+
+        except Exception as e:
+            self.logger.error(f"Failed to summarize story for {game_id}: {e}")
+        finally:
+            self._tasks.pop(game_id, None)
+
+    def _apply_extractive(self, game_id: str, evicted: List[str]):
+        if not evicted:
+            return
+
+        segments = [self.summaries[game_id]] if self.summaries.get(game_id) else []
+        action = None
+        for line in evicted:
+            if line.startswith("Player: "):
+                action = line[len("Player: "):]
+            elif line.startswith("Game: "):
+                sentence = self._first_sentence(line[len("Game: "):])
+                segments.append(f"{action} → {sentence}" if action else sentence)
+                action = None
+
+        summary = " ".join(segments)
+        if len(summary) > self.summary_max_chars:
+            # Keep the opening of the campaign and the most recent developments
+            head_chars = self.summary_max_chars // 3
+            tail_chars = self.summary_max_chars - head_chars - 3
+            summary = f"{summary[:head_chars]}...{summary[-tail_chars:]}"
+
+        self.summaries[game_id] = summary
+        metrics.increment("story.summaries_extractive")
+
+    def _first_sentence(self, text: str) -> str:
+        parts = SENTENCE_END.split(text.strip(), maxsplit=1)
+        return parts[0] if parts else text
+
+    async def _summarize_with_llm(self, summary: str, evicted: List[str]) -> Optional[str]:
+        prompt = (
+            f"Summarize this dungeon adventure in at most {self.summary_max_chars} characters, "
+            "keeping key encounters, items and injuries. Use the same language as the story.\n\n"
+            f"Story so far: {summary or '(none)'}\n\n"
+            "New turns:\n" + "\n".join(evicted)
+        )
+
+        # Summaries are background work; they never take the breaker's half-open probe
+        if not self.llm_service.is_available():
+            return None
+
+        try:
+            with usage_scope(phase="story_summary"):
+                response = await self.llm_service.get_client().chat.completions.create(
+                    model=self.summary_model,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                usage_tracker.record_completion(self.summary_model, getattr(response, "usage", None))
+            self.llm_service.breaker.record_success()
+            return (response.choices[0].message.content or "").strip()
+
+        except Exception as e:
+            self.llm_service.breaker.record_failure()
+            self.logger.warning(f"LLM story summary failed, using extractive summary: {e}")
+            return None
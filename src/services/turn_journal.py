@@ -0,0 +1,218 @@
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from ..models.game_session import GameSession
+from ..models.game_state import GameStatus
+from ..utils.logger import setup_logger
+from ..utils.metrics import metrics
+
+_STOP = object()
+
+
+class TurnJournal:
+    """Append-only JSONL log of game creation, applied effect sets and periodic snapshots.
+
+    Record kinds: "g" game created, "t" turn applied, "s" full snapshot of one game,
+    "x" game dropped. Writes are queued and fsynced in groups by a background thread;
+    compaction keeps only each live game's latest snapshot plus the turns after it, and
+    drops games that finished more than TURN_JOURNAL_FINISHED_HOURS ago, so the file
+    (and recovery time) tracks active games rather than total history.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.logger = setup_logger(__name__)
+        self.path = path or os.getenv("TURN_JOURNAL_PATH")
+        self.fsync_interval = float(os.getenv("TURN_JOURNAL_FSYNC_MS", "50")) / 1000
+        self.snapshot_every = max(1, int(os.getenv("TURN_JOURNAL_SNAPSHOT_EVERY", "5")))
+        self.compact_every = int(os.getenv("TURN_JOURNAL_COMPACT_EVERY", "10000"))
+        # Independent of RAG_RETENTION_MODE, which may never drop finished games
+        self.finished_hours = float(os.getenv("TURN_JOURNAL_FINISHED_HOURS", "24"))
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._file = None
+        self._thread: Optional[threading.Thread] = None
+        self._last_sync = 0.0
+        self._appended = 0
+
+    def is_enabled(self) -> bool:
+        return self._thread is not None
+
+    def recover(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Load the live records per game, rewrite the file compacted and start the writer.
+
+        Until this has been called the journal records nothing, so scripts that build a
+        GameController without recovering never touch the file.
+        """
+        if not self.path or self.is_enabled():
+            return {}
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            games = self._read()
+            self._rewrite(games)
+            self._file = open(self.path, "a", encoding="utf-8")
+        except Exception as e:
+            self.logger.error(f"Failed to open turn journal {self.path}: {e}")
+            return {}
+
+        self._thread = threading.Thread(target=self._run, name="turn-journal", daemon=True)
+        self._thread.start()
+        self.logger.info(f"Journaling turns to {self.path} ({len(games)} games to recover)")
+        return games
+
+    def should_snapshot(self, game_state: GameSession, turn: int) -> bool:
+        # Free actions (turn 0) leave the game as it was, so they never need a snapshot
+        if not turn:
+            return False
+        return turn % self.snapshot_every == 0 or game_state.status != GameStatus.ACTIVE
+
+    def record_game(self, game_state: GameSession):
+        self._append({
+            "k": "g",
+            "g": game_state.game_id,
+            "n": game_state.player.name,
+            "l": game_state.language.value,
+            "ts": time.time()
+        })
+
+    def record_turn(self, game_id: str, action: str, game_event: Dict[str, Any]):
+        self._append({
+            "k": "t",
+            "g": game_id,
+            "a": action,
+            "n": game_event.get("narrative", "Something happened..."),
+            "turn": game_event.get("turn", 0),
+            "fx": game_event.get("effects", {}),
+            "ts": time.time()
+        })
+
+    def record_snapshot(self, game_state: GameSession, extra: Dict[str, Any]):
+        self._append({"k": "s", "g": game_state.game_id, "st": game_state.to_model().model_dump(mode="json"), **extra})
+
+    def record_end(self, game_id: str):
+        self._append({"k": "x", "g": game_id})
+
+    def _append(self, record: Dict[str, Any]):
+        # The turn path only serializes and enqueues; disk I/O happens on the writer thread
+        if self._thread is not None:
+            self._queue.put(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            lines = [self._queue.get()]
+
+            # Group commit: turns arriving within one fsync interval share a single fsync
+            delay = self._last_sync + self.fsync_interval - time.monotonic()
+            if delay > 0 and lines[0] is not _STOP:
+                time.sleep(delay)
+            try:
+                while True:
+                    lines.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            if _STOP in lines:
+                stopping = True
+                lines = [line for line in lines if line is not _STOP]
+
+            try:
+                if lines:
+                    self._file.write("\n".join(lines) + "\n")
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+                    metrics.increment("journal.records", len(lines))
+                    metrics.increment("journal.fsyncs")
+                    self._appended += len(lines)
+                self._last_sync = time.monotonic()
+
+                if self.compact_every and self._appended >= self.compact_every:
+                    self._compact()
+            except Exception as e:
+                metrics.increment("journal.write_errors")
+                self.logger.error(f"Failed to write turn journal: {e}")
+
+        self._file.close()
+        self._file = None
+
+    def _compact(self):
+        start = time.perf_counter()
+        self._file.close()
+        try:
+            games = self._read()
+            self._rewrite(games)
+        finally:
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._appended = 0
+        metrics.increment("journal.compactions")
+        metrics.set_gauge("journal.live_games", len(games))
+        self.logger.info(f"Compacted turn journal to {len(games)} games in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    def _read(self) -> Dict[str, List[Dict[str, Any]]]:
+        games: Dict[str, List[Dict[str, Any]]] = {}
+        if not os.path.exists(self.path):
+            return games
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave the last line half written; anything before it is intact
+                    metrics.increment("journal.corrupt_lines")
+                    self.logger.warning(f"Skipping unreadable turn journal line {line_number}")
+                    continue
+
+                kind, game_id = record.get("k"), record.get("g")
+                if kind in ("g", "s"):
+                    games[game_id] = [record]
+                elif kind == "t" and game_id in games:
+                    games[game_id].append(record)
+                elif kind == "x":
+                    games.pop(game_id, None)
+
+        cutoff = datetime.utcnow() - timedelta(hours=self.finished_hours)
+        expired = [game_id for game_id, records in games.items() if self._finished_before(records, cutoff)]
+        for game_id in expired:
+            del games[game_id]
+        if expired:
+            metrics.increment("journal.finished_dropped", len(expired))
+        return games
+
+    @staticmethod
+    def _finished_before(records: List[Dict[str, Any]], cutoff: datetime) -> bool:
+        # Games end on a turn that is always snapshotted, so a finished game is a lone snapshot
+        head = records[-1]
+        if head["k"] != "s":
+            return False
+        finished_at = head["st"].get("finished_at")
+        if head["st"].get("status") == GameStatus.ACTIVE.value or not finished_at:
+            return False
+        return datetime.fromisoformat(finished_at) <= cutoff
+
+    def _rewrite(self, games: Dict[str, List[Dict[str, Any]]]):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for records in games.values():
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+        # Make the rename itself durable
+        directory = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+    def close(self):
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
@@ -1,11 +1,16 @@
 import os
-from typing import List, Dict, Any, Optional
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterator, Tuple, Union
 from ..utils.logger import setup_logger
 from ..models.chroma import (
     DatabaseModel,
     EmbeddingModel,
+    LexicalIndex,
     SearchModel,
-    KnowledgeModel
+    KnowledgeModel,
+    KnowledgeBase,
+    KnowledgeRecord,
+    StatsModel
 )
 
 
@@ -16,8 +21,13 @@ class VectorService:
 
         self.database_model = DatabaseModel()
         self.embedding_model = EmbeddingModel()
-        self.search_model = SearchModel(self.database_model, self.embedding_model)
-        self.knowledge_model = KnowledgeModel(self.database_model, self.embedding_model)
+        self.database_model.collection_metadata = self.embedding_model.get_profile()
+        self.stats_model = StatsModel(self.database_model)
+        self.lexical_index = LexicalIndex()
+        self.knowledge_model = KnowledgeModel(self.database_model, self.embedding_model, self.stats_model,
+                                              self.lexical_index)
+        self.search_model = SearchModel(self.database_model, self.embedding_model, self.stats_model,
+                                        self.lexical_index, self.knowledge_model.load_lexical_scope)
 
 
     async def get_embedding(self, text: str) -> Optional[List[float]]:
@@ -33,6 +43,9 @@ class VectorService:
             metadata=metadata
         )
 
+    async def store_knowledge_batch(self, entries: List[Dict[str, Any]]) -> int:
+        return await self.knowledge_model.store_knowledge_batch(entries)
+
     async def semantic_search(self, query: str, content_type: Optional[str] = None,
                             limit: int = 5, similarity_threshold: float = 0.7,
                             game_id: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -44,6 +57,54 @@ class VectorService:
             game_id=game_id
         )
 
+    async def semantic_search_batch(self, queries: List[str], game_ids: List[str],
+                                    content_type: Optional[str] = None, limit: int = 5,
+                                    similarity_threshold: float = 0.7) -> List[List[Dict[str, Any]]]:
+        return await self.search_model.semantic_search_batch(
+            queries=queries,
+            game_ids=game_ids,
+            content_type=content_type,
+            limit=limit,
+            similarity_threshold=similarity_threshold
+        )
+
+    async def hybrid_search(self, query: str, content_type: Optional[str] = None,
+                            limit: int = 5, similarity_threshold: float = 0.7,
+                            game_id: Optional[str] = None,
+                            lexical_query: Optional[str] = None,
+                            prior_content: Optional[str] = None) -> List[Dict[str, Any]]:
+        return await self.search_model.hybrid_search(
+            query=query,
+            content_type=content_type,
+            limit=limit,
+            similarity_threshold=similarity_threshold,
+            game_id=game_id,
+            lexical_query=lexical_query,
+            prior_content=prior_content
+        )
+
+    async def hybrid_search_batch(self, queries: List[str], game_ids: List[str],
+                                  content_type: Optional[str] = None, limit: int = 5,
+                                  similarity_threshold: float = 0.7,
+                                  lexical_queries: Optional[List[str]] = None,
+                                  prior_contents: Optional[List[Optional[str]]] = None) -> List[List[Dict[str, Any]]]:
+        return await self.search_model.hybrid_search_batch(
+            queries=queries,
+            game_ids=game_ids,
+            content_type=content_type,
+            limit=limit,
+            similarity_threshold=similarity_threshold,
+            lexical_queries=lexical_queries,
+            prior_contents=prior_contents
+        )
+
+    def lexical_search(self, query: str, content_type: Union[str, Tuple[str, ...], None] = None,
+                       limit: int = 5, game_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self.search_model.lexical_search(query, content_type, limit, game_id)
+
+    def rebuild_lexical_index(self) -> int:
+        return self.knowledge_model.rebuild_lexical_index()
+
     async def ingest_game_data(self, monsters_data: Dict, items_data: Dict) -> bool:
         return await self.knowledge_model.ingest_game_data(monsters_data, items_data)
 
@@ -51,6 +112,41 @@ class VectorService:
     def get_knowledge_count(self, content_type: Optional[str] = None) -> int:
         return self.search_model.get_knowledge_count(content_type)
 
+    def iter_knowledge(self, content_type: Optional[str] = None,
+                       page_size: int = 500) -> Iterator[List[KnowledgeBase]]:
+        return self.knowledge_model.iter_knowledge(content_type, page_size)
+
+    def iter_records(self, content_type: Optional[str] = None,
+                     page_size: int = 500) -> Iterator[List[KnowledgeRecord]]:
+        return self.knowledge_model.iter_records(content_type, page_size)
+
+    def clear_knowledge(self, content_type: Optional[str] = None, batch_size: int = 500) -> int:
+        return self.knowledge_model.clear_knowledge(content_type, batch_size)
+
+    def get_game_event_count(self, game_id: str) -> int:
+        return self.search_model.get_game_event_count(game_id)
+
+    def get_knowledge_stats(self) -> Dict[str, Any]:
+        return self.stats_model.get_stats()
+
+    def reconcile_knowledge_stats(self) -> Dict[str, Any]:
+        return self.stats_model.reconcile()
+
+    def get_game_events(self, game_id: str) -> Dict[str, List]:
+        return self.knowledge_model.get_game_events(game_id)
+
+    def get_game_last_activity(self) -> Dict[str, datetime]:
+        return self.knowledge_model.get_game_last_activity()
+
+    def delete_game_events(self, game_id: str) -> int:
+        return self.knowledge_model.delete_game_events(game_id)
+
+    def get_storage_size(self) -> int:
+        return self.database_model.get_storage_size()
+
+    def compact_storage(self) -> bool:
+        return self.database_model.compact()
+
     async def close(self):
         self.logger.info("Vector service cleanup completed")
 
@@ -0,0 +1,119 @@
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+from .game_service import GameService
+from ..models.game_session import GameSession
+from ..models.game_state import Language
+from ..utils.logger import setup_logger
+from ..utils.metrics import metrics
+from ..utils.usage import usage_scope
+from ..localization import Messages
+
+
+class WarmupService:
+    """Runs once after boot so the first real turns do not pay for cold caches."""
+
+    OPENING_ACTION = "start"
+
+    def __init__(self, game_service: GameService):
+        self.logger = setup_logger(__name__)
+        self.game_service = game_service
+        self.vector_service = game_service.vector_service
+        self.enabled = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+        self.step_timeout = float(os.getenv("WARMUP_STEP_TIMEOUT_SECONDS", "30"))
+        self.status = "pending" if self.enabled else "disabled"
+        self.steps: Dict[str, Dict[str, Any]] = {}
+
+    def is_finished(self) -> bool:
+        return self.status in ("ready", "disabled")
+
+    def report(self) -> Dict[str, Any]:
+        return {"status": self.status, "steps": self.steps}
+
+    async def run(self):
+        if not self.enabled:
+            return
+
+        start = time.perf_counter()
+        for name, step in (
+            ("load_index", self._load_index),
+            ("embed_actions", self._embed_actions),
+            ("prime_llm_pool", self._prime_llm_pool),
+            ("opening_path", self._opening_path),
+        ):
+            with usage_scope(phase="warmup"):
+                await self._run_step(name, step)
+
+        self.status = "ready"
+        self.logger.info(f"Warm-up finished in {time.perf_counter() - start:.3f}s: {self.steps}")
+
+    async def _run_step(self, name: str, step: Callable[[], Awaitable[Any]]):
+        step_start = time.perf_counter()
+        try:
+            detail = await asyncio.wait_for(step(), timeout=self.step_timeout)
+            self.steps[name] = {"status": "ok", "detail": detail}
+        except Exception as e:
+            # A failed step only means that path stays cold; it must not block readiness
+            self.logger.warning(f"Warm-up step {name} failed: {e!r}")
+            self.steps[name] = {"status": "failed", "detail": str(e) or type(e).__name__}
+
+        elapsed_ms = (time.perf_counter() - step_start) * 1000
+        self.steps[name]["ms"] = round(elapsed_ms, 1)
+        metrics.observe(f"warmup.{name}_ms", elapsed_ms)
+
+    async def _load_index(self) -> Dict[str, Any]:
+        # Chroma loads the HNSW segment on the first query, so run one against a stored vector
+        def load():
+            collection = self.vector_service.database_model.get_collection()
+            sample = collection.get(limit=1, include=["embeddings"])
+            if len(sample["ids"]) and sample["embeddings"] is not None and len(sample["embeddings"]):
+                collection.query(query_embeddings=[sample["embeddings"][0]], n_results=1)
+                return {"count": collection.count(), "queried": True}
+            return {"count": 0, "queried": False}
+
+        return await asyncio.get_running_loop().run_in_executor(None, load)
+
+    def _warmup_texts(self) -> List[str]:
+        actions = [self.OPENING_ACTION]
+        for language in Language:
+            actions.extend(Messages.get_default_suggested_actions(language))
+            for keyword, event in Messages.get_fallback_events(language).items():
+                actions.append(keyword)
+                actions.extend(event.get("suggested_actions", []))
+
+        # First-turn searches use the opening query; empty results retry with the bare action
+        texts = []
+        for action in dict.fromkeys(actions):
+            texts.append(self.game_service.build_opening_query(action))
+            texts.append(action)
+        return list(dict.fromkeys(texts))
+
+    async def _embed_actions(self) -> Dict[str, Any]:
+        texts = self._warmup_texts()
+        embeddings = await self.vector_service.embedding_model.get_embeddings(texts)
+        return {"texts": len(texts), "embedded": sum(1 for embedding in embeddings if embedding)}
+
+    async def _prime_llm_pool(self) -> Dict[str, Any]:
+        if not os.getenv("OPENAI_API_KEY"):
+            return {"skipped": "no api key"}
+
+        # A models listing opens the TLS connection without spending any tokens
+        await self.game_service.llm_service.get_client().models.list()
+        return {"primed": True}
+
+    async def _opening_path(self) -> Dict[str, Any]:
+        results = await self.vector_service.semantic_search(
+            query=self.game_service.build_opening_query(self.OPENING_ACTION),
+            content_type="game_event",
+            limit=2,
+            similarity_threshold=0.3,
+            game_id="__warmup__"
+        )
+
+        # Loads the tokenizer and the per-language static prompt prefixes
+        for language in Language:
+            game_state = GameSession(game_id="__warmup__", language=language)
+            self.game_service.prompt_builder.build_messages(game_state, self.OPENING_ACTION, [])
+
+        return {"results": len(results), "languages": len(Language)}
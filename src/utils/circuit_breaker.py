@@ -0,0 +1,89 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+from .logger import setup_logger
+from .metrics import metrics
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+STATE_GAUGE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    """Fails fast while a dependency is down, letting one probe through after a cool-down.
+
+    closed -> open after failure_threshold consecutive failures; open -> half_open once
+    recovery_seconds have passed, admitting a single probe; the probe's outcome closes
+    the breaker again or re-opens it for another cool-down.
+    """
+
+    def __init__(self, name: str, failure_threshold: Optional[int] = None,
+                 recovery_seconds: Optional[float] = None):
+        self.logger = setup_logger(__name__)
+        self.name = name
+        self.failure_threshold = failure_threshold or int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "3"))
+        self.recovery_seconds = recovery_seconds or float(os.getenv("CIRCUIT_BREAKER_RECOVERY_SECONDS", "30"))
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+        metrics.set_gauge(f"breaker.{name}.state", STATE_GAUGE[CLOSED])
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+
+            now = time.monotonic()
+            if self.state == OPEN and now - self.opened_at >= self.recovery_seconds:
+                self._transition(HALF_OPEN)
+
+            # One probe at a time; a probe that never reported back is replaced after a cool-down
+            if self.state == HALF_OPEN and (
+                self.probe_started_at is None or now - self.probe_started_at >= self.recovery_seconds
+            ):
+                self.probe_started_at = now
+                metrics.increment(f"breaker.{self.name}.probes")
+                return True
+
+        metrics.increment(f"breaker.{self.name}.rejected")
+        return False
+
+    def is_open(self) -> bool:
+        """True while requests would be rejected; unlike allow_request this never starts a probe"""
+        with self._lock:
+            if self.state == OPEN:
+                return time.monotonic() - self.opened_at < self.recovery_seconds
+            return self.state == HALF_OPEN and self.probe_started_at is not None
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            if self.state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                self.opened_at = time.monotonic()
+                self._transition(OPEN)
+                metrics.increment(f"breaker.{self.name}.opened")
+
+    def _transition(self, state: str):
+        self.logger.warning(f"Circuit breaker {self.name}: {self.state} -> {state}")
+        self.state = state
+        self.probe_started_at = None
+        metrics.set_gauge(f"breaker.{self.name}.state", STATE_GAUGE[state])
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            retry_in = self.recovery_seconds - (time.monotonic() - self.opened_at) if self.state == OPEN else 0.0
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "retry_in_seconds": round(max(0.0, retry_in), 1)
+            }
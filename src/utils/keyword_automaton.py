@@ -0,0 +1,73 @@
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+
+class KeywordAutomaton:
+    """Aho-Corasick matcher: finds every keyword occurrence in one pass over the text.
+
+    Latin keywords only match on word boundaries, so "rest" does not fire inside
+    "forest"; CJK keywords match anywhere since those scripts are not space separated.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[str, Any]]] = [[]]
+        self._built = False
+
+    def add(self, keyword: str, value: Any):
+        keyword = keyword.lower()
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append((keyword, value))
+        self._built = False
+
+    def build(self):
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._outputs[next_state].extend(self._outputs[self._fail[next_state]])
+        self._built = True
+
+    def find(self, text: str) -> List[Tuple[int, int, Any]]:
+        """Return (start, end, value) for every keyword match in text."""
+        if not self._built:
+            self.build()
+
+        text = text.lower()
+        matches = []
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+
+            for keyword, value in self._outputs[state]:
+                start = index - len(keyword) + 1
+                if self._on_word_boundary(text, keyword, start, index + 1):
+                    matches.append((start, index + 1, value))
+        return matches
+
+    def _on_word_boundary(self, text: str, keyword: str, start: int, end: int) -> bool:
+        if not keyword.isascii():
+            return True
+        before = text[start - 1] if start > 0 else " "
+        after = text[end] if end < len(text) else " "
+        return not (before.isascii() and before.isalnum()) and not (after.isascii() and after.isalnum())
@@ -1,28 +1,136 @@
+import atexit
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import random
 import sys
-from typing import Optional
+import threading
+from typing import Dict, Optional
+
+# Pass as `extra=SAMPLED` on per-turn debug/timing lines so they obey LOG_SAMPLE_RATE
+SAMPLED = {"sampled": True}
+
+STRUCTURED_FIELDS = ("game_id", "turn", "phase", "duration_ms")
+
+
+def turn_extra(game_id: str, turn: int, phase: Optional[str] = None,
+               seconds: Optional[float] = None) -> Dict[str, object]:
+    """`extra=` for sampled per-turn lines, carrying the fields LOG_FORMAT=json emits"""
+    fields: Dict[str, object] = {**SAMPLED, "game_id": game_id, "turn": turn}
+    if phase:
+        fields["phase"] = phase
+    if seconds is not None:
+        fields["duration_ms"] = round(seconds * 1000, 1)
+    return fields
+
+_pipeline_lock = threading.Lock()
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_logger_levels: Dict[str, int] = {}
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage()
+        }
+        for field in STRUCTURED_FIELDS:
+            if hasattr(record, field):
+                payload[field] = getattr(record, field)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "sampled", False):
+            return self.rate >= 1.0 or random.random() < self.rate
+        return True
+
+
+def _parse_level(level: str, default: int = logging.INFO) -> int:
+    return getattr(logging, level.strip().upper(), default)
+
+
+def _parse_logger_levels(spec: str) -> Dict[str, int]:
+    levels = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        name, level = item.split("=", 1)
+        levels[name.strip()] = _parse_level(level)
+    return levels
+
+
+def _get_queue_handler() -> logging.handlers.QueueHandler:
+    global _queue_handler, _listener, _logger_levels
+
+    with _pipeline_lock:
+        if _queue_handler:
+            return _queue_handler
+
+        _logger_levels = _parse_logger_levels(os.getenv("LOG_LEVELS", ""))
+
+        if os.getenv("LOG_FORMAT", "text").lower() == "json":
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+        # The configured formatter and the stdout write run on the listener thread. QueueHandler.prepare
+        # still merges the message arguments on the calling thread, after filters, so sampled-out
+        # per-turn lines cost no formatting at all
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_handler = logging.handlers.QueueHandler(log_queue)
+        _queue_handler.addFilter(SamplingFilter(float(os.getenv("LOG_SAMPLE_RATE", "0.1"))))
+
+        _listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+        return _queue_handler
+
+
+def _resolve_level(name: str, default: str) -> int:
+    # Most specific LOG_LEVELS prefix wins, then LOG_LEVEL, then the caller's default
+    matches = [
+        prefix for prefix in _logger_levels
+        if name == prefix or name.startswith(prefix + ".")
+    ]
+    if matches:
+        return _logger_levels[max(matches, key=len)]
+    return _parse_level(os.getenv("LOG_LEVEL", default))
+
 
 def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
-    """Set up a logger with consistent formatting."""
+    """Set up a logger that writes through the shared non-blocking queue pipeline."""
     logger = logging.getLogger(name)
 
     if logger.handlers:
         return logger
 
-    # Set level
-    log_level = getattr(logging, level.upper(), logging.INFO)
-    logger.setLevel(log_level)
+    queue_handler = _get_queue_handler()
+    logger.setLevel(_resolve_level(name, level))
+    logger.addHandler(queue_handler)
+    logger.propagate = False
 
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    return logger
 
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
 
-    logger.addHandler(console_handler)
+def shutdown_logging():
+    global _listener
 
-    return logger
\ No newline at end of file
+    with _pipeline_lock:
+        if _listener:
+            _listener.stop()
+            _listener = None
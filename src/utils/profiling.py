@@ -0,0 +1,254 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+PROFILE_MODES = ("phases", "sample")
+# Root frame of per-request samples: the sampler sees the shared event loop thread, so the
+# stacks include every request in flight, not just the profiled one
+LOOP_WIDE_FRAME = "event-loop (all in-flight requests)"
+
+_active_profile: ContextVar[Optional["PhaseProfile"]] = ContextVar("active_profile", default=None)
+_phase_path: ContextVar[Tuple[str, ...]] = ContextVar("phase_path", default=())
+_window_profile: Optional["PhaseProfile"] = None
+
+
+class ProfileWindowBusy(RuntimeError):
+    pass
+
+
+class PhaseProfile:
+    def __init__(self):
+        self.totals: Dict[Tuple[str, ...], float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def add(self, path: Tuple[str, ...], elapsed: float):
+        with self._lock:
+            self.totals[path] += elapsed
+
+    def to_collapsed(self) -> str:
+        # Flamegraph "collapsed" format: frame;frame;frame <self time in microseconds>
+        with self._lock:
+            totals = dict(self.totals)
+
+        child_time: Dict[Tuple[str, ...], float] = defaultdict(float)
+        for path, elapsed in totals.items():
+            if len(path) > 1:
+                child_time[path[:-1]] += elapsed
+
+        lines = []
+        for path, elapsed in sorted(totals.items()):
+            self_time = max(0.0, elapsed - child_time[path])
+            lines.append(f"{';'.join(path)} {int(self_time * 1_000_000)}")
+        return "\n".join(lines) + "\n"
+
+
+class _NoopPhase:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_PHASE = _NoopPhase()
+
+
+class _Phase:
+    __slots__ = ("name", "profile", "token", "start")
+
+    def __init__(self, name: str, profile: PhaseProfile):
+        self.name = name
+        self.profile = profile
+
+    def __enter__(self):
+        path = _phase_path.get() + (self.name,)
+        self.token = _phase_path.set(path)
+        self.start = time.perf_counter()
+        return None
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        path = _phase_path.get()
+        _phase_path.reset(self.token)
+        self.profile.add(path, elapsed)
+        if _window_profile is not None and _window_profile is not self.profile:
+            _window_profile.add(path, elapsed)
+        return False
+
+
+def phase(name: str):
+    profile = _active_profile.get() or _window_profile
+    if profile is None:
+        return _NOOP_PHASE
+    return _Phase(name, profile)
+
+
+class SamplingProfiler:
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Dict[str, int] = defaultdict(int)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+
+    def to_collapsed(self, root: Optional[str] = None) -> str:
+        prefix = f"{root};" if root else ""
+        return "\n".join(f"{prefix}{stack} {count}" for stack, count in sorted(self.stacks.items())) + "\n"
+
+
+class Profiler:
+    def __init__(self):
+        self.profiles: "OrderedDict[str, str]" = OrderedDict()
+        self._enabled: Optional[bool] = None
+        self._window_lock = threading.Lock()
+
+    # Read on first use rather than at import so values loaded by load_dotenv() apply
+    @property
+    def enabled(self) -> bool:
+        if self._enabled is None:
+            self._enabled = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+        return self._enabled
+
+    @property
+    def sample_interval(self) -> float:
+        return float(os.getenv("PROFILING_SAMPLE_INTERVAL", "0.005"))
+
+    @property
+    def max_profiles(self) -> int:
+        return int(os.getenv("PROFILING_MAX_STORED", "20"))
+
+    def requested_mode(self, value: Optional[str]) -> Optional[str]:
+        if not self.enabled or not value:
+            return None
+        value = value.lower()
+        if value in ("1", "true"):
+            return "phases"
+        return value if value in PROFILE_MODES else None
+
+    def get_profile(self, profile_id: str) -> Optional[str]:
+        return self.profiles.get(profile_id)
+
+    def store(self, profile_id: str, collapsed: str):
+        self.profiles[profile_id] = collapsed
+        max_profiles = self.max_profiles
+        while len(self.profiles) > max_profiles:
+            self.profiles.popitem(last=False)
+
+    async def profile_window(self, seconds: float, mode: str = "sample") -> str:
+        # _window_profile is process-wide, so a second window would clobber the first
+        if not self._window_lock.acquire(blocking=False):
+            raise ProfileWindowBusy("A profiling window is already running")
+        try:
+            return await self._run_window(seconds, mode)
+        finally:
+            self._window_lock.release()
+
+    async def _run_window(self, seconds: float, mode: str) -> str:
+        global _window_profile
+
+        if mode == "phases":
+            _window_profile = PhaseProfile()
+            try:
+                await asyncio.sleep(seconds)
+                return _window_profile.to_collapsed()
+            finally:
+                _window_profile = None
+
+        sampler = SamplingProfiler(threading.get_ident(), self.sample_interval)
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            sampler.stop()
+        return sampler.to_collapsed()
+
+
+class ProfilingMiddleware:
+    """ASGI middleware that profiles a single request when asked via X-Profile or ?profile=.
+
+    "phases" is scoped to the request. "sample" samples the event loop thread the request
+    shares with everything else in flight, so it is only per-request under serial load; its
+    stacks sit under LOOP_WIDE_FRAME and the response carries X-Profile-Scope: loop.
+    """
+
+    def __init__(self, app, profiler: Profiler, paths: Tuple[str, ...] = ("/game/",)):
+        self.app = app
+        self.profiler = profiler
+        self.paths = paths
+
+    async def __call__(self, scope, receive, send):
+        if not self.profiler.enabled or scope["type"] != "http" or not scope["path"].startswith(self.paths):
+            await self.app(scope, receive, send)
+            return
+
+        mode = self.profiler.requested_mode(self._requested(scope))
+        if not mode:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+        phase_profile = PhaseProfile()
+        sampler = SamplingProfiler(threading.get_ident(), self.profiler.sample_interval) if mode == "sample" else None
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [
+                    (b"x-profile-id", profile_id.encode()),
+                    (b"x-profile-scope", b"loop" if sampler else b"request"),
+                ]
+            await send(message)
+
+        token = _active_profile.set(phase_profile)
+        if sampler:
+            sampler.start()
+        try:
+            with _Phase("request", phase_profile):
+                await self.app(scope, receive, send_with_profile_id)
+        finally:
+            _active_profile.reset(token)
+            if sampler:
+                sampler.stop()
+            collapsed = sampler.to_collapsed(LOOP_WIDE_FRAME) if sampler else phase_profile.to_collapsed()
+            self.profiler.store(profile_id, collapsed)
+
+    def _requested(self, scope) -> Optional[str]:
+        for name, value in scope.get("headers", []):
+            if name == b"x-profile":
+                return value.decode("latin-1")
+
+        for pair in scope.get("query_string", b"").decode("latin-1").split("&"):
+            if pair.startswith("profile="):
+                return pair[len("profile="):]
+        return None
+
+
+profiler = Profiler()
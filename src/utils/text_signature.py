@@ -0,0 +1,32 @@
+import hashlib
+from collections import Counter
+from typing import Iterable, List
+
+SIMHASH_BITS = 64
+
+
+def simhash(tokens: List[str]) -> int:
+    """64-bit SimHash: texts sharing most of their tokens differ in only a few bits."""
+    weights = [0] * SIMHASH_BITS
+    for token, count in Counter(tokens).items():
+        # blake2b is stable across processes, unlike hash() on str
+        value = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+
+    signature = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            signature |= 1 << bit
+    return signature
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def jaccard(a: Iterable[str], b: Iterable[str]) -> float:
+    a, b = set(a), set(b)
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
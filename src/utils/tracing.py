@@ -0,0 +1,223 @@
+import atexit
+import functools
+import json
+import os
+import queue
+import threading
+import time
+import urllib.request
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, name: str, parent: Optional["Span"]):
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.name = name
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any):
+        self.attributes.update(attributes)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_to_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1}
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, **attributes: Any):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _to_otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_to_otlp_value(item) for item in value]}}
+    return {"stringValue": str(value)}
+
+
+def _to_otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    return {"key": key, "value": _to_otlp_value(value)}
+
+
+class _SpanContext:
+    __slots__ = ("tracer", "name", "attributes", "span", "token")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self) -> Span:
+        self.span = Span(self.name, _current_span.get())
+        self.span.attributes.update(self.attributes)
+        self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self.token)
+        self.span.end_ns = time.time_ns()
+        if exc is not None:
+            self.span.error = f"{exc_type.__name__}: {exc}"
+        self.tracer.export(self.span)
+        return False
+
+
+class _NoopSpanContext:
+    def __enter__(self):
+        return _NOOP_SPAN
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN_CONTEXT = _NoopSpanContext()
+
+
+class Tracer:
+    def __init__(self):
+        self._exporter: Optional[str] = None
+        self._queue: "queue.SimpleQueue[Optional[Span]]" = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._configured = False
+
+    # Configured on first use so values loaded by load_dotenv() apply
+    def _configure(self):
+        with self._lock:
+            if self._configured:
+                return
+
+            exporter = os.getenv("TRACING_EXPORTER", "none").lower()
+            self._exporter = exporter if exporter in ("file", "otlp") else None
+            self.service_name = os.getenv("OTEL_SERVICE_NAME", "dungeon-quest")
+            self.file_path = os.getenv("TRACING_FILE_PATH", "./traces.jsonl")
+            self.otlp_endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318").rstrip("/")
+            self.batch_size = int(os.getenv("TRACING_BATCH_SIZE", "256"))
+            self.flush_interval = float(os.getenv("TRACING_FLUSH_INTERVAL", "1.0"))
+
+            if self._exporter:
+                self._worker = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+                self._worker.start()
+                atexit.register(self.shutdown)
+
+            self._configured = True
+
+    @property
+    def enabled(self) -> bool:
+        if not self._configured:
+            self._configure()
+        return self._exporter is not None
+
+    def span(self, name: str, **attributes: Any):
+        if not self.enabled:
+            return _NOOP_SPAN_CONTEXT
+        return _SpanContext(self, name, attributes)
+
+    def current_span(self):
+        span = _current_span.get()
+        return span if span is not None else _NOOP_SPAN
+
+    def export(self, span: Span):
+        self._queue.put(span)
+
+    def _run(self):
+        batch: List[Span] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                span = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                if span is None:
+                    self._flush(batch)
+                    return
+                batch.append(span)
+            except queue.Empty:
+                pass
+
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                self._flush(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+
+    def _flush(self, batch: List[Span]):
+        if not batch:
+            return
+
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [_to_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "dungeon-quest"},
+                    "spans": [span.to_otlp() for span in batch]
+                }]
+            }]
+        }
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+        try:
+            if self._exporter == "file":
+                with open(self.file_path, "a", encoding="utf-8") as f:
+                    f.write(body + "\n")
+            else:
+                request = urllib.request.Request(
+                    f"{self.otlp_endpoint}/v1/traces",
+                    data=body.encode("utf-8"),
+                    headers={"Content-Type": "application/json"},
+                    method="POST"
+                )
+                urllib.request.urlopen(request, timeout=5).close()
+        except Exception:
+            # Tracing must never take the game down; dropped batches are acceptable
+            pass
+
+    def shutdown(self):
+        if self._worker and self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join(timeout=5)
+
+
+def traced(name: str) -> Callable:
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with tracer.span(name):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+tracer = Tracer()
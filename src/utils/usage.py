@@ -0,0 +1,165 @@
+import os
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Tuple
+
+# USD per 1M tokens as (input, output); override with MODEL_PRICES="model=in/out,..."
+DEFAULT_MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-5-nano": (0.05, 0.40),
+    "gpt-5-mini": (0.25, 2.00),
+    "gpt-5": (1.25, 10.00),
+    "text-embedding-3-small": (0.02, 0.0),
+    "text-embedding-3-large": (0.13, 0.0)
+}
+
+FIELDS = ("prompt_tokens", "completion_tokens", "embedding_tokens", "requests", "cost_usd")
+
+_usage_context: ContextVar[Dict[str, Any]] = ContextVar("usage_context", default={})
+
+
+@contextmanager
+def usage_scope(**fields: Any):
+    """Attribute token usage inside the block to a game, language, endpoint or phase."""
+    token = _usage_context.set({**_usage_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _usage_context.reset(token)
+
+
+def _parse_prices(spec: str) -> Dict[str, Tuple[float, float]]:
+    prices = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        model, value = item.split("=", 1)
+        input_price, _, output_price = value.partition("/")
+        prices[model.strip()] = (float(input_price), float(output_price or 0))
+    return prices
+
+
+class UsageTracker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: Dict[str, float] = defaultdict(float)
+        self._by_dimension: Dict[str, Dict[str, Dict[str, float]]] = {
+            "language": defaultdict(lambda: defaultdict(float)),
+            "endpoint": defaultdict(lambda: defaultdict(float)),
+            "phase": defaultdict(lambda: defaultdict(float)),
+            "model": defaultdict(lambda: defaultdict(float))
+        }
+        self._games: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._configured = False
+
+    # Read on first use rather than at import so values loaded by load_dotenv() apply
+    def _configure(self):
+        self.prices = dict(DEFAULT_MODEL_PRICES)
+        self.prices.update(_parse_prices(os.getenv("MODEL_PRICES", "")))
+        self.game_token_budget = int(os.getenv("GAME_TOKEN_BUDGET", "0"))
+        self.game_cost_budget = float(os.getenv("GAME_COST_BUDGET_USD", "0"))
+        self._configured = True
+
+    def _price(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
+        input_price, output_price = self.prices.get(model, (0.0, 0.0))
+        return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+    def record_completion(self, model: str, usage: Any):
+        if usage is None:
+            return
+        prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+        completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+        self._record(model, {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens
+        }, prompt_tokens, completion_tokens)
+
+    def record_embedding(self, model: str, usage: Any):
+        if usage is None:
+            return
+        tokens = getattr(usage, "total_tokens", 0) or getattr(usage, "prompt_tokens", 0) or 0
+        self._record(model, {"embedding_tokens": tokens}, tokens, 0)
+
+    def _record(self, model: str, tokens: Dict[str, int], billed_input: int, billed_output: int):
+        if not self._configured:
+            self._configure()
+
+        values = dict(tokens, requests=1, cost_usd=self._price(model, billed_input, billed_output))
+        context = _usage_context.get()
+        buckets = [self._totals, self._by_dimension["model"][model]]
+        for dimension in ("language", "endpoint", "phase"):
+            if context.get(dimension):
+                buckets.append(self._by_dimension[dimension][str(context[dimension])])
+        if context.get("game_id"):
+            buckets.append(self._games[context["game_id"]])
+
+        with self._lock:
+            for bucket in buckets:
+                for field, value in values.items():
+                    bucket[field] += value
+
+    def get_game_usage(self, game_id: str) -> Dict[str, Any]:
+        if not self._configured:
+            self._configure()
+
+        with self._lock:
+            game = dict(self._games.get(game_id, {}))
+        usage = {field: round(game.get(field, 0), 6) for field in FIELDS}
+        usage["total_tokens"] = int(
+            usage["prompt_tokens"] + usage["completion_tokens"] + usage["embedding_tokens"]
+        )
+        usage["degraded"] = self._over_budget(usage)
+        return usage
+
+    def is_over_budget(self, game_id: str) -> bool:
+        return self.get_game_usage(game_id)["degraded"]
+
+    def _over_budget(self, usage: Dict[str, Any]) -> bool:
+        if self.game_token_budget and usage["total_tokens"] >= self.game_token_budget:
+            return True
+        return bool(self.game_cost_budget) and usage["cost_usd"] >= self.game_cost_budget
+
+    def forget(self, game_id: str):
+        with self._lock:
+            self._games.pop(game_id, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "totals": {field: round(self._totals.get(field, 0), 6) for field in FIELDS},
+                **{
+                    dimension: {
+                        key: {field: round(bucket.get(field, 0), 6) for field in FIELDS}
+                        for key, bucket in buckets.items()
+                    }
+                    for dimension, buckets in self._by_dimension.items()
+                },
+                "games_tracked": len(self._games)
+            }
+
+    def reset(self):
+        with self._lock:
+            self._totals.clear()
+            for buckets in self._by_dimension.values():
+                buckets.clear()
+            self._games.clear()
+
+
+class UsageMiddleware:
+    """ASGI middleware that attributes token usage to the request path it was spent on."""
+
+    def __init__(self, app, paths: Tuple[str, ...] = ("/game/",)):
+        self.app = app
+        self.paths = paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.paths):
+            await self.app(scope, receive, send)
+            return
+
+        with usage_scope(endpoint=f"{scope['method']} {scope['path']}"):
+            await self.app(scope, receive, send)
+
+
+usage_tracker = UsageTracker()
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from src.models.chroma.embedding_model import EmbeddingModel
+from src.utils import circuit_breaker as breaker_module
+from src.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(breaker_module.time, "monotonic", clock.monotonic)
+    return clock
+
+
+def test_opens_after_consecutive_failures_and_probes_after_the_cool_down(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_seconds=10)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == OPEN and breaker.is_open() and not breaker.allow_request()
+
+    clock.now += 10
+    assert not breaker.is_open()
+    assert breaker.allow_request() and breaker.state == HALF_OPEN
+    # Only one probe at a time
+    assert not breaker.allow_request() and breaker.is_open()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.allow_request()
+
+
+def test_failed_probe_reopens_and_a_lost_probe_is_replaced(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_seconds=10)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == OPEN and breaker.to_dict()["retry_in_seconds"] == 10.0
+
+    clock.now += 10
+    assert breaker.allow_request()
+    clock.now += 10
+    # The first probe never reported back
+    assert breaker.allow_request()
+
+
+def test_open_embedding_breaker_skips_the_api(monkeypatch):
+    class FailingEmbeddings:
+        calls = 0
+
+        async def create(self, **kwargs):
+            FailingEmbeddings.calls += 1
+            raise TimeoutError("embedding API timed out")
+
+    monkeypatch.setenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "2")
+    model = EmbeddingModel()
+    model.client = type("Client", (), {"embeddings": FailingEmbeddings()})()
+
+    async def lookups():
+        return [await model.get_embedding(f"text {i}") for i in range(4)]
+
+    assert asyncio.run(lookups()) == [None] * 4
+    assert FailingEmbeddings.calls == 2 and model.breaker.state == OPEN
@@ -0,0 +1,66 @@
+import asyncio
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from src.models.chroma.database_model import DatabaseModel
+from src.models.chroma.embedding_model import EmbeddingModel, dequantize, quantize, truncate_embedding
+from src.utils.metrics import metrics
+
+
+class RecordingEmbeddings:
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, input=None, **kwargs):
+        self.calls.append(kwargs)
+        texts = [input] if isinstance(input, str) else input
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[3.0, 4.0, 12.0], index=index)
+                                     for index in range(len(texts))], usage=None)
+
+
+def make_model(monkeypatch, **env):
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    model = EmbeddingModel()
+    model.client = SimpleNamespace(embeddings=RecordingEmbeddings())
+    return model
+
+
+def test_truncation_keeps_the_head_at_unit_length():
+    assert truncate_embedding([3.0, 4.0, 12.0], 2) == [0.6, 0.8]
+    assert truncate_embedding([3.0, 4.0], 0) == [3.0, 4.0]
+
+
+@pytest.mark.parametrize("precision, tolerance", [("float32", 1e-6), ("float16", 1e-3), ("int8", 1e-2)])
+def test_quantized_cache_entries_stay_close(precision, tolerance):
+    vector = [0.12, -0.5, 0.9, 0.0]
+    restored = dequantize(quantize(vector, precision))
+    assert all(math.isclose(a, b, abs_tol=tolerance) for a, b in zip(vector, restored))
+
+
+def test_local_truncation_requests_full_vectors(monkeypatch):
+    model = make_model(monkeypatch, EMBEDDING_DIMENSIONS="2", EMBEDDING_TRUNCATION="local")
+    assert asyncio.run(model.get_embedding("goblin")) == [0.6, 0.8]
+    assert "dimensions" not in model.client.embeddings.calls[0]
+    assert model.get_profile()["embedding_dimensions"] == 2
+
+
+def test_provider_truncation_asks_the_api_and_caches(monkeypatch):
+    model = make_model(monkeypatch, EMBEDDING_DIMENSIONS="2", EMBEDDING_TRUNCATION="provider")
+    asyncio.run(model.get_embeddings(["goblin", "goblin"]))
+    asyncio.run(model.get_embedding("goblin"))
+    assert [call["dimensions"] for call in model.client.embeddings.calls] == [2]
+
+
+def test_width_change_on_an_unstamped_collection_is_reported(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", str(tmp_path))
+    legacy = DatabaseModel()
+    legacy.get_collection().add(ids=["a"], documents=["a"], embeddings=[[1.0, 0.0, 0.0]])
+    mismatches = metrics.get_counter("chroma.embedding_profile_mismatch")
+
+    database_model = DatabaseModel()
+    database_model.collection_metadata = {"embedding_dimensions": 2}
+    database_model.get_collection()
+    assert metrics.get_counter("chroma.embedding_profile_mismatch") == mismatches + 1
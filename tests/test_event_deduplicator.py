@@ -0,0 +1,21 @@
+from src.services.event_deduplicator import EventDeduplicator
+
+NARRATIVE = "[Turn 2] You swing your sword at the goblin and it staggers back into the shadows."
+
+
+def test_check_does_not_remember_until_stored():
+    deduplicator = EventDeduplicator()
+    first = deduplicator.check("game-1", "game-1_turn_2", NARRATIVE)
+    assert first is not None
+
+    # The first store failed, so the retry is not treated as a duplicate
+    assert deduplicator.check("game-1", "game-1_turn_2", NARRATIVE) is not None
+
+    deduplicator.remember("game-1", [first])
+    assert deduplicator.check("game-1", "game-1_turn_3", NARRATIVE.replace("Turn 2", "Turn 3")) is None
+
+
+def test_pending_signatures_catch_duplicates_within_a_batch():
+    deduplicator = EventDeduplicator()
+    first = deduplicator.check("game-1", "game-1_turn_2", NARRATIVE)
+    assert deduplicator.check("game-1", "game-1_turn_3", NARRATIVE, [first]) is None
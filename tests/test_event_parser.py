@@ -0,0 +1,41 @@
+import json
+
+from src.models.game_event import EXP_GAIN_RANGE, HP_CHANGE_RANGE, MAX_SUGGESTED_ACTIONS
+from src.services.event_parser import EventParser
+from src.utils.metrics import metrics
+
+EVENT = {
+    "turn": 2,
+    "narrative": "A goblin leaps out!",
+    "effects": {"player_hp_change": -5, "player_exp_gain": 10, "item_gain": None},
+    "suggested_actions": ["attack", "flee", "hide"]
+}
+
+
+def test_valid_json_is_parsed_without_repair():
+    repairs = metrics.get_counter("llm.repairs")
+    assert EventParser().parse(json.dumps(EVENT)) == EVENT
+    assert metrics.get_counter("llm.repairs") == repairs
+
+
+def test_fenced_json_with_trailing_commas_is_repaired():
+    raw = "Here you go:\n```json\n" + json.dumps(EVENT)[:-1] + ",}\n```"
+    repairs = metrics.get_counter("llm.repairs")
+    assert EventParser().parse(raw) == EVENT
+    assert metrics.get_counter("llm.repairs") == repairs + 1
+
+
+def test_unrepairable_output_returns_none():
+    failures = metrics.get_counter("llm.parse_failures")
+    assert EventParser().parse('{"narrative": "cut off mid') is None
+    assert EventParser().parse("") is None
+    assert metrics.get_counter("llm.parse_failures") == failures + 2
+
+
+def test_effects_and_actions_are_clamped():
+    event = dict(EVENT, effects={"player_hp_change": -999, "player_exp_gain": 999, "item_gain": "  "},
+                 suggested_actions=["a", "", "b", "c", "d", "e", "f"])
+    parsed = EventParser().parse(json.dumps(event))
+    assert parsed["effects"] == {"player_hp_change": HP_CHANGE_RANGE[0], "player_exp_gain": EXP_GAIN_RANGE[1],
+                                 "item_gain": None}
+    assert parsed["suggested_actions"] == ["a", "b", "c", "d", "e", "f"][:MAX_SUGGESTED_ACTIONS]
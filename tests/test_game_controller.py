@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from src.game_controller import GameController
+from src.models.game_state import BatchActionRequest
+
+
+@pytest.fixture
+def controller(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", str(tmp_path))
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("SESSION_RECORDING_PATH", raising=False)
+    controller = GameController()
+    service = controller.game_service
+    stored = []
+
+    async def search_batch(requests):
+        return [[] for _ in requests]
+
+    async def process(game_state, action, relevant_events=None, store_event=True):
+        if action == "fail":
+            raise RuntimeError("model exploded")
+        await asyncio.sleep(0.01 if action == "slow" else 0)
+        turn = game_state.turn_count + 1
+        return {"turn": turn, "narrative": f"{action} on turn {turn}",
+                "effects": {"player_hp_change": 0, "player_exp_gain": 5, "item_gain": None},
+                "suggested_actions": ["explore"]}
+
+    async def store_batch(entries):
+        stored.extend(entry["content_id"] for entry in entries)
+
+    monkeypatch.setattr(service, "search_relevant_events_batch", search_batch)
+    monkeypatch.setattr(service, "process_player_action", process)
+    monkeypatch.setattr(service, "store_events_batch", store_batch)
+    controller.stored = stored
+    return controller
+
+
+async def collect(generator):
+    return [result async for result in generator]
+
+
+def test_failing_game_does_not_abort_the_batch(controller):
+    ok, failing = controller.create_new_game("A"), controller.create_new_game("B")
+    results = asyncio.run(collect(controller.process_actions_batch(
+        [(ok, "explore"), (failing, "fail"), (ok, "rest"), ("missing", "explore")]
+    )))
+
+    by_index = {result["index"]: result for result in results}
+    assert by_index[0]["response"].game_id == ok
+    assert by_index[1]["response"] is None and "model exploded" in by_index[1]["error"]
+    assert by_index[2]["response"] is not None
+    assert by_index[3]["error"] == "Game not found or inactive"
+    assert controller.get_game(ok).turn_count == 2
+    assert controller.stored == [f"{ok}_turn_1", f"{ok}_turn_2"]
+
+
+def test_abandoned_batch_still_stores_finished_turns(controller):
+    fast, slow = controller.create_new_game("A"), controller.create_new_game("B")
+
+    async def first_then_disconnect():
+        stream = controller.process_actions_batch([(fast, "explore"), (slow, "slow")])
+        first = await stream.__anext__()
+        await stream.aclose()
+        return first
+
+    first = asyncio.run(first_then_disconnect())
+    assert first["game_id"] == fast
+    assert controller.stored == [f"{fast}_turn_1"]
+
+
+def test_actions_for_one_game_run_in_order(controller):
+    game_a, game_b = controller.create_new_game("A"), controller.create_new_game("B")
+    results = asyncio.run(collect(controller.process_actions_batch(
+        [(game_a, "slow"), (game_b, "explore"), (game_a, "explore"), (game_a, "rest")], concurrency=2
+    )))
+
+    narratives = {result["index"]: result["response"].narrative for result in results}
+    assert [narratives[0], narratives[2], narratives[3]] == ["slow on turn 1", "explore on turn 2", "rest on turn 3"]
+    assert controller.get_game(game_b).turn_count == 1
+
+
+@pytest.mark.parametrize("payload", [
+    {"actions": []},
+    {"actions": [{"game_id": "g", "action": "explore"}] * 257},
+    {"actions": [{"game_id": "g", "action": "explore"}], "concurrency": 0},
+])
+def test_batch_request_is_validated_before_streaming(payload):
+    with pytest.raises(ValidationError):
+        BatchActionRequest.model_validate(payload)
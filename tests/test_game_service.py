@@ -0,0 +1,103 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from openai import BadRequestError
+
+from src.localization import Messages
+from src.models.game_session import GameSession, PlayerSession
+from src.models.game_state import Language
+from src.services.game_service import GameService
+
+DEFAULT_EFFECTS = {"player_hp_change": 0, "player_exp_gain": 5, "item_gain": None}
+
+
+@pytest.fixture(scope="module")
+def service():
+    return GameService()
+
+
+def fallback(service, language, action, outcome=None):
+    game_state = GameSession("g1", PlayerSession("Hero"), language=language)
+    return service._get_fallback_event(game_state, action, outcome)
+
+
+def fallback_effects(language, keyword):
+    if keyword is None:
+        return DEFAULT_EFFECTS
+    return Messages.get_fallback_events(language)[keyword]["effects"]
+
+
+@pytest.mark.parametrize("action, expected", [
+    ("fight the goblin", "attack"),
+    ("look around the hall", "explore"),
+    ("sleep by the fire", "rest"),
+    ("use healing item", None),
+    ("walk into the forest", None),
+])
+def test_english_fallback_matches_whole_words(service, action, expected):
+    assert fallback(service, Language.EN, action)["effects"] == fallback_effects(Language.EN, expected)
+
+
+@pytest.mark.parametrize("action, expected", [
+    ("攻擊哥布林", "attack"),
+    ("打開寶箱", None),
+    ("搜索房間", "explore"),
+    ("睡覺", "rest"),
+    ("使用治療藥水", None),
+])
+def test_chinese_fallback_ignores_single_characters(service, action, expected):
+    assert fallback(service, Language.ZH_TW, action)["effects"] == fallback_effects(Language.ZH_TW, expected)
+
+
+@pytest.mark.parametrize("language", list(Language))
+def test_rest_narrative_quotes_the_applied_healing(service, language):
+    event = fallback(service, language, "rest")
+    assert event["effects"]["player_hp_change"] == 10
+    assert "10" in event["narrative"] and "{" not in event["narrative"]
+
+    outcome = {"turn": 3, "effects": {"player_hp_change": 4, "player_exp_gain": 0, "item_gain": None}}
+    event = fallback(service, language, "rest", outcome)
+    assert "4" in event["narrative"] and "10" not in event["narrative"]
+
+
+def bad_request(message, param=None):
+    response = httpx.Response(400, request=httpx.Request("POST", "https://api.test/v1/chat/completions"))
+    return BadRequestError(message, response=response, body={"message": message, "param": param})
+
+
+class RejectingCompletions:
+    def __init__(self, error):
+        self.error = error
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if "response_format" in kwargs:
+            raise self.error
+        return "plain"
+
+
+def request(service, monkeypatch, error):
+    completions = RejectingCompletions(error)
+    monkeypatch.setattr(service.llm_service, "get_client",
+                        lambda: SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    tier = service.model_router.tiers[service.model_router.FAST]
+    return asyncio.run(service._request_completion([], {}, tier)), completions, tier
+
+
+def test_response_format_rejection_falls_back_for_that_model_only(monkeypatch):
+    service = GameService()
+    response, completions, tier = request(service, monkeypatch,
+                                          bad_request("Invalid parameter", param="response_format"))
+    assert response == "plain" and len(completions.calls) == 2
+    assert not service.uses_structured_output(tier.model)
+    assert service.uses_structured_output("some-other-model")
+
+
+def test_other_bad_requests_keep_structured_output(monkeypatch):
+    service = GameService()
+    with pytest.raises(BadRequestError):
+        request(service, monkeypatch, bad_request("This model's maximum context length is 8192 tokens"))
+    assert service.uses_structured_output(service.model_router.tiers[service.model_router.FAST].model)
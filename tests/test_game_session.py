@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from src.models.game_session import GameSession, PlayerSession
+from src.models.game_state import GameStatus, Language
+
+
+def test_session_round_trips_through_the_pydantic_model():
+    session = GameSession("g1", PlayerSession("Hero", hp=70, experience=40, inventory=["Torch"]),
+                          GameStatus.COMPLETED, turn_count=10, language=Language.ZH_TW,
+                          finished_at=datetime(2026, 1, 1))
+    session.current_scene = "crypt"
+    session.recent_turns = (("explore", "A dark hall."), ("rest", "You sleep."))
+
+    model = session.to_model()
+    assert model.story_history == ["Player: explore", "Game: A dark hall.", "Player: rest", "Game: You sleep."]
+    assert model.player.inventory == ["Torch"]
+
+    restored = GameSession.from_model(model)
+    assert restored.to_model() == model
+    assert restored.recent_turns == session.recent_turns
+    assert restored.status is GameStatus.COMPLETED and restored.language is Language.ZH_TW
+
+
+def test_inventory_is_a_tuple_of_shared_strings():
+    first, second = PlayerSession(inventory=["Healing Potion"]), PlayerSession()
+    assert second.add_item("".join(["Healing ", "Potion"]))
+    assert not second.add_item("Healing Potion")
+    assert second.inventory[0] is first.inventory[0]
+
+
+def test_previous_event_is_built_from_the_last_event():
+    session = GameSession("g1")
+    assert session.previous_event == ""
+    session.last_event = (3, "A goblin appears!")
+    assert session.previous_event == "[Turn 3] A goblin appears!"
@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from src.models.game_session import GameSession
+from src.models.game_state import Language
+from src.services.intent_router import IntentRouter
+from src.services.rules_engine import RulesEngine
+
+
+@pytest.fixture
+def router(monkeypatch):
+    monkeypatch.setenv("INTENT_ROUTER_MAX_SHARE", "0.5")
+    # Centroid routing is off by default, so no embedding model is needed
+    return IntentRouter(None, RulesEngine())
+
+
+def route(router, game, action):
+    return asyncio.run(router.route(game, action))
+
+
+@pytest.mark.parametrize("action, intent", [
+    ("check inventory", "inventory"),
+    ("look around", "look"),
+    ("take a break", "rest"),
+    ("打開背包", "inventory"),
+    ("walk through the forest", None),
+    ("rest, then attack the orc", None),
+])
+def test_classify(router, action, intent):
+    assert router.classify(action) == intent
+
+
+def test_rest_phrase_heals(router):
+    router.max_share = 1.0
+    event = route(router, GameSession("game-1"), "take a break")
+    assert event["turn"] == 1
+    assert 10 <= event["effects"]["player_hp_change"] <= 25
+
+
+def test_free_intents_skip_the_share_cap(router):
+    game = GameSession("game-1", language=Language.EN)
+    for _ in range(5):
+        assert route(router, game, "check inventory")["turn"] == 0
+    assert router.turn_counts.get(game.game_id) is None
+
+    # The first turn-spending action is capped as if no free intents came before it
+    assert route(router, game, "take a break") is None
+    assert router.turn_counts[game.game_id] == [1, 0]
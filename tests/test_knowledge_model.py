@@ -0,0 +1,49 @@
+import pytest
+
+from src.services.vector_service import VectorService
+
+
+@pytest.fixture
+def vector_service(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", str(tmp_path))
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    vector_service = VectorService()
+    vector_service.database_model.get_collection().add(
+        ids=[f"game_event_g{i % 2}_turn_{i}" for i in range(5)] + ["item_torch"],
+        documents=[f"turn {i}" for i in range(5)] + ["A torch"],
+        metadatas=[{"content_type": "game_event", "content_id": f"g{i % 2}_turn_{i}", "game_id": f"g{i % 2}"}
+                   for i in range(5)] + [{"content_type": "item", "content_id": "torch"}],
+        embeddings=[[1.0, 0.0]] * 6
+    )
+    return vector_service
+
+
+def test_iter_records_pages_through_a_content_type(vector_service):
+    pages = list(vector_service.iter_records("game_event", page_size=2))
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert len({record.id for page in pages for record in page}) == 5
+
+
+def test_iter_records_rejects_an_empty_page_size(vector_service):
+    with pytest.raises(ValueError):
+        next(vector_service.iter_records(page_size=0))
+
+
+def test_iter_records_raises_instead_of_stopping_early(vector_service, monkeypatch):
+    def get_collection():
+        raise RuntimeError("store unavailable")
+
+    monkeypatch.setattr(vector_service.database_model, "get_collection", get_collection)
+    with pytest.raises(RuntimeError):
+        list(vector_service.iter_records())
+
+
+def test_deletes_run_in_batches_and_keep_counters_in_step(vector_service):
+    vector_service.reconcile_knowledge_stats()
+
+    assert vector_service.knowledge_model.delete_game_events("g0", batch_size=2) == 3
+    assert vector_service.get_game_event_count("g0") == 0
+    assert vector_service.get_game_event_count("g1") == 2
+
+    assert vector_service.knowledge_model.clear_knowledge(batch_size=2) == 3
+    assert vector_service.get_knowledge_count() == 0
@@ -0,0 +1,42 @@
+import json
+
+from src.models.chroma.knowledge_record import KnowledgeRecord
+
+
+def test_game_event_round_trips_through_chroma_metadata():
+    record = KnowledgeRecord("game_event", "g1_turn_2", "Turn 2 - Hero", "You find a torch.",
+                             {"game_id": "g1", "turn": 2, "hp_after": 95},
+                             created_at="2026-01-01T00:00:00", updated_at="2026-01-01T00:00:00")
+
+    doc_id, document, metadata = record.to_chroma()
+    assert doc_id == "game_event_g1_turn_2"
+    assert metadata["turn"] == 2 and metadata["content_type"] == "game_event"
+
+    restored = KnowledgeRecord.from_chroma(doc_id, document, metadata)
+    assert restored.to_dict() == record.to_dict()
+
+
+def test_non_scalar_values_are_json_encoded_once():
+    stats = {"hp": 30, "attack": 5}
+    record = KnowledgeRecord("monster", "goblin", "Goblin", "A goblin.", {
+        "stats": stats,
+        "abilities": json.dumps(["stab"]),
+        "description": {"short": "sneaky"},
+        "habitat": ["cave", "forest"],
+    })
+
+    _, _, metadata = record.to_chroma()
+    assert json.loads(metadata["stats"]) == stats
+    # Already-encoded JSON is not quoted a second time
+    assert json.loads(metadata["abilities"]) == ["stab"]
+    # Declared scalar fields and undeclared fields still never hand Chroma a dict or list
+    assert json.loads(metadata["description"]) == {"short": "sneaky"}
+    assert json.loads(metadata["habitat"]) == ["cave", "forest"]
+
+
+def test_knowledge_base_is_built_from_the_record():
+    record = KnowledgeRecord("item", "torch", "Torch", "Lights the way.", {"value": 5},
+                             created_at="2026-01-01T00:00:00", updated_at="2026-01-02T00:00:00")
+    knowledge = record.to_knowledge_base()
+    assert knowledge.title == "Torch" and knowledge.content_type == "item"
+    assert knowledge.metadata.get("value") == 5
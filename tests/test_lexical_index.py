@@ -0,0 +1,48 @@
+from src.models.chroma.lexical_index import LexicalIndex
+from src.services.vector_service import VectorService
+
+
+def event(game_id):
+    return {"content_type": "game_event", "game_id": game_id}
+
+
+def test_search_scores_only_the_requested_game():
+    index = LexicalIndex()
+    index.add("a1", "You attack the goblin.", event("A"))
+    index.add("b1", "The goblin king attacks the goblin guard.", event("B"))
+    index.add("m1", "A goblin scout guards the gate.", {"content_type": "monster"})
+
+    assert [hit["id"] for hit in index.search("goblin", "game_event", game_id="A")] == ["a1"]
+    assert [hit["id"] for hit in index.search("goblin", ("monster", "item"))] == ["m1"]
+    assert {hit["id"] for hit in index.search("goblin")} == {"a1", "b1", "m1"}
+
+
+def test_forget_drops_a_game_and_its_loaded_mark():
+    index = LexicalIndex()
+    index.add("a1", "You attack the goblin.", event("A"))
+    index.mark_loaded("A")
+
+    index.forget("A")
+    assert "a1" not in index and not index.is_loaded("A")
+    assert index.search("goblin", game_id="A") == []
+
+
+def test_startup_loads_the_catalog_and_games_load_on_first_search(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", str(tmp_path))
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    vector_service = VectorService()
+    collection = vector_service.database_model.get_collection()
+    collection.add(
+        ids=["monster_goblin", "game_event_A_turn_1", "game_event_B_turn_1"],
+        documents=["A goblin scout guards the gate.", "You attack the goblin.", "The goblin flees."],
+        metadatas=[{"content_type": "monster"}, event("A"), event("B")],
+        embeddings=[[1.0, 0.0], [0.0, 1.0], [0.0, 1.0]]
+    )
+
+    assert vector_service.rebuild_lexical_index() == 1
+    index = vector_service.lexical_index
+    assert "monster_goblin" in index and not index.is_loaded("A")
+
+    hits = vector_service.lexical_search("attack goblin", "game_event", game_id="A")
+    assert [hit["id"] for hit in hits] == ["game_event_A_turn_1"]
+    assert index.is_loaded("A") and "game_event_B_turn_1" not in index
@@ -0,0 +1,43 @@
+import json
+import logging
+
+import pytest
+
+from src.utils import logger as log_module
+from src.utils.logger import JsonFormatter, SAMPLED, SamplingFilter, turn_extra
+
+
+def record(message="turn done", **extra):
+    log_record = logging.LogRecord("src.test", logging.INFO, __file__, 1, message, None, None)
+    log_record.__dict__.update(extra)
+    return log_record
+
+
+def test_turn_extra_carries_the_structured_fields():
+    assert turn_extra("g1", 3) == {**SAMPLED, "game_id": "g1", "turn": 3}
+    assert turn_extra("g1", 3, "rag_search", 0.01234) == {
+        **SAMPLED, "game_id": "g1", "turn": 3, "phase": "rag_search", "duration_ms": 12.3
+    }
+
+
+def test_json_formatter_emits_structured_fields_only_when_set():
+    payload = json.loads(JsonFormatter().format(record(**turn_extra("g1", 2, "llm_generation", 0.5))))
+    assert payload["message"] == "turn done"
+    assert (payload["game_id"], payload["turn"], payload["phase"], payload["duration_ms"]) == ("g1", 2, "llm_generation", 500.0)
+    assert "game_id" not in json.loads(JsonFormatter().format(record()))
+
+
+@pytest.mark.parametrize("rate, expected", [(0.0, False), (1.0, True)])
+def test_sampling_only_applies_to_sampled_lines(rate, expected):
+    sampling = SamplingFilter(rate)
+    assert sampling.filter(record(**SAMPLED)) is expected
+    assert sampling.filter(record()) is True
+
+
+def test_most_specific_logger_level_wins(monkeypatch):
+    monkeypatch.setattr(log_module, "_logger_levels",
+                        log_module._parse_logger_levels("src=WARNING, src.services.game_service=DEBUG"))
+    monkeypatch.setenv("LOG_LEVEL", "ERROR")
+    assert log_module._resolve_level("src.services.game_service", "INFO") == logging.DEBUG
+    assert log_module._resolve_level("src.models", "INFO") == logging.WARNING
+    assert log_module._resolve_level("srcery", "INFO") == logging.ERROR
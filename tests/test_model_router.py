@@ -0,0 +1,34 @@
+import time
+
+import pytest
+
+from src.services.model_router import ModelRouter
+
+
+@pytest.fixture
+def router(monkeypatch):
+    monkeypatch.setenv("LLM_TIER_LATENCY_BUDGET_SECONDS", "1")
+    monkeypatch.setenv("LLM_TIER_RECOVERY_SECONDS", "60")
+    return ModelRouter()
+
+
+def test_latency_demotion_recovers_after_quiet_spell(router):
+    fast = router.tiers[ModelRouter.FAST]
+    router.record_success(fast, 5.0)
+    assert not router.is_healthy(fast)
+
+    fast.degraded_at = time.monotonic() - 61
+    assert router.is_healthy(fast)
+
+
+def test_slow_success_keeps_tier_demoted(router):
+    fast = router.tiers[ModelRouter.FAST]
+    router.record_failure(fast, 0.1)
+    router.record_failure(fast, 0.1)
+    router.record_failure(fast, 0.1)
+    router.record_failure(fast, 0.1)
+    assert not router.is_healthy(fast)
+
+    fast.degraded_at = time.monotonic() - 61
+    router.record_success(fast, 5.0)
+    assert not router.is_healthy(fast)
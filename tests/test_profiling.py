@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from src.utils.profiling import (
+    LOOP_WIDE_FRAME, PhaseProfile, Profiler, ProfileWindowBusy, ProfilingMiddleware, phase
+)
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    monkeypatch.setenv("PROFILING_ENABLED", "true")
+    monkeypatch.setenv("PROFILING_SAMPLE_INTERVAL", "0.001")
+    return Profiler()
+
+
+def test_collapsed_output_reports_self_time():
+    profile = PhaseProfile()
+    profile.add(("request",), 0.003)
+    profile.add(("request", "llm"), 0.002)
+    assert profile.to_collapsed() == "request 1000\nrequest;llm 2000\n"
+
+
+def test_phases_window_collects_phases_outside_requests(profiler):
+    async def work():
+        await asyncio.sleep(0.01)
+        with phase("rag_search"):
+            pass
+
+    async def run():
+        window = asyncio.create_task(profiler.profile_window(0.05, "phases"))
+        await work()
+        return await window
+
+    assert asyncio.run(run()).startswith("rag_search ")
+
+
+def test_concurrent_windows_are_rejected(profiler):
+    async def run():
+        first = asyncio.create_task(profiler.profile_window(0.05, "phases"))
+        await asyncio.sleep(0)
+        with pytest.raises(ProfileWindowBusy):
+            await profiler.profile_window(0.01, "sample")
+        await first
+        # The lock is released once the first window ends
+        return await profiler.profile_window(0.01, "phases")
+
+    assert asyncio.run(run()) == "\n"
+
+
+def test_sampled_request_is_labelled_loop_wide(profiler):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await asyncio.sleep(0.02)
+        await send({"type": "http.response.body", "body": b""})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "path": "/game/action", "headers": [(b"x-profile", b"sample")]}
+    asyncio.run(ProfilingMiddleware(app, profiler)(scope, None, send))
+
+    headers = dict(sent[0]["headers"])
+    assert headers[b"x-profile-scope"] == b"loop"
+    collapsed = profiler.get_profile(headers[b"x-profile-id"].decode())
+    lines = [line for line in collapsed.splitlines() if line]
+    assert lines and all(line.startswith(LOOP_WIDE_FRAME + ";") for line in lines)
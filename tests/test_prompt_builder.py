@@ -0,0 +1,45 @@
+import pytest
+
+from src.models.game_session import GameSession, PlayerSession
+from src.models.game_state import Language
+from src.services.prompt_builder import PromptBuilder
+from src.utils.metrics import metrics
+
+
+@pytest.fixture
+def builder(monkeypatch):
+    monkeypatch.setenv("PROMPT_CONTEXT_TOKEN_BUDGET", "20")
+    builder = PromptBuilder()
+    # Approximate counts (4 bytes per token) keep the test off the network
+    builder._encoding, builder._encoding_loaded = None, True
+    return builder
+
+
+def event(content, similarity):
+    return {"content": content, "similarity": similarity}
+
+
+def test_context_keeps_the_best_events_within_the_budget(builder):
+    dropped = metrics.get_counter("prompt.context_events_dropped")
+    events = [event("a weak match", 0.4), event("the previous turn", 1.0), event("a strong match", 0.8)]
+
+    context = builder.build_context(GameSession("g1"), events)
+    assert context.splitlines() == ["- the previous turn (similarity: 1.00)", "- a strong match (similarity: 0.80)"]
+    assert metrics.get_counter("prompt.context_events_dropped") == dropped + 1
+
+
+def test_an_oversized_first_event_is_truncated_rather_than_dropped(builder):
+    context = builder.build_context(GameSession("g1"), [event("x" * 400, 1.0)], token_budget=5)
+    assert context.endswith("…") and len(context.encode("utf-8")) <= 5 * 4 + len("…".encode("utf-8"))
+
+
+def test_static_prefix_is_shared_and_the_turn_goes_in_the_user_message(builder):
+    game_state = GameSession("g1", PlayerSession("Hero"), language=Language.ZH_TW)
+    first = builder.build_messages(game_state, "explore", [], story_summary="Met a goblin.")
+    second = builder.build_messages(game_state, "rest", [], outcome="HP +10")
+
+    assert first[0]["content"] is builder.get_static_prefix(Language.ZH_TW)
+    assert second[0]["content"] is builder.get_static_prefix(Language.ZH_TW, narration=True)
+    assert "Story So Far:\nMet a goblin." in first[1]["content"]
+    assert "Player Action: explore" in first[1]["content"] and "- Turn: 1" in first[1]["content"]
+    assert "Resolved Outcome:\nHP +10" in second[1]["content"]
@@ -0,0 +1,75 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from src.game_controller import GameController
+from src.scripts.replay_sessions import SessionReplayer
+
+
+class FakeEmbeddings:
+    async def create(self, model=None, input=None, **kwargs):
+        texts = [input] if isinstance(input, str) else input
+        # Every text embeds the same, so the catalog entry is always retrieved
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[1.0, 0.5, 0.25, 0.125], index=index)
+                                     for index in range(len(texts))], usage=None)
+
+
+class FakeCompletions:
+    async def create(self, model=None, messages=None, **kwargs):
+        turn = 1
+        for line in messages[-1]["content"].splitlines():
+            if line.startswith("- Turn:"):
+                turn = int(line.split(":")[1])
+        content = json.dumps({
+            "turn": turn, "narrative": f"A goblin lunges at you on turn {turn}.",
+            "effects": {"player_hp_change": -5, "player_exp_gain": 20, "item_gain": None},
+            "suggested_actions": ["attack", "flee"]
+        })
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None, model=model)
+
+
+class FakeClient:
+    def __init__(self):
+        self.embeddings = FakeEmbeddings()
+        self.chat = SimpleNamespace(completions=FakeCompletions())
+
+
+def record(tmp_path, monkeypatch):
+    recording = tmp_path / "recording.jsonl"
+    monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", str(tmp_path / "live"))
+    monkeypatch.setenv("SESSION_RECORDING_PATH", str(recording))
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setenv("RULES_ENGINE_ENABLED", "false")
+    monkeypatch.setenv("INTENT_ROUTER_ENABLED", "false")
+
+    async def play():
+        controller = GameController()
+        service = controller.game_service
+        service.llm_service.client = controller.recorder.wrap_client(FakeClient())
+        service.vector_service.embedding_model.client = controller.recorder.wrap_client(FakeClient())
+        # Only the live store has the catalog; a scratch store cannot retrieve it
+        await service.vector_service.store_knowledge("monster", "goblin", "Goblin",
+                                                     "Name: Goblin\nDescription: Attacks travellers in the cave.")
+        game_id = controller.create_new_game("Hero")
+        for action in ["explore the cave", "attack the goblin"]:
+            assert await controller.process_action(game_id, action) is not None
+        controller.recorder.close()
+
+    asyncio.run(play())
+    return recording
+
+
+def test_replay_of_two_turns_has_no_mismatches(tmp_path, monkeypatch):
+    recording = record(tmp_path, monkeypatch)
+    turns = [json.loads(line) for line in recording.read_text().splitlines() if '"k":"t"' in line]
+    assert len(turns) == 2
+    assert any(event[0] == "monster_goblin" for turn in turns for event in turn["r"])
+
+    replayer = SessionReplayer(str(recording), str(tmp_path / "scratch"))
+    report = asyncio.run(replayer.run(concurrency=1))
+
+    assert report["turns"] == 2
+    assert report["mismatches"] == []
+    assert report["retrieval"] == "recorded" and report["retrieval_unavailable"] == 0
+    assert report["completion_misses"] == 0
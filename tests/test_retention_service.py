@@ -0,0 +1,58 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.game_session import GameSession
+from src.models.game_state import GameStatus
+from src.services.retention_service import RetentionService
+from src.services.vector_service import VectorService
+
+
+@pytest.fixture
+def vector_service(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", str(tmp_path))
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    return VectorService()
+
+
+def add_event(vector_service, game_id, turn, created_at):
+    collection = vector_service.database_model.get_collection()
+    collection.add(
+        ids=[f"game_event_{game_id}_turn_{turn}"],
+        documents=[f"[Turn {turn}] Something happened"],
+        metadatas=[{"content_type": "game_event", "game_id": game_id, "turn": turn,
+                    "created_at": created_at.isoformat()}],
+        embeddings=[[0.1, 0.2, 0.3]]
+    )
+
+
+def test_defaults_delete_and_compact(monkeypatch):
+    monkeypatch.delenv("RAG_RETENTION_MODE", raising=False)
+    monkeypatch.delenv("RAG_RETENTION_VACUUM", raising=False)
+    retention = RetentionService(None)
+    assert retention.mode == "delete"
+    assert retention.vacuum
+
+
+def test_select_expired_includes_games_only_in_the_store(vector_service, monkeypatch):
+    monkeypatch.setenv("RAG_RETENTION_HOURS", "24")
+    old = datetime.utcnow() - timedelta(hours=48)
+    add_event(vector_service, "orphaned", 1, old)
+    add_event(vector_service, "recent", 1, datetime.utcnow())
+    # Live in memory and still active: kept however old its events are
+    add_event(vector_service, "live", 1, old)
+    # Finished in memory past the window
+    add_event(vector_service, "finished", 1, old)
+
+    games = {
+        "live": GameSession("live"),
+        "finished": GameSession("finished", status=GameStatus.COMPLETED, finished_at=old),
+    }
+    retention = RetentionService(vector_service)
+    expired = asyncio.run(retention.select_expired(games))
+    assert sorted(expired) == ["finished", "orphaned"]
+
+    report = asyncio.run(retention.purge_games(expired))
+    assert report["events_deleted"] == 2
+    assert vector_service.get_game_last_activity().keys() == {"recent", "live"}
@@ -0,0 +1,35 @@
+import pytest
+
+from src.models.game_session import GameSession
+from src.services.rules_engine import INTENT_KEYWORDS, RulesEngine
+
+
+@pytest.fixture
+def engine():
+    return RulesEngine()
+
+
+@pytest.mark.parametrize("action, intent", [
+    ("explore the forest", "explore"),
+    ("walk through the forest", "other"),
+    ("restore the altar", "other"),
+    ("take a rest", "rest"),
+    ("attack the goblin", "attack"),
+    ("run away from the battle", "flee"),
+    ("打開寶箱", "other"),
+    ("攻打哥布林", "attack"),
+    ("睡覺", "rest"),
+    ("逃跑", "flee"),
+])
+def test_classify_intent(engine, action, intent):
+    assert engine.classify_intent(action) == intent
+
+
+def test_no_single_character_cjk_keywords():
+    for keywords in INTENT_KEYWORDS.values():
+        assert all(keyword.isascii() or len(keyword) > 1 for keyword in keywords)
+
+
+def test_resolve_turn_is_deterministic(engine):
+    game = GameSession("game-1")
+    assert engine.resolve_turn(game, "explore the hall") == engine.resolve_turn(game, "explore the hall")
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from src.models.chroma.database_model import DatabaseModel
+from src.models.chroma.embedding_model import EmbeddingModel
+from src.models.chroma.lexical_index import LexicalIndex
+from src.models.chroma.search_model import SearchModel
+from src.models.chroma.stats_model import StatsModel
+
+
+@pytest.fixture
+def search_model(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", str(tmp_path))
+    index = LexicalIndex()
+    index.add("monster-1", "The Fire Dragon breathes flame over the cavern.", {"content_type": "monster"})
+    index.add("monster-2", "A goblin scout guards the gate.", {"content_type": "monster"})
+    index.add("event-1", "You attack the goblin and it flees.", {"content_type": "game_event"})
+    index.add("event-2", "You search the chamber and find a torch.", {"content_type": "game_event"})
+    index.add("event-3", "你向哥布林發動攻擊。", {"content_type": "game_event"})
+    database_model = DatabaseModel()
+    return SearchModel(database_model, EmbeddingModel(), StatsModel(database_model), index)
+
+
+@pytest.mark.parametrize("action", ["attack", "search", "flee", "攻擊"])
+def test_single_verb_does_not_skip_embedding(search_model, action):
+    assert not search_model._is_confident(search_model.lexical_search(action))
+
+
+def test_multi_term_name_skips_embedding(search_model):
+    hits = search_model.lexical_search("fire dragon")
+    assert hits[0]["id"] == "monster-1"
+    assert hits[0]["matched_terms"] == 2
+    assert search_model._is_confident(hits)
+
+
+def test_diversify_pushes_down_copies_of_the_prior_content(search_model):
+    previous = "You swing your sword at the goblin"
+    hits = [
+        {"id": "a", "content": "[Turn 2] You swing your sword at the goblin"},
+        {"id": "b", "content": "A hidden door opens into a treasure room"},
+        {"id": "c", "content": "The torch gutters as cold wind sweeps the hall"},
+        {"id": "d", "content": "Nothing"},
+    ]
+    assert [hit["id"] for hit in search_model._diversify(hits, 2)] == ["a", "b"]
+    assert [hit["id"] for hit in search_model._diversify(hits, 2, previous)] == ["b", "a"]
+
+
+def test_batch_topup_never_forces_a_stats_scan(search_model, monkeypatch):
+    collection = search_model.db.get_collection()
+    near, far = [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]
+    collection.add(
+        ids=[f"a{i}" for i in range(8)] + ["b0", "b1"],
+        documents=["goblin fight"] * 8 + ["quiet library", "dusty shelves"],
+        metadatas=[{"content_type": "game_event", "game_id": "A"}] * 8
+        + [{"content_type": "game_event", "game_id": "B"}] * 2,
+        embeddings=[near] * 8 + [far, far]
+    )
+
+    async def get_embeddings(texts):
+        return [near for _ in texts]
+
+    def reconcile():
+        raise AssertionError("the batch search must not reconcile the stats counters")
+
+    monkeypatch.setattr(search_model.embedding_model, "get_embeddings", get_embeddings)
+    monkeypatch.setattr(search_model.stats, "reconcile", reconcile)
+    assert not search_model.stats.is_reconciled()
+
+    results = asyncio.run(search_model.semantic_search_batch(["goblin", "goblin"], ["A", "B"], "game_event", 2, -5.0))
+    assert sorted(hit["id"] for hit in results[1]) == ["b0", "b1"]
@@ -0,0 +1,69 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.session_recorder import (
+    ReplayClient, SessionRecorder, SessionRecording, decode_vector, encode_vector, replay_turn
+)
+
+
+class EchoEmbeddings:
+    async def create(self, model=None, input=None, **kwargs):
+        texts = [input] if isinstance(input, str) else input
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[float(len(text)), 0.5], index=index)
+                                     for index, text in enumerate(texts)])
+
+
+class EchoCompletions:
+    async def create(self, **kwargs):
+        message = SimpleNamespace(content=f"reply to {kwargs['messages'][-1]['content']}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def test_vectors_round_trip_through_float32():
+    assert decode_vector(encode_vector([0.5, -1.25, 3.0])) == [0.5, -1.25, 3.0]
+
+
+def test_disabled_recorder_leaves_the_client_alone(monkeypatch):
+    monkeypatch.delenv("SESSION_RECORDING_PATH", raising=False)
+    client = object()
+    recorder = SessionRecorder()
+    assert not recorder.is_enabled() and recorder.wrap_client(client) is client
+
+
+def test_recorded_turns_replay_offline(tmp_path):
+    path = tmp_path / "session.jsonl"
+    recorder = SessionRecorder(str(path))
+    client = recorder.wrap_client(SimpleNamespace(embeddings=EchoEmbeddings(),
+                                                  chat=SimpleNamespace(completions=EchoCompletions())))
+
+    async def play():
+        with recorder.record_turn("g1", "explore") as frame:
+            await client.embeddings.create(input=["explore", "explore"])
+            await client.chat.completions.create(messages=[{"role": "user", "content": "explore"}])
+            frame["r"] = [["event-1", 0.9, "An old event"]]
+
+    asyncio.run(play())
+    recorder.close()
+
+    recording = SessionRecording(str(path))
+    assert list(recording.embeddings.values()) == [[7.0, 0.5]]
+    turn = recording.turns["g1"][0]
+    assert turn["a"] == "explore" and turn["raw"] == ["reply to explore"]
+
+    replay = ReplayClient(recording)
+
+    async def replay_once():
+        with replay_turn(turn) as frame:
+            embedded = await replay.embeddings.create(input="explore")
+            completion = await replay.chat.completions.create(messages=[])
+            with pytest.raises(LookupError):
+                await replay.chat.completions.create(messages=[])
+            return embedded, completion, frame["retrieval"]
+
+    embedded, completion, retrieval = asyncio.run(replay_once())
+    assert embedded.data[0].embedding == [7.0, 0.5]
+    assert completion.choices[0].message.content == "reply to explore"
+    assert retrieval == [{"id": "event-1", "similarity": 0.9, "content": "An old event"}]
+    assert replay.chat.completions.misses == 1
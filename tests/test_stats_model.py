@@ -0,0 +1,65 @@
+from src.models.chroma.database_model import DatabaseModel
+from src.models.chroma.stats_model import StatsModel
+
+
+def make_stats(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", str(tmp_path))
+    monkeypatch.delenv("KNOWLEDGE_STATS_PATH", raising=False)
+    return StatsModel(DatabaseModel())
+
+
+def test_connection_is_opened_on_first_use(tmp_path, monkeypatch):
+    stats = make_stats(tmp_path, monkeypatch)
+    assert not (tmp_path / "knowledge_stats.sqlite3").exists()
+
+    stats.record_added("game_event", "g1")
+    assert (tmp_path / "knowledge_stats.sqlite3").exists()
+    assert stats._read_counter(StatsModel.GAME_SCOPE, "g1") == 1
+
+
+def test_counters_follow_adds_and_deletes(tmp_path, monkeypatch):
+    stats = make_stats(tmp_path, monkeypatch)
+    stats.reset()
+    stats.record_added("game_event", "g1", count=3)
+    stats.record_added("monster")
+    stats.record_deleted("game_event", "g1", count=2)
+
+    assert stats.get_count() == 2
+    assert stats.get_count("monster") == 1
+    assert stats.get_game_count("g1") == 1
+    assert stats.get_stats()["content_types"] == {"game_event": 1, "monster": 1}
+
+    # Counters never go negative, and emptied ones are dropped
+    stats.record_deleted("game_event", "g1", count=5)
+    assert stats.get_game_count("g1") == 0
+    assert stats.get_stats()["games"] == 0
+
+
+def test_first_count_reconciles_from_the_collection(tmp_path, monkeypatch):
+    stats = make_stats(tmp_path, monkeypatch)
+    stats.db.get_collection().add(
+        ids=["a", "b", "c"], documents=["a", "b", "c"], embeddings=[[1.0, 0.0]] * 3,
+        metadatas=[{"content_type": "game_event", "game_id": "g1"}] * 2 + [{"content_type": "item"}]
+    )
+
+    assert not stats.is_reconciled()
+    assert stats.get_game_count("g1") == 2
+    assert stats.is_reconciled() and stats.get_count() == 3
+
+
+def test_failed_reconcile_is_not_retried_on_every_count(tmp_path, monkeypatch):
+    stats = make_stats(tmp_path, monkeypatch)
+    calls = []
+
+    def get_collection():
+        calls.append(1)
+        raise RuntimeError("store unavailable")
+
+    monkeypatch.setattr(stats.db, "get_collection", get_collection)
+    assert stats.get_count() == 0
+    assert stats.get_count() == 0
+    assert len(calls) == 1
+
+    stats._reconcile_failed_at -= stats.reconcile_retry_seconds
+    stats.get_count()
+    assert len(calls) == 2
@@ -0,0 +1,64 @@
+import asyncio
+
+from src.models.game_session import GameSession
+from src.services.llm_service import LLMService
+from src.services.story_memory import StoryMemory
+
+
+def make_memory(monkeypatch, mode):
+    monkeypatch.setenv("STORY_SUMMARY_MODE", mode)
+    monkeypatch.setenv("STORY_RECENT_TURNS", "2")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    return StoryMemory(LLMService())
+
+
+def play(memory, game_state, turns):
+    for turn in range(1, turns + 1):
+        memory.record_turn(game_state, f"explore {turn}", f"Room {turn} is empty. Dust everywhere.")
+
+
+def test_llm_mode_recovery_defers_evicted_turns_to_the_llm(monkeypatch):
+    memory = make_memory(monkeypatch, "llm")
+    game_state = GameSession("g1")
+    # Journal recovery replays turns in an executor thread, without a running loop
+    play(memory, game_state, 4)
+    assert memory.get_summary("g1") == ""
+    assert memory.export("g1")["pending"][0] == "Player: explore 1"
+
+    async def summarize(summary, evicted):
+        return f"llm summary of {len(evicted) // 2} turns"
+
+    async def resume():
+        monkeypatch.setattr(memory, "_summarize_with_llm", summarize)
+        memory.resume()
+        await asyncio.gather(*memory._tasks.values())
+
+    asyncio.run(resume())
+    assert memory.get_summary("g1") == "llm summary of 2 turns"
+
+
+def test_extractive_mode_summarizes_inline_without_a_loop(monkeypatch):
+    memory = make_memory(monkeypatch, "extractive")
+    game_state = GameSession("g1")
+    play(memory, game_state, 4)
+    assert memory.get_summary("g1") == "explore 1 → Room 1 is empty. explore 2 → Room 2 is empty."
+    assert [action for action, _ in game_state.recent_turns] == ["explore 3", "explore 4"]
+
+
+def test_summary_is_bounded_and_keeps_the_opening(monkeypatch):
+    monkeypatch.setenv("STORY_SUMMARY_MAX_CHARS", "120")
+    memory = make_memory(monkeypatch, "extractive")
+    game_state = GameSession("g1")
+    play(memory, game_state, 30)
+
+    summary = memory.get_summary("g1")
+    assert len(summary) <= 120
+    assert summary.startswith("explore 1 →") and "..." in summary
+    assert summary.endswith("explore 28 → Room 28 is empty.")
+
+
+def test_forget_drops_the_summary(monkeypatch):
+    memory = make_memory(monkeypatch, "extractive")
+    play(memory, GameSession("g1"), 4)
+    memory.forget("g1")
+    assert memory.get_summary("g1") == "" and memory.export("g1") == {"summary": "", "pending": []}
@@ -0,0 +1,51 @@
+import asyncio
+import json
+
+import pytest
+
+from src.utils.tracing import Tracer
+
+
+def make_tracer(monkeypatch, exporter, path=None):
+    monkeypatch.setenv("TRACING_EXPORTER", exporter)
+    if path:
+        monkeypatch.setenv("TRACING_FILE_PATH", str(path))
+    return Tracer()
+
+
+def test_disabled_tracer_hands_out_noop_spans(monkeypatch):
+    tracer = make_tracer(monkeypatch, "none")
+    with tracer.span("turn", game_id="g1") as span:
+        span.set_attribute("ignored", True)
+        assert tracer.current_span() is span
+    assert not tracer.enabled
+
+
+def test_nested_spans_share_a_trace_and_are_exported_as_otlp(monkeypatch, tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = make_tracer(monkeypatch, "file", path)
+
+    async def turn():
+        with tracer.span("GameController.process_action", game_id="g1"):
+            with tracer.span("SearchModel.hybrid_search") as child:
+                child.set_attributes(limit=2, lexical_only=False, score=0.5)
+            with pytest.raises(RuntimeError):
+                with tracer.span("LLMService.generate"):
+                    raise RuntimeError("timeout")
+
+    asyncio.run(turn())
+    tracer.shutdown()
+
+    spans = [span for line in path.read_text().splitlines()
+             for span in json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]]
+    by_name = {span["name"]: span for span in spans}
+    root = by_name["GameController.process_action"]
+    search, llm = by_name["SearchModel.hybrid_search"], by_name["LLMService.generate"]
+
+    assert "parentSpanId" not in root
+    assert search["parentSpanId"] == root["spanId"] == llm["parentSpanId"]
+    assert {span["traceId"] for span in spans} == {root["traceId"]}
+    assert {"key": "limit", "value": {"intValue": "2"}} in search["attributes"]
+    assert {"key": "lexical_only", "value": {"boolValue": False}} in search["attributes"]
+    assert llm["status"] == {"code": 2, "message": "RuntimeError: timeout"}
+    assert root["status"] == {"code": 1}
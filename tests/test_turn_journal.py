@@ -0,0 +1,42 @@
+import json
+from datetime import datetime, timedelta
+
+from src.models.game_session import GameSession
+from src.models.game_state import GameStatus
+from src.services.turn_journal import TurnJournal
+
+
+def snapshot(game_id, status, finished_at=None):
+    game = GameSession(game_id, status=status, turn_count=10, finished_at=finished_at)
+    return {"k": "s", "g": game_id, "st": game.to_model().model_dump(mode="json")}
+
+
+def test_recovery_drops_games_finished_before_the_window(tmp_path, monkeypatch):
+    monkeypatch.setenv("TURN_JOURNAL_FINISHED_HOURS", "24")
+    path = tmp_path / "turns.jsonl"
+    records = [
+        snapshot("old", GameStatus.COMPLETED, datetime.utcnow() - timedelta(hours=48)),
+        snapshot("recent", GameStatus.COMPLETED, datetime.utcnow() - timedelta(hours=1)),
+        snapshot("active", GameStatus.ACTIVE),
+    ]
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+    journal = TurnJournal(str(path))
+    try:
+        games = journal.recover()
+    finally:
+        journal.close()
+
+    assert set(games) == {"recent", "active"}
+    assert '"old"' not in path.read_text()
+
+
+def test_free_actions_do_not_snapshot(monkeypatch):
+    monkeypatch.setenv("TURN_JOURNAL_SNAPSHOT_EVERY", "5")
+    journal = TurnJournal()
+    game = GameSession("game-1")
+    assert not journal.should_snapshot(game, 0)
+
+    game.turn_count = 5
+    assert not journal.should_snapshot(game, 0)
+    assert journal.should_snapshot(game, 5)
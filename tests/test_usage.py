@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.usage import UsageTracker, usage_scope
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    monkeypatch.setenv("MODEL_PRICES", "test-model=1/2")
+    monkeypatch.setenv("GAME_TOKEN_BUDGET", "1500")
+    monkeypatch.delenv("GAME_COST_BUDGET_USD", raising=False)
+    return UsageTracker()
+
+
+def test_usage_is_attributed_to_every_scoped_dimension(tracker):
+    with usage_scope(game_id="g1", language="en"), usage_scope(phase="llm_generation"):
+        tracker.record_completion("test-model", SimpleNamespace(prompt_tokens=1000, completion_tokens=200))
+    with usage_scope(game_id="g1", phase="rag_search"):
+        tracker.record_embedding("text-embedding-3-small", SimpleNamespace(total_tokens=50))
+    tracker.record_completion("test-model", None)
+
+    game = tracker.get_game_usage("g1")
+    assert (game["prompt_tokens"], game["completion_tokens"], game["embedding_tokens"]) == (1000, 200, 50)
+    assert game["requests"] == 2 and game["total_tokens"] == 1250
+    # 1000 * $1 + 200 * $2 per 1M tokens, plus 50 embedding tokens at $0.02 per 1M
+    assert game["cost_usd"] == pytest.approx(0.0014 + 0.000001)
+
+    snapshot = tracker.snapshot()
+    assert snapshot["language"]["en"]["prompt_tokens"] == 1000
+    assert snapshot["phase"]["rag_search"]["embedding_tokens"] == 50
+    assert snapshot["model"]["test-model"]["requests"] == 1
+    assert snapshot["totals"]["requests"] == 2
+
+
+def test_game_degrades_once_over_its_token_budget(tracker):
+    with usage_scope(game_id="g1"):
+        tracker.record_completion("test-model", SimpleNamespace(prompt_tokens=1400, completion_tokens=50))
+        assert not tracker.is_over_budget("g1")
+        tracker.record_completion("test-model", SimpleNamespace(prompt_tokens=40, completion_tokens=10))
+    assert tracker.is_over_budget("g1")
+    assert not tracker.is_over_budget("g2")
+
+    tracker.forget("g1")
+    assert tracker.get_game_usage("g1")["total_tokens"] == 0
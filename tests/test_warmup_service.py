@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from src.services.game_service import GameService
+from src.services.warmup_service import WarmupService
+
+
+@pytest.fixture(scope="module")
+def game_service():
+    return GameService()
+
+
+def test_disabled_warmup_counts_as_finished(game_service, monkeypatch):
+    monkeypatch.setenv("WARMUP_ENABLED", "false")
+    warmup = WarmupService(game_service)
+    asyncio.run(warmup.run())
+    assert warmup.is_finished() and warmup.report() == {"status": "disabled", "steps": {}}
+
+
+def test_failed_or_slow_steps_do_not_block_readiness(game_service, monkeypatch):
+    monkeypatch.setenv("WARMUP_STEP_TIMEOUT_SECONDS", "0.05")
+    warmup = WarmupService(game_service)
+
+    async def broken():
+        raise RuntimeError("index unavailable")
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    async def ok():
+        return {"primed": True}
+
+    monkeypatch.setattr(warmup, "_load_index", broken)
+    monkeypatch.setattr(warmup, "_embed_actions", slow)
+    monkeypatch.setattr(warmup, "_prime_llm_pool", ok)
+    monkeypatch.setattr(warmup, "_opening_path", ok)
+    assert not warmup.is_finished()
+
+    asyncio.run(warmup.run())
+    steps = warmup.report()["steps"]
+    assert warmup.is_finished() and warmup.status == "ready"
+    assert steps["load_index"]["status"] == "failed" and steps["load_index"]["detail"] == "index unavailable"
+    assert steps["embed_actions"] == {"status": "failed", "detail": "TimeoutError", "ms": steps["embed_actions"]["ms"]}
+    assert steps["opening_path"]["detail"] == {"primed": True}
+
+
+def test_warmup_texts_cover_the_opening_queries_once(game_service):
+    texts = WarmupService(game_service)._warmup_texts()
+    assert game_service.build_opening_query("start") in texts and "start" in texts
+    assert len(texts) == len(set(texts))